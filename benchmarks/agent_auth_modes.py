@@ -0,0 +1,102 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Agent authentication mode benchmark.
+
+Compares the latency of getting an agent token through the native authentication
+flow (authorize, authn and token requests) and the client_credentials grant (a single
+token request) against a mock endpoint with simulated latency.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+import httpx
+
+from asgardeo import AsgardeoConfig, SessionProvider
+from asgardeo_ai import AgentAuthManager, AgentAuthMode, AgentConfig
+
+
+def build_transport(requests: Counter, latency: float) -> httpx.MockTransport:
+    """Build a mock transport that emulates the Asgardeo endpoints."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests[request.url.path] += 1
+        await asyncio.sleep(latency)
+        if request.url.path.endswith("/oauth2/authorize"):
+            return httpx.Response(200, json={
+                "flowId": "flow-1",
+                "flowStatus": "INCOMPLETE",
+                "nextStep": {"authenticators": [{
+                    "authenticator": "Username & Password",
+                    "authenticatorId": "BasicAuthenticator",
+                }]},
+            })
+        if request.url.path.endswith("/oauth2/authn"):
+            return httpx.Response(200, json={
+                "flowId": "flow-1",
+                "flowStatus": "SUCCESS_COMPLETED",
+                "authData": {"code": "code-1"},
+            })
+        return httpx.Response(200, json={"access_token": "access-token", "expires_in": 3600})
+
+    return httpx.MockTransport(handler)
+
+
+async def bench(config: AsgardeoConfig, agent_config: AgentConfig, iterations: int, latency: float) -> None:
+    """Measure agent token latency for one authentication mode."""
+    requests: Counter = Counter()
+    provider = SessionProvider(transport=build_transport(requests, latency))
+    latencies = []
+    async with AgentAuthManager(config, agent_config, session_provider=provider) as manager:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await manager.get_agent_token(["openid"], force_refresh=True)
+            latencies.append(time.perf_counter() - start)
+
+    print(
+        f"{agent_config.auth_mode:18} p50 {statistics.median(latencies) * 1000:7.1f} ms   "
+        f"{sum(requests.values()) / iterations:.0f} request(s) per token"
+    )
+
+
+async def main():
+    """Run the agent authentication mode benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.03, help="Simulated endpoint latency in seconds")
+    args = parser.parse_args()
+
+    config = AsgardeoConfig(
+        base_url="https://localhost/t/bench",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+    )
+    await bench(config, AgentConfig("agent", "secret"), args.iterations, args.latency)
+    await bench(
+        config,
+        AgentConfig("agent", "secret", auth_mode=AgentAuthMode.CLIENT_CREDENTIALS),
+        args.iterations,
+        args.latency,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+HTTP/2 benchmark.
+
+Compares throughput and latency of concurrent token requests over HTTP/1.1 and
+HTTP/2 against a local token endpoint served by hypercorn (cleartext HTTP/2 with
+prior knowledge).
+
+Requires: pip install asgardeo[http2] hypercorn
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from asgardeo import AsgardeoConfig, AsgardeoTokenClient, SessionProvider
+
+
+async def token_app(scope, receive, send):
+    """Minimal ASGI stand-in for the Asgardeo token endpoint."""
+    if scope["type"] != "http":
+        return
+    while (await receive()).get("more_body"):
+        pass
+    await asyncio.sleep(0.005)
+    body = json.dumps({"access_token": "access-token", "expires_in": 3600}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def run(config: AsgardeoConfig, provider: SessionProvider, requests: int, concurrency: int) -> dict:
+    """Send token requests with bounded concurrency and collect latencies."""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        async def one(i: int) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                # Distinct refresh tokens so that single-flight does not collapse requests.
+                await client.get_token("refresh_token", refresh_token=f"refresh-token-{i}")
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main():
+    """Run the HTTP/1.1 vs HTTP/2 benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--max-connections", type=int, default=10)
+    parser.add_argument("--max-streams", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    hypercorn_config = Config()
+    hypercorn_config.bind = [f"127.0.0.1:{args.port}"]
+    hypercorn_config.loglevel = "WARNING"
+    hypercorn_config.keep_alive_max_requests = 2 ** 31
+    shutdown = asyncio.Event()
+    server = asyncio.create_task(serve(token_app, hypercorn_config, shutdown_trigger=shutdown.wait))
+    await asyncio.sleep(0.5)
+
+    base = dict(
+        base_url=f"http://127.0.0.1:{args.port}",
+        client_id="client-id",
+        redirect_uri="http://127.0.0.1/callback",
+        client_secret="client-secret",
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_connections,
+        timeout=60.0,
+    )
+    try:
+        http1 = await run(AsgardeoConfig(**base), SessionProvider(), args.requests, args.concurrency)
+
+        limits = httpx.Limits(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections,
+        )
+        # Cleartext HTTP/2 needs prior knowledge, which httpx only enables on the transport.
+        h2c = httpx.AsyncHTTPTransport(http1=False, http2=True, limits=limits)
+        http2 = await run(
+            AsgardeoConfig(**base, http2=True, http2_max_concurrent_streams=args.max_streams),
+            SessionProvider(transport=h2c),
+            args.requests,
+            args.concurrency,
+        )
+    finally:
+        shutdown.set()
+        await server
+
+    print(f"{args.requests} token requests, concurrency {args.concurrency}, {args.max_connections} connection(s)")
+    for name, result in (("HTTP/1.1", http1), ("HTTP/2", http2)):
+        print(
+            f"{name:9} {result['throughput']:8.0f} req/s   "
+            f"p50 {result['p50_ms']:7.1f} ms   p99 {result['p99_ms']:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
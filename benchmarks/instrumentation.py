@@ -0,0 +1,153 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Instrumentation overhead benchmark.
+
+Runs native agent logins (authorize, authn and token requests) against a mock endpoint
+without latency, so the SDK's own CPU time dominates, and compares the time per login
+without instrumentation, with the OpenTelemetry adapter over the no-op API providers
+(telemetry disabled) and, if the SDK is installed, with recording SDK providers.
+The cost of the hooks run for one request is measured in isolation as well, since it
+is far below the run-to-run noise of a whole login.
+
+Requires ``opentelemetry-api``; ``opentelemetry-sdk`` is optional.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import statistics
+import time
+import timeit
+
+import httpx
+
+from asgardeo import (
+    AsgardeoConfig,
+    Instrumentation,
+    Metric,
+    OpenTelemetryInstrumentation,
+    SessionProvider,
+)
+from asgardeo_ai import AgentAuthManager, AgentConfig
+
+
+def build_transport() -> httpx.MockTransport:
+    """Build a mock transport that emulates the native authentication endpoints."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/oauth2/authorize"):
+            return httpx.Response(200, json={
+                "flowId": "flow-1",
+                "flowStatus": "INCOMPLETE",
+                "nextStep": {"authenticators": [{
+                    "authenticator": "Username & Password",
+                    "authenticatorId": "BasicAuthenticator",
+                }]},
+            })
+        if request.url.path.endswith("/oauth2/authn"):
+            return httpx.Response(200, json={
+                "flowId": "flow-1",
+                "flowStatus": "SUCCESS_COMPLETED",
+                "authData": {"code": "code-1"},
+            })
+        return httpx.Response(200, json={"access_token": "access-token", "expires_in": 3600})
+
+    return httpx.MockTransport(handler)
+
+
+def sdk_instrumentation() -> OpenTelemetryInstrumentation | None:
+    """Build an instrumentation over recording SDK providers, if the SDK is installed."""
+    try:
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    except ImportError:
+        return None
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(InMemorySpanExporter()))
+    meter_provider = MeterProvider(metric_readers=[InMemoryMetricReader()])
+    return OpenTelemetryInstrumentation(tracer_provider=tracer_provider, meter_provider=meter_provider)
+
+
+async def bench(config: AsgardeoConfig, iterations: int) -> float:
+    """Return the mean time per login in seconds."""
+    provider = SessionProvider(transport=build_transport())
+    async with AgentAuthManager(config, AgentConfig("agent", "secret"), session_provider=provider) as manager:
+        await manager.get_agent_token(["openid"], force_refresh=True)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await manager.get_agent_token(["openid"], force_refresh=True)
+        return (time.perf_counter() - start) / iterations
+
+
+def hook_cost(instrumentation: Instrumentation, number: int = 20000) -> float:
+    """Return the time in seconds of the hooks run for one request: a span, a latency and a counter."""
+
+    def step():
+        with instrumentation.span("asgardeo.token", {"asgardeo.endpoint": "token"}):
+            instrumentation.record_request("token", 200, 0.01)
+            instrumentation.count(Metric.CACHE_MISSES, attributes={"cache": "agent_token"})
+
+    return min(timeit.repeat(step, number=number, repeat=5)) / number
+
+
+async def main():
+    """Run the instrumentation overhead benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500, help="Logins per round")
+    parser.add_argument("--rounds", type=int, default=7)
+    args = parser.parse_args()
+
+    config = AsgardeoConfig(
+        base_url="https://localhost/t/bench",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+    )
+    variants = {
+        "none": None,
+        "otel (disabled)": OpenTelemetryInstrumentation(),
+        "otel (sdk)": sdk_instrumentation(),
+    }
+
+    for name, instrumentation in list(variants.items()):
+        if name != "none" and instrumentation is None:
+            print(f"{name:16} skipped, opentelemetry-sdk is not installed")
+            del variants[name]
+
+    # Variants are interleaved in every round so that drift affects all of them alike.
+    timings = {name: [] for name in variants}
+    for _ in range(args.rounds):
+        for name, instrumentation in variants.items():
+            variant = dataclasses.replace(config, instrumentation=instrumentation)
+            timings[name].append(await bench(variant, args.iterations))
+
+    baseline = statistics.median(timings["none"])
+    for name, samples in timings.items():
+        per_login = statistics.median(samples)
+        hooks = hook_cost(variants[name] or Instrumentation())
+        print(
+            f"{name:16} {per_login * 1e6:8.1f} us per login   "
+            f"overhead {(per_login / baseline - 1) * 100:+6.1f}%   "
+            f"hooks {hooks * 1e6:5.1f} us per request"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,350 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Load generator for the authentication and token flows.
+
+Drives user logins (AsgardeoNativeAuthClient.authenticate_with_password), agent
+tokens (AgentAuthManager.get_agent_token), on-behalf-of tokens (get_obo_token) and
+token refreshes at a fixed concurrency against asgardeo.testing.MockAsgardeoServer,
+served over loopback HTTP by default. For every scenario it reports the throughput,
+the p50/p95/p99 latency, the HTTP connections opened, and the memory allocated and
+retained per operation measured with tracemalloc on a separate sample run.
+
+Results can be written as JSON (--json) and compared with an earlier run
+(--baseline), e.g. to compare two commits:
+
+    python benchmarks/loadgen.py --json before.json
+    git checkout <other commit>
+    python benchmarks/loadgen.py --baseline before.json
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import asgardeo
+from asgardeo import (
+    AsgardeoConfig,
+    AsgardeoNativeAuthClient,
+    AsgardeoTokenClient,
+    OAuthToken,
+    SessionProvider,
+    generate_pkce_pair,
+)
+from asgardeo.testing import EndpointProfile, Latency, MockAsgardeoServer
+from asgardeo_ai import AgentAuthManager, AgentAuthMode, AgentConfig
+
+SCENARIOS = ("login", "agent_token", "obo", "refresh")
+AGENT_ID = "agent"
+AGENT_SECRET = "agent-secret"
+
+
+class Target:
+    """The mock server and the clients of one scenario run."""
+
+    def __init__(self, args: argparse.Namespace, seed: int) -> None:
+        if args.latency_p99 > args.latency > 0:
+            latency = Latency.lognormal(args.latency, args.latency_p99)
+        else:
+            latency = args.latency
+        self.mock = MockAsgardeoServer(
+            default_profile=EndpointProfile(latency=latency, error_rate=args.error_rate),
+            seed=seed,
+        )
+        self.args = args
+        self.server = None
+        self.provider: SessionProvider | None = None
+        self.config: AsgardeoConfig | None = None
+
+    async def __aenter__(self):
+        if self.args.transport == "http":
+            self.server = await self.mock.serve().__aenter__()
+            base_url = self.server.base_url
+            self.provider = SessionProvider()
+        else:
+            base_url = "https://localhost/t/mock"
+            self.provider = SessionProvider(transport=self.mock.transport())
+        self.config = AsgardeoConfig(
+            base_url=base_url,
+            client_id="client-id",
+            redirect_uri="https://localhost/callback",
+            client_secret="client-secret",
+            max_connections=self.args.max_connections,
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.provider.aclose()
+        if self.server is not None:
+            await self.server.__aexit__(*exc_info)
+        return False
+
+    @property
+    def connections(self) -> int | None:
+        """Connections opened so far, None with the in-process transport."""
+        return self.server.connections if self.server is not None else None
+
+
+async def build_operation(target: Target, scenario: str, concurrency: int) -> tuple[Callable[[int, int], Awaitable], list]:
+    """Prepare a scenario and return its operation (worker, index) and the objects to close."""
+    config = target.config
+    provider = target.provider
+    mock = target.mock
+
+    if scenario == "login":
+        async def login(worker: int, index: int) -> None:
+            async with AsgardeoNativeAuthClient(config, session_provider=provider) as client:
+                await client.authenticate_with_password(f"user-{index}", "password")
+
+        return login, []
+
+    auth_mode = AgentAuthMode.CLIENT_CREDENTIALS if target.args.agent_mode == "client_credentials" else AgentAuthMode.NATIVE
+    manager = AgentAuthManager(
+        config,
+        AgentConfig(AGENT_ID, AGENT_SECRET, auth_mode=auth_mode),
+        session_provider=provider,
+    )
+
+    if scenario == "agent_token":
+        async def agent_token(worker: int, index: int) -> None:
+            # A scope per worker keeps concurrent calls from sharing one flow.
+            await manager.get_agent_token(["openid", f"worker-{worker}"], force_refresh=True)
+
+        return agent_token, [manager]
+
+    if scenario == "obo":
+        agent_token = await manager.get_agent_token(["openid"])
+
+        async def obo(worker: int, index: int) -> None:
+            code_verifier, code_challenge = generate_pkce_pair()
+            code = mock.issue_code(f"user-{index}", "openid read", config.client_id, code_challenge)
+            await manager.get_obo_token(code, agent_token, code_verifier=code_verifier, subject=f"user-{index}")
+
+        return obo, [manager]
+
+    # refresh: every worker refreshes its own token chain (refresh tokens are rotated).
+    await manager.close()
+    token_client = AsgardeoTokenClient(config, session_provider=provider)
+    refresh_tokens = []
+    for worker in range(concurrency):
+        code = mock.issue_code(f"user-{worker}", "openid", config.client_id)
+        token: OAuthToken = await token_client.get_token("authorization_code", code=code)
+        refresh_tokens.append(token.refresh_token)
+
+    async def refresh(worker: int, index: int) -> None:
+        token = await token_client.refresh_access_token(refresh_tokens[worker])
+        refresh_tokens[worker] = token.refresh_token
+
+    return refresh, [token_client]
+
+
+async def drive(operation: Callable[[int, int], Awaitable], operations: int, concurrency: int) -> tuple[list[float], int, float]:
+    """Run operations with a fixed number of workers, returning latencies, errors and elapsed time."""
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(worker_id: int) -> None:
+        nonlocal errors
+        while (index := next(counter)) < operations:
+            start = time.perf_counter()
+            try:
+                await operation(worker_id, index)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def run_scenario(args: argparse.Namespace, scenario: str) -> dict:
+    """Run one scenario: a warm-up, the timed run and the memory sample."""
+    async with Target(args, seed=args.seed) as target:
+        operation, closables = await build_operation(target, scenario, args.concurrency)
+        await drive(operation, min(args.warmup, args.operations), args.concurrency)
+
+        requests_before = sum(target.mock.requests.values())
+        connections_before = target.connections
+        latencies, errors, elapsed = await drive(operation, args.operations, args.concurrency)
+        requests = sum(target.mock.requests.values()) - requests_before
+        connections = None if connections_before is None else target.connections - connections_before
+
+        sample = min(args.alloc_sample, args.operations)
+        memory = await measure_memory(operation, sample, args.concurrency) if sample else None
+        for closable in closables:
+            await closable.close()
+
+    completed = len(latencies)
+    result = {
+        "scenario": scenario,
+        "operations": args.operations,
+        "completed": completed,
+        "errors": errors,
+        "concurrency": args.concurrency,
+        "duration_s": round(elapsed, 4),
+        "throughput_ops": round(completed / elapsed, 2) if elapsed else None,
+        "requests_per_op": round(requests / args.operations, 2),
+        "connections_opened": connections,
+        "latency_ms": percentiles(latencies),
+        "memory": memory,
+    }
+    return result
+
+
+async def measure_memory(operation: Callable[[int, int], Awaitable], sample: int, concurrency: int) -> dict:
+    """Measure the memory allocated and retained per operation with tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    await drive(operation, sample, concurrency)
+    peak = tracemalloc.get_traced_memory()[1]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    allocated_blocks = sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+    retained = sum(stat.size_diff for stat in diff)
+    return {
+        "sample": sample,
+        "peak_bytes_per_op": round((peak - baseline) / min(sample, concurrency)),
+        "retained_bytes_per_op": round(retained / sample),
+        "retained_blocks_per_op": round(allocated_blocks / sample, 1),
+    }
+
+
+def percentiles(latencies: list[float]) -> dict | None:
+    """Return latency percentiles in milliseconds."""
+    if len(latencies) < 2:
+        return None
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "p50": round(cuts[49] * 1000, 3),
+        "p95": round(cuts[94] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+        "mean": round(statistics.fmean(latencies) * 1000, 3),
+        "max": round(max(latencies) * 1000, 3),
+    }
+
+
+def environment() -> dict:
+    """Describe the SDK version, interpreter and commit the results were measured with."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "asgardeo": asgardeo.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "commit": commit,
+    }
+
+
+def print_results(results: list[dict], baseline: dict | None) -> None:
+    """Print a results table, with the change against a baseline if given."""
+    previous = {result["scenario"]: result for result in (baseline or {}).get("results", [])}
+    print(
+        f"{'scenario':12} {'ops/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'errors':>6} {'req/op':>6} {'conns':>5} {'peak B/op':>10} {'kept B/op':>10}"
+    )
+    for result in results:
+        latency = result["latency_ms"] or {}
+        memory = result["memory"] or {}
+        print(
+            f"{result['scenario']:12} {result['throughput_ops'] or 0:9,.0f} "
+            f"{latency.get('p50', 0):8.2f} {latency.get('p95', 0):8.2f} {latency.get('p99', 0):8.2f} "
+            f"{result['errors']:6} {result['requests_per_op']:6.1f} "
+            f"{'-' if result['connections_opened'] is None else result['connections_opened']:>5} "
+            f"{memory.get('peak_bytes_per_op', 0):10,} {memory.get('retained_bytes_per_op', 0):10,}"
+        )
+        old = previous.get(result["scenario"])
+        if old and old.get("throughput_ops") and old.get("latency_ms") and result["latency_ms"]:
+            print(
+                f"{'  vs base':12} {change(result['throughput_ops'], old['throughput_ops']):>9} "
+                f"{change(latency['p50'], old['latency_ms']['p50']):>8} "
+                f"{change(latency['p95'], old['latency_ms']['p95']):>8} "
+                f"{change(latency['p99'], old['latency_ms']['p99']):>8}"
+            )
+
+
+def change(new: float, old: float) -> str:
+    """Format the relative change of a value."""
+    return f"{(new / old - 1) * 100:+.1f}%" if old else "-"
+
+
+async def main():
+    """Run the load generator."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=(*SCENARIOS, "all"), default="all")
+    parser.add_argument("--operations", type=int, default=2000, help="Operations per scenario")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=100, help="Untimed operations before each scenario")
+    parser.add_argument("--transport", choices=("http", "mock"), default="http",
+                        help="Loopback HTTP server or in-process httpx mock transport")
+    parser.add_argument("--latency", type=float, default=0.005, help="Median endpoint latency in seconds")
+    parser.add_argument("--latency-p99", type=float, default=0.0,
+                        help="99th percentile endpoint latency, enables a lognormal distribution")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests failing with 503")
+    parser.add_argument("--max-connections", type=int, default=100, help="Connection pool size of the SDK")
+    parser.add_argument("--agent-mode", choices=("native", "client_credentials"), default="native")
+    parser.add_argument("--alloc-sample", type=int, default=200,
+                        help="Operations traced with tracemalloc, 0 to skip the memory measurement")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="Write the results as JSON to this file ('-' for stdout)")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    results = [await run_scenario(args, scenario) for scenario in scenarios]
+    report = {
+        "environment": environment(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("json", "baseline")},
+        "results": results,
+    }
+
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_results(results, baseline)
+        if args.json:
+            Path(args.json).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
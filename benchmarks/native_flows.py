@@ -0,0 +1,127 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Native authentication flow manager benchmark.
+
+Runs N concurrent simulated logins through one NativeAuthFlowManager and reports the
+throughput, the memory held per tracked flow and how abandoned flows are expired.
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import time
+import tracemalloc
+
+import httpx
+
+from asgardeo import AsgardeoConfig, FlowStatus, NativeAuthFlowManager, SessionProvider
+
+
+def build_transport(latency: float) -> httpx.MockTransport:
+    """Build a mock transport that emulates the native authentication endpoints."""
+    flow_ids = itertools.count()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        if request.url.path.endswith("/oauth2/authorize"):
+            return httpx.Response(200, json={
+                "flowId": f"flow-{next(flow_ids)}",
+                "flowStatus": FlowStatus.INCOMPLETE,
+                "nextStep": {"authenticators": [{
+                    "authenticator": "Username & Password",
+                    "authenticatorId": "BasicAuthenticator",
+                }]},
+            })
+        if request.url.path.endswith("/oauth2/authn"):
+            flow_id = json.loads(request.content)["flowId"]
+            return httpx.Response(200, json={
+                "flowId": flow_id,
+                "flowStatus": FlowStatus.SUCCESS_COMPLETED,
+                "authData": {"code": f"code-{flow_id}"},
+            })
+        return httpx.Response(200, json={"access_token": "access-token", "expires_in": 3600})
+
+    return httpx.MockTransport(handler)
+
+
+async def main():
+    """Run the flow manager benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--flows", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated endpoint latency in seconds")
+    parser.add_argument("--abandon", type=float, default=0.2, help="Fraction of flows abandoned after initiation")
+    parser.add_argument("--ttl", type=float, default=15.0, help="Flow time to live in seconds")
+    args = parser.parse_args()
+
+    config = AsgardeoConfig(
+        base_url="https://localhost/t/bench",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+        max_connections=None,
+    )
+    provider = SessionProvider(transport=build_transport(args.latency))
+    abandoned = int(args.flows * args.abandon)
+    expired = []
+
+    async with NativeAuthFlowManager(
+        config,
+        session_provider=provider,
+        ttl=args.ttl,
+        resolution=0.1,
+        on_expire=expired.append,
+    ) as manager:
+        start = time.perf_counter()
+        started = await asyncio.gather(*(manager.start_flow() for _ in range(args.flows)))
+        initiated = time.perf_counter() - start
+        print(f"initiated:  {args.flows} flows in {initiated:.2f}s ({args.flows / initiated:,.0f} flows/s)")
+        print(f"tracked:    {len(manager)} flows, {manager.counts()}")
+
+        async def login(flow_id: str) -> None:
+            await manager.continue_flow(
+                flow_id,
+                authenticator_id="BasicAuthenticator",
+                params={"username": "user", "password": "password"},
+            )
+            await manager.complete_flow(flow_id)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(login(flow.flow_id) for flow in started[abandoned:]))
+        completed = time.perf_counter() - start
+        print(f"completed:  {args.flows - abandoned} logins in {completed:.2f}s "
+              f"({(args.flows - abandoned) / completed:,.0f} logins/s)")
+        print(f"abandoned:  {len(manager)} flows still tracked, {manager.counts()}")
+
+        await asyncio.sleep(args.ttl + 0.3)
+        print(f"after ttl:  {len(manager)} flows tracked, {len(expired)} expired")
+
+        # Memory retained per tracked flow, measured on a smaller traced batch.
+        sample = max(1, args.flows // 10)
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await asyncio.gather(*(manager.start_flow() for _ in range(sample)))
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+        print(f"memory:     ~{retained / sample:,.0f} bytes retained per tracked flow")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Bulk revocation benchmark.
+
+Compares revoking tokens one at a time with revoke_many against a mock revocation
+endpoint with simulated latency and transient failures.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+import httpx
+
+from asgardeo import AsgardeoConfig, AsgardeoTokenClient, RetryPolicy, SessionProvider
+
+
+def build_transport(latency: float, error_rate: float) -> httpx.MockTransport:
+    """Build a mock transport for the revocation endpoint."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        if random.random() < error_rate:
+            return httpx.Response(503, text="Service Unavailable")
+        return httpx.Response(200)
+
+    return httpx.MockTransport(handler)
+
+
+async def main():
+    """Run the bulk revocation benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02, help="Simulated endpoint latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Fraction of requests failing with 503")
+    parser.add_argument("--sequential-sample", type=int, default=200, help="Tokens revoked one at a time")
+    args = parser.parse_args()
+
+    config = AsgardeoConfig(
+        base_url="https://localhost/t/bench",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+        retry_policy=RetryPolicy(base_delay=0.05),
+    )
+    provider = SessionProvider(transport=build_transport(args.latency, args.error_rate))
+    tokens = [f"token-{i}" for i in range(args.tokens)]
+
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        start = time.perf_counter()
+        for token in tokens[:args.sequential_sample]:
+            try:
+                await client.revoke_token(token)
+            except Exception:
+                pass
+        sequential = args.sequential_sample / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        results = await client.revoke_many(tokens, concurrency=args.concurrency)
+        elapsed = time.perf_counter() - start
+
+    revoked = sum(result.revoked for result in results)
+    retried = sum(result.attempts > 1 for result in results)
+    print(f"one at a time: {sequential:8.0f} tokens/s")
+    print(f"revoke_many:   {len(tokens) / elapsed:8.0f} tokens/s (concurrency {args.concurrency})")
+    print(f"revoked {revoked}/{len(tokens)}, {retried} needed a retry")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
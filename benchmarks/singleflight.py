@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Single-flight benchmark.
+
+Fires N concurrent identical token requests and shows that only one HTTP request
+reaches the token endpoint.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+
+from asgardeo import AsgardeoConfig, AsgardeoTokenClient, SessionProvider
+from asgardeo_ai import AgentAuthManager, AgentConfig
+
+
+def build_transport(requests: Counter, latency: float) -> httpx.MockTransport:
+    """Build a mock transport that emulates the Asgardeo endpoints."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests[request.url.path] += 1
+        await asyncio.sleep(latency)
+        if request.url.path.endswith("/oauth2/authorize"):
+            return httpx.Response(200, json={
+                "flowId": "flow-1",
+                "flowStatus": "INCOMPLETE",
+                "nextStep": {"authenticators": [{
+                    "authenticator": "Username & Password",
+                    "authenticatorId": "BasicAuthenticator",
+                }]},
+            })
+        if request.url.path.endswith("/oauth2/authn"):
+            return httpx.Response(200, json={
+                "flowId": "flow-1",
+                "flowStatus": "SUCCESS_COMPLETED",
+                "authData": {"code": "code-1"},
+            })
+        return httpx.Response(200, json={
+            "access_token": "access-token",
+            "refresh_token": "refresh-token",
+            "expires_in": 3600,
+        })
+
+    return httpx.MockTransport(handler)
+
+
+async def bench_refresh(config: AsgardeoConfig, concurrency: int, latency: float) -> None:
+    """Benchmark concurrent refresh token requests."""
+    requests: Counter = Counter()
+    provider = SessionProvider(transport=build_transport(requests, latency))
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            client.get_token("refresh_token", refresh_token="refresh-token")
+            for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    print(f"refresh_token:   {concurrency} callers -> {sum(requests.values())} HTTP request(s) in {elapsed * 1000:.1f} ms")
+
+
+async def bench_agent_token(config: AsgardeoConfig, concurrency: int, latency: float) -> None:
+    """Benchmark concurrent agent token requests on a cold cache."""
+    requests: Counter = Counter()
+    provider = SessionProvider(transport=build_transport(requests, latency))
+    agent_config = AgentConfig("agent", "secret")
+    async with AgentAuthManager(config, agent_config, session_provider=provider) as manager:
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            manager.get_agent_token(["openid"]) for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    print(f"get_agent_token: {concurrency} callers -> {sum(requests.values())} HTTP request(s) in {elapsed * 1000:.1f} ms")
+
+
+async def main():
+    """Run the single-flight benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated endpoint latency in seconds")
+    args = parser.parse_args()
+
+    config = AsgardeoConfig(
+        base_url="https://localhost/t/bench",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+    )
+    await bench_refresh(config, args.concurrency, args.latency)
+    await bench_agent_token(config, args.concurrency, args.latency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
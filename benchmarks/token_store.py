@@ -0,0 +1,126 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""
+Token store benchmark.
+
+Writes N tokens through a TokenCache into each persistent store, then measures how
+long a restarted process takes to warm a new cache from the store, compared with
+requesting the same N tokens from a mock token endpoint. Encrypted stores need the
+'cryptography' package.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from asgardeo import (
+    AsgardeoConfig,
+    AsgardeoTokenClient,
+    FileTokenStore,
+    OAuthToken,
+    SessionProvider,
+    SQLiteTokenStore,
+    TokenCache,
+)
+from asgardeo.testing import EndpointProfile, MockAsgardeoServer
+
+
+def bench_store(name: str, open_store, tokens: int) -> None:
+    """Measure write, flush and warm-up latency of one store."""
+    store = open_store()
+    cache = TokenCache(maxsize=tokens, store=store)
+    latencies = []
+    start = time.perf_counter()
+    for i in range(tokens):
+        sent_at = time.perf_counter()
+        cache.set(("agent", f"agent-{i}"), OAuthToken(access_token=f"access-{i}", expires_in=3600))
+        latencies.append(time.perf_counter() - sent_at)
+    flush_start = time.perf_counter()
+    store.close()
+    flush = time.perf_counter() - flush_start
+    written = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = open_store()
+    warmed = TokenCache(maxsize=tokens, store=store)
+    warm_up = time.perf_counter() - start
+    store.close()
+
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1e6
+    print(
+        f"{name:<18} write {tokens / written:9.0f} tokens/s  set p99 {p99:8.1f} us  "
+        f"final flush {flush * 1000:7.1f} ms  warm-up {warm_up * 1000:7.1f} ms ({len(warmed)} tokens)"
+    )
+
+
+async def bench_cold_start(tokens: int, latency: float, concurrency: int) -> None:
+    """Measure requesting every token from a mock token endpoint instead."""
+    mock = MockAsgardeoServer(default_profile=EndpointProfile(latency=latency), seed=1)
+    config = AsgardeoConfig(
+        base_url="https://localhost/t/bench",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+
+        async def fetch(i: int) -> None:
+            async with semaphore:
+                await client.get_token("client_credentials", scope=f"openid agent-{i}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch(i) for i in range(tokens)))
+        elapsed = time.perf_counter() - start
+    print(
+        f"{'re-authenticate':<18} {tokens} token requests at {latency * 1000:.0f} ms latency, "
+        f"concurrency {concurrency}: {elapsed * 1000:.1f} ms"
+    )
+
+
+def main():
+    """Run the token store benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=10000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated token endpoint latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    try:
+        from cryptography.fernet import Fernet
+        key = Fernet.generate_key()
+    except ImportError:
+        key = None
+
+    with tempfile.TemporaryDirectory() as directory:
+        stores = {
+            "sqlite": lambda: SQLiteTokenStore(os.path.join(directory, "tokens.db")),
+            "file (json)": lambda: FileTokenStore(os.path.join(directory, "tokens.json")),
+        }
+        if key is not None:
+            stores["sqlite encrypted"] = lambda: SQLiteTokenStore(os.path.join(directory, "enc.db"), encryption_key=key)
+            stores["file encrypted"] = lambda: FileTokenStore(os.path.join(directory, "enc.json"), encryption_key=key)
+        for name, open_store in stores.items():
+            bench_store(name, open_store, args.tokens)
+
+    asyncio.run(bench_cold_start(args.tokens, args.latency, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
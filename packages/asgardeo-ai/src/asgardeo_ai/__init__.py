@@ -15,12 +15,19 @@ under the License.
 
 from .agent_auth_manager import (
     AgentAuthManager,
-    AgentConfig
+    AgentAuthMode,
+    AgentConfig,
+    AgentTokenResult
 )
+from .obo_cache import OBOCacheEntry, OBOTokenCache
 
 __version__ = "0.2.1"
 
 __all__ = [
     "AgentAuthManager",
+    "AgentAuthMode",
     "AgentConfig", 
+    "AgentTokenResult",
+    "OBOCacheEntry",
+    "OBOTokenCache",
 ]
@@ -15,36 +15,84 @@ under the License.
 
 """Agent-enhanced OAuth2 authentication manager for Asgardeo AI."""
 
+import asyncio
 import logging
 import base64
+import dataclasses
+import hashlib
 import os
-from typing import Dict, List, Optional, Tuple, Any
+import time
+import weakref
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Any
 from urllib.parse import urlencode
 from dataclasses import dataclass
 
 from asgardeo import (
     AsgardeoConfig, 
+    AsgardeoError,
     OAuthToken, 
     FlowStatus, 
+    GrantType,
+    Metric,
+    RevocationResult,
     AsgardeoNativeAuthClient, 
     AsgardeoTokenClient,
     AuthenticationError,
+    CircuitOpenError,
+    Priority,
+    SessionProvider,
+    SingleFlight,
+    TokenCache,
     TokenError,
+    TokenType,
     ValidationError,
     generate_pkce_pair,
     generate_state,
-    build_authorization_url
+    build_authorization_url,
+    decode_jwt,
+    default_instrumentation,
+    default_provider_metadata,
+    normalize_scopes,
+    request_priority
 )
 
+from .obo_cache import OBOCacheEntry, OBOTokenCache
+
 logger = logging.getLogger(__name__)
 
 
+class AgentAuthMode:
+    """Agent authentication mode constants."""
+
+    NATIVE = "native"
+    CLIENT_CREDENTIALS = "client_credentials"
+
+
 @dataclass
 class AgentConfig:
-    """Configuration for AI agent authentication."""
+    """Configuration for AI agent authentication.
+
+    In the native mode the agent signs in with its credentials through the App Native
+    Authentication flow. In the client_credentials mode the agent id and secret (or
+    private key, for private_key_jwt) are the OAuth client credentials of the agent,
+    and a token is obtained in a single request.
+    """
     
     agent_id: str
-    agent_secret: str
+    agent_secret: Optional[str] = None
+    auth_mode: str = AgentAuthMode.NATIVE
+    private_key: Optional[str] = None
+    private_key_id: Optional[str] = None
+
+
+@dataclass
+class AgentTokenResult:
+    """Result of authenticating a single agent of a fleet."""
+
+    agent_id: str
+    token: Optional[OAuthToken] = None
+    error: Optional[str] = None
+    duration: float = 0.0
 
 class AgentAuthManager:
     """Agent-enhanced OAuth2 authentication manager for AI agents."""
@@ -54,42 +102,238 @@ class AgentAuthManager:
         config: AsgardeoConfig,
         agent_config: Optional[AgentConfig] = None,
         authorization_timeout: int = 300,
+        token_cache: Optional[TokenCache] = None,
+        session_provider: Optional[SessionProvider] = None,
+        obo_cache: Optional[OBOTokenCache] = None,
     ):
         """Initialize the agent auth manager.
         
         :param config: Asgardeo configuration
         :param agent_config: Optional agent-specific configuration
         :param authorization_timeout: Timeout for authorization operations
+        :param token_cache: Optional cache for agent tokens (a default cache is created if not provided)
+        :param session_provider: Optional provider of the shared HTTP session (defaults to the process-wide provider)
+        :param obo_cache: Optional cache for on-behalf-of tokens (a default cache is created if not provided)
         """
         self.config = config
         self.agent_config = agent_config
         self.authorization_timeout = authorization_timeout
-        self.token_client = AsgardeoTokenClient(config)
+        self.session_provider = session_provider
+        self.token_client = AsgardeoTokenClient(config, session_provider=session_provider)
+        self.token_cache = token_cache if token_cache is not None else TokenCache()
+        self._singleflight = SingleFlight()
+        self._agent_token_clients: Dict[str, AsgardeoTokenClient] = {}
+        self.obo_cache = obo_cache if obo_cache is not None else OBOTokenCache()
+        # Tokens of the manager's own agent by access token, to recognise them as actor tokens.
+        self._own_agent_tokens: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
-    async def get_agent_token(self, scopes: Optional[List[str]] = None) -> OAuthToken:
+    async def get_agent_token(
+        self,
+        scopes: Optional[List[str]] = None,
+        force_refresh: bool = False,
+        agent_config: Optional[AgentConfig] = None,
+    ) -> OAuthToken:
         """Get access token for the AI agent using agent credentials.
+
+        Tokens are served from the token cache while they are still valid, so repeated
+        calls with the same scopes do not hit the network. Concurrent calls for the same
+        scopes share a single authentication flow, and with a SharedTokenCache so do the
+        processes of a host. While the circuit breaker of an IdP endpoint is open, a
+        cached token that has not yet expired is returned instead.
         
         :param scopes: List of OAuth scopes to request
+        :param force_refresh: Skip the cache and always run the authentication flow
+        :param agent_config: Optional agent to authenticate instead of the manager's agent
         :return: OAuth token for the agent
         """
-        if not self.agent_config:
+        agent_config = agent_config or self.agent_config
+        if not agent_config:
             raise ValidationError("Agent configuration is required for agent authentication.")
-        
+
+        cache_key = self._agent_cache_key(agent_config, scopes)
+        token = None if force_refresh else self.token_cache.get(cache_key)
+        if token is not None:
+            self._count_cache(Metric.CACHE_HITS, "agent_token")
+        else:
+            if not force_refresh:
+                self._count_cache(Metric.CACHE_MISSES, "agent_token")
+            try:
+                token = await self._singleflight.do(
+                    cache_key,
+                    lambda: self.token_cache.fetch(
+                        cache_key,
+                        lambda: self._authenticate_agent(agent_config, scopes),
+                        force=force_refresh,
+                    ),
+                )
+            except CircuitOpenError:
+                token = self.token_cache.get(cache_key, stale_ok=True)
+                if token is None:
+                    raise
+                logger.warning("Serving cached agent token while the IdP circuit breaker is open.")
+        if agent_config == self.agent_config:
+            self._own_agent_tokens[token.access_token] = token
+        return token
+
+    async def get_agent_tokens_many(
+        self,
+        agent_configs: Iterable[AgentConfig],
+        scopes: Optional[List[str]] = None,
+        concurrency: int = 20,
+        use_cache: bool = True,
+        force_refresh: bool = False,
+    ) -> List[AgentTokenResult]:
+        """Authenticate many agents concurrently, e.g. to warm up a fleet at deploy time.
+
+        At most ``concurrency`` agents authenticate at once, all over the connection pool
+        of this manager. Requests go through the configured retry policy, circuit breakers
+        and rate limiters at background priority, so interactive logins are admitted
+        first. Failures never raise, they are reported per agent.
+
+        :param agent_configs: Agents to authenticate
+        :param scopes: List of OAuth scopes to request for every agent
+        :param concurrency: Maximum number of agents authenticating at once
+        :param use_cache: Serve valid cached tokens and cache new ones, so later get_agent_token calls for these agents hit the cache
+        :param force_refresh: Authenticate agents even if a valid token is cached
+        :return: List of AgentTokenResult in the order of the given agents
+        """
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def authenticate(agent_config: AgentConfig) -> AgentTokenResult:
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    with request_priority(Priority.BACKGROUND):
+                        if use_cache:
+                            token = await self.get_agent_token(scopes, force_refresh, agent_config=agent_config)
+                        else:
+                            token = await self._authenticate_agent(agent_config, scopes)
+                except Exception as e:
+                    # Any failure of one agent, e.g. invalid key material, is reported in
+                    # its result instead of discarding the results of the other agents.
+                    return AgentTokenResult(
+                        agent_id=agent_config.agent_id,
+                        error=str(e) or type(e).__name__,
+                        duration=time.perf_counter() - start,
+                    )
+                return AgentTokenResult(
+                    agent_id=agent_config.agent_id,
+                    token=token,
+                    duration=time.perf_counter() - start,
+                )
+
+        return list(await asyncio.gather(*(authenticate(agent_config) for agent_config in agent_configs)))
+
+    def _count_cache(self, metric: str, cache: str) -> None:
+        """Report a cache hit or miss to the configured instrumentation."""
+        instrumentation = self.config.instrumentation or default_instrumentation
+        instrumentation.count(metric, attributes={"cache": cache})
+
+    def _agent_cache_key(
+        self,
+        agent_config: AgentConfig,
+        scopes: Optional[List[str]],
+    ) -> Tuple[str, str, str, str, str, Tuple[str, ...]]:
+        """Build the token cache key for an agent and the requested scopes.
+
+        The key includes the tenant, the client and the authentication mode, so managers
+        of other tenants or applications sharing a token cache never see each other's tokens.
+        """
+        return (
+            "agent",
+            self.config.base_url.rstrip("/"),
+            self.config.client_id,
+            agent_config.auth_mode,
+            agent_config.agent_id,
+            normalize_scopes(scopes or self.config.scope),
+        )
+
+    async def _authenticate_agent(
+        self,
+        agent_config: AgentConfig,
+        scopes: Optional[List[str]] = None,
+    ) -> OAuthToken:
+        """Authenticate an agent using its configured authentication mode.
+
+        :param agent_config: Agent to authenticate
+        :param scopes: List of OAuth scopes to request
+        :return: OAuth token for the agent
+        """
+        if agent_config.auth_mode == AgentAuthMode.CLIENT_CREDENTIALS:
+            return await self._authenticate_agent_client_credentials(agent_config, scopes)
+        if agent_config.auth_mode != AgentAuthMode.NATIVE:
+            raise ValidationError(f"Unsupported agent authentication mode: {agent_config.auth_mode}")
+        if not agent_config.agent_secret:
+            raise ValidationError("Agent secret is required for native agent authentication.")
+        return await self._authenticate_agent_native(agent_config, scopes)
+
+    async def _authenticate_agent_client_credentials(
+        self,
+        agent_config: AgentConfig,
+        scopes: Optional[List[str]] = None,
+    ) -> OAuthToken:
+        """Get a token for an agent with the client_credentials grant.
+
+        :param agent_config: Agent to authenticate
+        :param scopes: List of OAuth scopes to request
+        :return: OAuth token for the agent
+        """
+        token_client = self._agent_token_clients.get(agent_config.agent_id)
+        if token_client is None:
+            agent_client_config = dataclasses.replace(
+                self.config,
+                client_id=agent_config.agent_id,
+                client_secret=agent_config.agent_secret,
+                private_key=agent_config.private_key,
+                private_key_id=agent_config.private_key_id,
+            )
+            # Agent token clients share the connection pool of the manager's configuration.
+            token_client = AsgardeoTokenClient(
+                agent_client_config,
+                session_provider=self.session_provider,
+            )
+            self._agent_token_clients[agent_config.agent_id] = token_client
         try:
-            async with AsgardeoNativeAuthClient(self.config) as native_client:
-                # Set custom scope if provided
-                if scopes:
-                    # Note: We need to modify the config temporarily
-                    original_scope = self.config.scope
-                    self.config.scope = ' '.join(scopes)
-                
+            return await token_client.get_token(
+                'client_credentials',
+                scope=' '.join(scopes) if scopes else self.config.scope,
+            )
+        except (AuthenticationError, CircuitOpenError, TokenError, ValidationError):
+            raise
+        except Exception as e:
+            logger.error(f"Agent authentication failed: {e}")
+            raise AuthenticationError(f"Agent authentication failed: {e}")
+
+    async def _authenticate_agent_native(
+        self,
+        agent_config: AgentConfig,
+        scopes: Optional[List[str]] = None,
+    ) -> OAuthToken:
+        """Run the native authentication flow with the credentials of an agent.
+
+        :param agent_config: Agent to authenticate
+        :param scopes: List of OAuth scopes to request
+        :return: OAuth token for the agent
+        """
+        try:
+            async with AsgardeoNativeAuthClient(
+                self.config,
+                token_client=self.token_client,
+                session_provider=self.session_provider,
+            ) as native_client:
                 # Start authentication flow
                 code_verifier, code_challenge = generate_pkce_pair()
                 params = {
                     "code_challenge": code_challenge,
                     "code_challenge_method": "S256",
                 }
-                init_response = await native_client.authenticate(params=params)
+                # Scopes are passed per call, the shared config is never modified.
+                init_response = await native_client.authenticate(
+                    params=params,
+                    scope=' '.join(scopes) if scopes else None,
+                )
                 
                 if native_client.flow_status == FlowStatus.SUCCESS_COMPLETED:
                     auth_data = init_response.get('authData', {})
@@ -108,8 +352,8 @@ class AgentAuthManager:
                     auth_response = await native_client.authenticate(
                         authenticator_id=username_auth['authenticatorId'],
                         params={
-                            'username': self.agent_config.agent_id,
-                            'password': self.agent_config.agent_secret
+                            'username': agent_config.agent_id,
+                            'password': agent_config.agent_secret
                         }
                     )
                     
@@ -125,15 +369,13 @@ class AgentAuthManager:
                     raise TokenError("No authorization code received from authentication flow.")
 
                 # Exchange code for token
-                token = await self.token_client.get_token('authorization_code', code=code, code_verifier=code_verifier)
-                
-                # Restore original scope
-                if scopes:
-                    self.config.scope = original_scope
-                    
-                return token
+                return await self.token_client.get_token(
+                    'authorization_code',
+                    code=code,
+                    code_verifier=code_verifier,
+                )
         
-        except (AuthenticationError, TokenError, ValidationError):
+        except (AuthenticationError, CircuitOpenError, TokenError, ValidationError):
             raise
         except Exception as e:
             logger.error(f"Agent authentication failed: {e}")
@@ -174,7 +416,7 @@ class AgentAuthManager:
         auth_params.update(kwargs)
         
         auth_url = build_authorization_url(
-            f"{self.config.base_url}/oauth2/authorize",
+            default_provider_metadata.cached(self.config).authorization_endpoint,
             auth_params
         )
         return auth_url, state
@@ -218,7 +460,7 @@ class AgentAuthManager:
         auth_params.update(kwargs)
         
         auth_url = build_authorization_url(
-            f"{self.config.base_url}/oauth2/authorize",
+            default_provider_metadata.cached(self.config).authorization_endpoint,
             auth_params
         )
         return auth_url, state, code_verifier    
@@ -228,13 +470,20 @@ class AgentAuthManager:
         auth_code: str,
         agent_token: str,
         scopes: Optional[List[str]] = None,
-        code_verifier: Optional[str] = None
+        code_verifier: Optional[str] = None,
+        subject: Optional[str] = None,
+        resource: Optional[str] = None,
     ) -> OAuthToken:
         """Get on-behalf-of (OBO) token for user using authorization code.
+
+        The token is added to the OBO token cache, so later calls to
+        get_cached_obo_token for the same user can reuse it.
         
         :param auth_code: Authorization code from user authentication
         :param scopes: Optional list of scopes to request
         :param agent_token: Optional agent token for delegation
+        :param subject: Optional user identifier for the cache (defaults to the token 'sub' claim)
+        :param resource: Optional resource the authorization was requested for
         :return: OAuth token for the user
         """
         if not auth_code:
@@ -251,14 +500,164 @@ class AgentAuthManager:
                 actor_token=actor_token_val,
                 code_verifier=code_verifier
             )
-            return token
-            
-        except (TokenError, ValidationError):
+        except (CircuitOpenError, TokenError, ValidationError):
             raise
         except Exception as e:
             logger.error(f"OBO token exchange failed: {e}")
             raise TokenError(f"OBO token exchange failed: {e}")
 
+        subject = subject or self._token_subject(token.id_token) or self._token_subject(token.access_token)
+        if subject:
+            self.obo_cache.set(subject, self._obo_actor(agent_token), token, scopes=scopes, resource=resource)
+        return token
+
+    async def get_cached_obo_token(
+        self,
+        subject: str,
+        scopes: Optional[List[str]] = None,
+        resource: Optional[str] = None,
+        agent_token: Optional[OAuthToken] = None,
+    ) -> Optional[OAuthToken]:
+        """Get a cached on-behalf-of token for a user.
+
+        Any cached token of the user for this agent and resource whose scopes include
+        the requested scopes is returned. Tokens close to expiry are refreshed with
+        their refresh token first; concurrent callers share a single refresh.
+
+        :param subject: User identifier the token was cached for
+        :param scopes: Optional list of required scopes
+        :param resource: Optional resource the token is intended for
+        :param agent_token: Optional actor token the token was delegated with (defaults to the manager's agent)
+        :return: Cached OAuth token, or None if the user has to be delegated again
+        """
+        entry = self.obo_cache.find(subject, self._obo_actor(agent_token), scopes, resource)
+        if entry is None:
+            self._count_cache(Metric.CACHE_MISSES, "obo_token")
+            return None
+        self._count_cache(Metric.CACHE_HITS, "obo_token")
+        if not entry.expires_within(self.obo_cache.refresh_skew):
+            return entry.token
+        if not entry.token.refresh_token:
+            return None if entry.expires_within(0) else entry.token
+
+        try:
+            return await self._singleflight.do(
+                ("obo-refresh", entry.key),
+                lambda: self._refresh_obo_token(entry),
+            )
+        except CircuitOpenError:
+            # The IdP is unavailable, keep using the token until it expires.
+            return None if entry.expires_within(0) else entry.token
+        except Exception as e:
+            logger.warning(f"OBO token refresh failed: {e}")
+            self.obo_cache.discard_token(entry.token.access_token)
+            return None
+
+    async def _refresh_obo_token(self, entry: OBOCacheEntry) -> OAuthToken:
+        """Refresh a cached OBO token and replace the cache entry."""
+        token = await self.token_client.refresh_access_token(entry.token.refresh_token)
+        token.refresh_token = token.refresh_token or entry.token.refresh_token
+        token.scope = token.scope or ' '.join(entry.scopes)
+        self.obo_cache.discard_token(entry.token.access_token)
+        self.obo_cache.set(entry.subject, entry.actor, token, resource=entry.resource)
+        return token
+
+    def evict_user_tokens(self, subject: str) -> int:
+        """Remove all cached on-behalf-of tokens of a user (e.g. on sign out).
+
+        :param subject: User identifier the tokens were cached for
+        :return: Number of removed tokens
+        """
+        return self.obo_cache.evict_user(subject)
+
+    def _obo_actor(self, agent_token: Optional[OAuthToken] = None) -> Optional[str]:
+        """Return the actor used in OBO cache keys for the actor token of a delegation.
+
+        Delegations with a token of the manager's own agent are cached under its agent
+        id. Any other actor token is identified by a digest of the token, so tokens
+        delegated to other actors are never served for this agent.
+        """
+        if agent_token is None or self._own_agent_tokens.get(agent_token.access_token) is not None:
+            return self.agent_config.agent_id if self.agent_config else None
+        return "actor-token:" + hashlib.sha256(agent_token.access_token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _token_subject(token: Optional[str]) -> Optional[str]:
+        """Read the 'sub' claim of a JWT without verifying it, None for opaque tokens."""
+        if not token:
+            return None
+        try:
+            _, claims, _, _ = decode_jwt(token)
+        except TokenError:
+            return None
+        subject = claims.get('sub')
+        return subject if isinstance(subject, str) else None
+
+    @staticmethod
+    def _subject_token_key(subject_token: str) -> str:
+        """Return the OBO cache subject of an unverified subject token, a digest of the token."""
+        return "subject-token:" + hashlib.sha256(subject_token.encode("utf-8")).hexdigest()
+
+    async def exchange_token(
+        self,
+        subject_token: str,
+        scopes: Optional[List[str]] = None,
+        agent_token: Optional[OAuthToken] = None,
+        resource: Optional[str] = None,
+        audience: Optional[str] = None,
+        subject_token_type: str = TokenType.ACCESS_TOKEN,
+        subject: Optional[str] = None,
+        force_refresh: bool = False,
+    ) -> OAuthToken:
+        """Get a delegated on-behalf-of token for a user with RFC 8693 token exchange.
+
+        The user's token is the subject and the agent token is the actor, so the
+        delegated token is minted in a single request without a new authorization code.
+        Delegated tokens are served from the OBO token cache while they are valid.
+        The claims of the subject token are not verified here, so unless a verified
+        subject is given, delegated tokens are cached per subject token rather than per
+        user. Requests with an audience are not cached.
+        
+        :param subject_token: Token of the user the agent acts for
+        :param scopes: Optional list of scopes to request
+        :param agent_token: Optional agent token used as actor token (obtained with get_agent_token if not provided)
+        :param resource: Optional resource the token is intended for
+        :param audience: Optional audience the token is intended for
+        :param subject_token_type: Token type of the subject token
+        :param subject: Optional verified user identifier for the cache, e.g. the 'sub' claim returned by TokenValidator
+        :param force_refresh: Skip the cache and always exchange the token
+        :return: Delegated OAuth token
+        """
+        if not subject_token:
+            raise ValidationError("Subject token is required for token exchange.")
+        subject = None if audience else subject or self._subject_token_key(subject_token)
+        if subject and not force_refresh:
+            token = await self.get_cached_obo_token(subject, scopes, resource, agent_token)
+            if token is not None:
+                return token
+        if agent_token is None and self.agent_config:
+            agent_token = await self.get_agent_token()
+
+        try:
+            token = await self.token_client.get_token(
+                GrantType.TOKEN_EXCHANGE,
+                subject_token=subject_token,
+                subject_token_type=subject_token_type,
+                actor_token=agent_token.access_token if agent_token else None,
+                scope=' '.join(scopes) if scopes else None,
+                resource=resource,
+                audience=audience,
+            )
+        except (CircuitOpenError, TokenError, ValidationError):
+            raise
+        except Exception as e:
+            logger.error(f"Token exchange failed: {e}")
+            raise TokenError(f"Token exchange failed: {e}")
+
+        if subject:
+            self.obo_cache.set(subject, self._obo_actor(agent_token), token, scopes=scopes, resource=resource)
+        return token
+
     async def revoke_token(
         self, 
         token: str, 
@@ -270,14 +669,49 @@ class AgentAuthManager:
         :param token_type_hint: Type of token being revoked
         :return: True if revocation succeeded, False otherwise
         """
+        await self.token_cache.discard_tokens([token])
+        self.obo_cache.discard_token(token)
         try:
             return await self.token_client.revoke_token(token, token_type_hint)
         except Exception as e:
             logger.error(f"Token revocation failed: {e}")
             return False
 
+    async def revoke_many(
+        self,
+        tokens: Iterable[Union[str, Tuple[str, Optional[str]]]],
+        concurrency: int = 20,
+        max_attempts: Optional[int] = None,
+    ) -> List[RevocationResult]:
+        """Revoke many access or refresh tokens concurrently.
+
+        :param tokens: Tokens to revoke, either plain tokens or (token, token_type_hint) tuples
+        :param concurrency: Maximum number of revocation requests in flight
+        :param max_attempts: Maximum number of attempts per token, overriding config.retry_policy
+        :return: List of RevocationResult in the order of the given tokens
+        """
+        tokens = list(tokens)
+        raw_tokens = [item if isinstance(item, str) else item[0] for item in tokens]
+        await self.token_cache.discard_tokens(raw_tokens)
+        for token in raw_tokens:
+            self.obo_cache.discard_token(token)
+        return await self.token_client.revoke_many(
+            tokens,
+            concurrency=concurrency,
+            max_attempts=max_attempts,
+        )
+
     async def __aenter__(self):
-        """Async context manager entry."""
+        """Async context manager entry.
+
+        With discovery enabled, the tenant metadata is fetched up front so that
+        authorization URLs use the discovered endpoint.
+        """
+        if self.config.discovery:
+            try:
+                await default_provider_metadata.get(self.config, self.token_client.session)
+            except AsgardeoError as e:
+                logger.warning(f"OIDC discovery failed, retrying on first request: {e}")
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -287,5 +721,12 @@ class AgentAuthManager:
 
     # Backwards compatibility
     async def close(self):
-        """Close the agent auth manager and cleanup resources."""
+        """Close the agent auth manager and cleanup resources.
+
+        Token writes still buffered by the token cache's store are persisted.
+        """
+        await asyncio.to_thread(self.token_cache.flush)
         await self.token_client.close()
+        for token_client in self._agent_token_clients.values():
+            await token_client.close()
+        self._agent_token_clients.clear()
@@ -0,0 +1,215 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Cache of on-behalf-of (OBO) tokens for Asgardeo AI."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from asgardeo import OAuthToken, normalize_scopes
+
+OBOCacheKey = Tuple[str, Optional[str], Tuple[str, ...], Optional[str]]
+
+
+@dataclass
+class OBOCacheEntry:
+    """Cached OBO token with its key and expiry."""
+
+    subject: str
+    actor: Optional[str]
+    scopes: Tuple[str, ...]
+    resource: Optional[str]
+    token: OAuthToken
+    expires_at: float
+
+    @property
+    def key(self) -> OBOCacheKey:
+        """Cache key of the entry."""
+        return (self.subject, self.actor, self.scopes, self.resource)
+
+    def expires_within(self, seconds: float) -> bool:
+        """Check whether the token expires within the given number of seconds."""
+        return time.monotonic() + seconds >= self.expires_at
+
+
+class OBOTokenCache:
+    """LRU cache of delegated tokens keyed by (subject, actor, scopes, resource).
+
+    A lookup is satisfied by any cached token of the same subject, actor and resource
+    whose scopes are a superset of the requested scopes. Memory is bounded by a global
+    entry limit and a per-user entry limit, and all tokens of a user can be evicted at
+    once.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        max_per_user: int = 32,
+        refresh_skew: float = 60.0,
+    ) -> None:
+        """Initialize the OBO token cache.
+
+        :param maxsize: Maximum number of cached tokens
+        :param max_per_user: Maximum number of cached tokens per subject
+        :param refresh_skew: Seconds before expiry at which a token is considered due for refresh
+        """
+        if maxsize < 0 or max_per_user < 0:
+            raise ValueError("maxsize and max_per_user must not be negative.")
+        self.maxsize = maxsize
+        self.max_per_user = max_per_user
+        self.refresh_skew = refresh_skew
+        self._entries: "OrderedDict[OBOCacheKey, OBOCacheEntry]" = OrderedDict()
+        self._by_user: Dict[str, Set[OBOCacheKey]] = {}
+
+    def get(
+        self,
+        subject: str,
+        actor: Optional[str],
+        scopes: Optional[Iterable[str]] = None,
+        resource: Optional[str] = None,
+    ) -> Optional[OAuthToken]:
+        """Return a cached token that is not due for refresh.
+
+        :param subject: Subject (user) the token was issued for
+        :param actor: Actor (agent id) the token was delegated to
+        :param scopes: Requested scopes
+        :param resource: Optional resource the token is intended for
+        :return: Cached OAuthToken or None
+        """
+        entry = self.find(subject, actor, scopes, resource)
+        if entry is None or entry.expires_within(self.refresh_skew):
+            return None
+        return entry.token
+
+    def find(
+        self,
+        subject: str,
+        actor: Optional[str],
+        scopes: Optional[Iterable[str]] = None,
+        resource: Optional[str] = None,
+    ) -> Optional[OBOCacheEntry]:
+        """Find the best cached entry covering the requested scopes.
+
+        Unlike :meth:`get` this also returns entries that are due for refresh, and
+        expired entries that still hold a refresh token.
+
+        :param subject: Subject (user) the token was issued for
+        :param actor: Actor (agent id) the token was delegated to
+        :param scopes: Requested scopes
+        :param resource: Optional resource the token is intended for
+        :return: Entry with the latest expiry among the matches, or None
+        """
+        requested = set(normalize_scopes(scopes))
+        now = time.monotonic()
+        best = None
+        for key in list(self._by_user.get(subject, ())):
+            entry = self._entries[key]
+            if entry.actor != actor or entry.resource != resource:
+                continue
+            if not requested.issubset(entry.scopes):
+                continue
+            if entry.expires_at <= now and not entry.token.refresh_token:
+                self._remove(key)
+                continue
+            if best is None or entry.expires_at > best.expires_at:
+                best = entry
+        if best is not None:
+            self._entries.move_to_end(best.key)
+        return best
+
+    def set(
+        self,
+        subject: str,
+        actor: Optional[str],
+        token: OAuthToken,
+        scopes: Optional[Iterable[str]] = None,
+        resource: Optional[str] = None,
+    ) -> Optional[OBOCacheEntry]:
+        """Cache a delegated token.
+
+        The token is keyed by the scopes granted in the token response, falling back
+        to the requested scopes.
+
+        :param subject: Subject (user) the token was issued for
+        :param actor: Actor (agent id) the token was delegated to
+        :param token: Delegated token
+        :param scopes: Requested scopes
+        :param resource: Optional resource the token is intended for
+        :return: The cache entry, or None if the token cannot be cached
+        """
+        if self.maxsize == 0 or self.max_per_user == 0 or not token.expires_in:
+            return None
+        entry = OBOCacheEntry(
+            subject=subject,
+            actor=actor,
+            scopes=normalize_scopes(token.scope or scopes),
+            resource=resource,
+            token=token,
+            expires_at=time.monotonic() + token.expires_in,
+        )
+        key = entry.key
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        user_keys = self._by_user.setdefault(subject, set())
+        user_keys.add(key)
+
+        if len(user_keys) > self.max_per_user:
+            oldest = next(k for k in self._entries if k in user_keys)
+            self._remove(oldest)
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+        return entry
+
+    def evict_user(self, subject: str) -> int:
+        """Remove all cached tokens of a subject.
+
+        :param subject: Subject (user) whose tokens are removed
+        :return: Number of removed tokens
+        """
+        keys = list(self._by_user.get(subject, ()))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def discard_token(self, token: str) -> None:
+        """Remove every entry holding a token as its access or refresh token.
+
+        :param token: Access or refresh token (e.g. after it has been revoked)
+        """
+        stale = [
+            key for key, entry in self._entries.items()
+            if token in (entry.token.access_token, entry.token.refresh_token)
+        ]
+        for key in stale:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all cached tokens."""
+        self._entries.clear()
+        self._by_user.clear()
+
+    def _remove(self, key: OBOCacheKey) -> None:
+        """Remove an entry and its per-user index."""
+        self._entries.pop(key, None)
+        user_keys = self._by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._by_user[key[0]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,271 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of agent authentication and on-behalf-of token caching."""
+
+import asyncio
+import base64
+import dataclasses
+import json
+
+import pytest
+
+from asgardeo import (
+    AuthenticationError,
+    FileTokenStore,
+    OAuthToken,
+    SessionProvider,
+    SQLiteTokenStore,
+    TokenCache,
+    TokenError,
+)
+from asgardeo.testing import EndpointProfile, Latency, MockAsgardeoServer
+from asgardeo_ai import AgentAuthManager, AgentAuthMode, AgentConfig, OBOTokenCache
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_agent_token_is_cached(manager, mock):
+    token = await manager.get_agent_token(["openid"])
+    assert await manager.get_agent_token(["openid"]) is token
+    assert mock.requests["token"] == 1
+
+    refreshed = await manager.get_agent_token(["openid"], force_refresh=True)
+    assert refreshed.access_token != token.access_token
+    assert mock.requests["token"] == 2
+
+
+async def test_concurrent_agent_token_requests_share_one_login(manager, mock):
+    tokens = await asyncio.gather(*(manager.get_agent_token(["openid"]) for _ in range(20)))
+    assert len({token.access_token for token in tokens}) == 1
+    assert mock.requests["authorize"] == 1
+
+
+async def test_concurrent_logins_with_different_scopes(config):
+    mock = MockAsgardeoServer(
+        seed=1,
+        users={"agent-1": "agent-secret"},
+        clients={"client-id": "client-secret"},
+        default_profile=EndpointProfile(latency=Latency.uniform(0, 0.01)),
+    )
+    provider = SessionProvider(transport=mock.transport())
+    scopes = [["openid", f"scope-{i}"] for i in range(10)]
+    async with AgentAuthManager(config, AgentConfig("agent-1", "agent-secret"), session_provider=provider) as manager:
+        tokens = await asyncio.gather(*(manager.get_agent_token(scope) for scope in scopes))
+        assert [token.scope for token in tokens] == [" ".join(scope) for scope in scopes]
+
+        with pytest.raises(AuthenticationError):
+            await manager.get_agent_token(["openid", "failed"], agent_config=AgentConfig("agent-1", "wrong"))
+    assert config.scope == "openid internal_login"
+    assert mock.requests["token"] == 10
+
+
+async def test_client_credentials_agent(manager, mock):
+    agent = AgentConfig("agent-2", "agent-secret", auth_mode=AgentAuthMode.CLIENT_CREDENTIALS)
+    token = await manager.get_agent_token(["openid"], agent_config=agent)
+    assert token.access_token
+    assert mock.requests["authorize"] == 0
+
+
+async def test_client_credentials_agent_with_a_wrong_secret(manager, mock):
+    agent = AgentConfig("agent-2", "wrong", auth_mode=AgentAuthMode.CLIENT_CREDENTIALS)
+    with pytest.raises(TokenError):
+        await manager.get_agent_token(["openid"], agent_config=agent)
+    assert mock.responses["token", 401] == 1
+
+
+async def test_client_credentials_agent_with_private_key_jwt(config):
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("ascii")
+    mock = MockAsgardeoServer(clients={"client-id": "client-secret"}, client_keys={"agent-3": key.public_key()})
+    agent = AgentConfig("agent-3", auth_mode=AgentAuthMode.CLIENT_CREDENTIALS, private_key=pem)
+    async with AgentAuthManager(config, agent, session_provider=SessionProvider(transport=mock.transport())) as manager:
+        token = await manager.get_agent_token(["openid"])
+    claims = json.loads(base64.urlsafe_b64decode(token.access_token.split(".")[1] + "=="))
+    assert claims["sub"] == "agent-3"
+    assert mock.responses["token", 200] == 1
+
+
+async def test_agent_token_cache_key_includes_mode_tenant_and_client(config, session_provider, mock):
+    token_cache = TokenCache()
+    native = AgentConfig("agent-1", "agent-secret")
+    async with AgentAuthManager(config, native, token_cache=token_cache, session_provider=session_provider) as manager:
+        native_token = await manager.get_agent_token(["openid"])
+        client_credentials = AgentConfig("agent-1", "agent-secret", auth_mode=AgentAuthMode.CLIENT_CREDENTIALS)
+        assert await manager.get_agent_token(["openid"], agent_config=client_credentials) is not native_token
+
+    for other in (
+        dataclasses.replace(config, base_url="https://localhost/t/other"),
+        dataclasses.replace(config, client_id="other-client"),
+    ):
+        async with AgentAuthManager(other, native, token_cache=token_cache, session_provider=session_provider) as manager:
+            assert await manager.get_agent_token(["openid"]) is not native_token
+    assert mock.requests["token"] == 4
+
+
+async def test_fleet_login_reports_results_per_agent(config):
+    mock = MockAsgardeoServer(users={f"agent-{i}": "secret" for i in range(5)})
+    provider = SessionProvider(transport=mock.transport())
+    fleet = [AgentConfig(f"agent-{i}", "secret") for i in range(6)]
+    async with AgentAuthManager(config, session_provider=provider) as manager:
+        results = await manager.get_agent_tokens_many(fleet, scopes=["openid"], concurrency=3)
+        assert [result.agent_id for result in results] == [agent.agent_id for agent in fleet]
+        assert all(result.token for result in results[:5])
+        assert results[5].token is None and results[5].error
+
+        requests = mock.requests["token"]
+        await manager.get_agent_token(["openid"], agent_config=fleet[0])
+        assert mock.requests["token"] == requests
+
+
+async def test_fleet_login_reports_unexpected_errors_per_agent(manager, monkeypatch):
+    authenticate = manager._authenticate_agent
+
+    async def authenticate_or_fail(agent_config, scopes):
+        if agent_config.agent_id == "agent-broken":
+            raise ValueError("Could not deserialize key data.")
+        return await authenticate(agent_config, scopes)
+
+    monkeypatch.setattr(manager, "_authenticate_agent", authenticate_or_fail)
+    fleet = [AgentConfig("agent-a", "secret"), AgentConfig("agent-broken", "secret"), AgentConfig("agent-b", "secret")]
+    results = await manager.get_agent_tokens_many(fleet, scopes=["openid"], use_cache=False)
+    assert [bool(result.token) for result in results] == [True, False, True]
+    assert results[1].error == "Could not deserialize key data."
+
+
+async def test_obo_token_is_cached_per_user(manager, mock):
+    agent_token = await manager.get_agent_token(["openid"])
+    code = mock.issue_code("alice", scope="openid read")
+    token = await manager.get_obo_token(code, agent_token, scopes=["openid", "read"])
+
+    assert await manager.get_cached_obo_token("alice", ["read"]) is token
+    assert await manager.get_cached_obo_token("alice", ["write"]) is None
+    assert await manager.get_cached_obo_token("bob", ["read"]) is None
+
+    assert manager.evict_user_tokens("alice") == 1
+    assert await manager.get_cached_obo_token("alice", ["read"]) is None
+
+
+async def test_obo_token_close_to_expiry_is_refreshed(config, session_provider, mock):
+    agent = AgentConfig("agent-1", "agent-secret")
+    cache = OBOTokenCache(refresh_skew=7200)
+    async with AgentAuthManager(config, agent, session_provider=session_provider, obo_cache=cache) as manager:
+        agent_token = await manager.get_agent_token(["openid"])
+        token = await manager.get_obo_token(mock.issue_code("alice"), agent_token, scopes=["openid"])
+
+        refreshed = await manager.get_cached_obo_token("alice", ["openid"])
+        assert refreshed.access_token != token.access_token
+        assert mock.responses["token", 200] == 3
+
+
+async def test_exchange_token_is_cached(manager, mock):
+    user_token = await manager.token_client.get_token("authorization_code", code=mock.issue_code("alice"))
+    delegated = await manager.exchange_token(user_token.access_token, scopes=["openid"])
+    assert isinstance(delegated, OAuthToken)
+
+    requests = mock.requests["token"]
+    assert await manager.exchange_token(user_token.access_token, scopes=["openid"]) is delegated
+    assert mock.requests["token"] == requests
+
+
+def unsigned_jwt(claims: dict) -> str:
+    def encode(part: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}."
+
+
+async def test_forged_subject_token_misses_obo_cache(manager, mock):
+    agent_token = await manager.get_agent_token(["openid"])
+    await manager.get_obo_token(mock.issue_code("alice"), agent_token, scopes=["openid"])
+    user_token = await manager.token_client.get_token("authorization_code", code=mock.issue_code("alice"))
+    await manager.exchange_token(user_token.access_token, scopes=["openid"])
+
+    requests = mock.requests["token"]
+    with pytest.raises(TokenError):
+        await manager.exchange_token(unsigned_jwt({"sub": "alice"}), scopes=["openid"])
+    assert mock.requests["token"] == requests + 1
+
+
+async def test_exchange_token_with_verified_subject_is_cached_per_user(manager, mock):
+    user_token = await manager.token_client.get_token("authorization_code", code=mock.issue_code("alice"))
+    delegated = await manager.exchange_token(user_token.access_token, scopes=["openid"], subject="alice")
+    assert await manager.get_cached_obo_token("alice", ["openid"]) is delegated
+
+
+async def test_obo_cache_is_keyed_on_the_actor_token_used(manager, mock):
+    user_token = await manager.token_client.get_token("authorization_code", code=mock.issue_code("alice"))
+    other_agent = await manager.get_agent_token(["openid"], agent_config=AgentConfig("agent-2", "secret"))
+    by_other_agent = await manager.exchange_token(
+        user_token.access_token,
+        scopes=["openid"],
+        agent_token=other_agent,
+        subject="alice",
+    )
+    assert await manager.get_cached_obo_token("alice", ["openid"]) is None
+
+    by_own_agent = await manager.exchange_token(user_token.access_token, scopes=["openid"], subject="alice")
+    assert by_own_agent is not by_other_agent
+    assert await manager.get_cached_obo_token("alice", ["openid"]) is by_own_agent
+    assert await manager.get_cached_obo_token("alice", ["openid"], agent_token=other_agent) is by_other_agent
+
+    own_agent = await manager.get_agent_token()
+    requests = mock.requests["token"]
+    assert await manager.exchange_token(
+        user_token.access_token,
+        scopes=["openid"],
+        agent_token=own_agent,
+        subject="alice",
+    ) is by_own_agent
+    assert mock.requests["token"] == requests
+
+
+async def test_close_flushes_the_token_store(config, session_provider, tmp_path):
+    path = str(tmp_path / "tokens.db")
+    store = SQLiteTokenStore(path, flush_interval=60)
+    agent = AgentConfig("agent-1", "agent-secret")
+    async with AgentAuthManager(config, agent, session_provider=session_provider, token_cache=TokenCache(store=store)) as manager:
+        await manager.get_agent_token(["openid"])
+        await manager.get_agent_token(["email"])
+
+    reader = SQLiteTokenStore(path)
+    assert len(TokenCache(store=reader)) == 2
+    reader.close()
+    store.close()
+
+
+async def test_restarted_manager_is_warmed_from_a_file_store(config, session_provider, mock, tmp_path):
+    path = str(tmp_path / "tokens.json")
+    agent = AgentConfig("agent-1", "agent-secret")
+    store = FileTokenStore(path)
+    async with AgentAuthManager(config, agent, session_provider=session_provider, token_cache=TokenCache(store=store)) as manager:
+        token = await manager.get_agent_token(["openid"])
+    store.close()
+    requests = mock.requests["token"]
+
+    store = FileTokenStore(path)
+    async with AgentAuthManager(config, agent, session_provider=session_provider, token_cache=TokenCache(store=store)) as manager:
+        assert (await manager.get_agent_token(["openid"])).access_token == token.access_token
+    store.close()
+    assert mock.requests["token"] == requests
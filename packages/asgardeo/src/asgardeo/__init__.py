@@ -13,15 +13,61 @@ specific language governing permissions and limitations
 under the License.
 """
 
-from .auth import AsgardeoNativeAuthClient, AsgardeoTokenClient
+from .auth import (
+    AsgardeoNativeAuthClient,
+    AsgardeoTokenClient,
+    CacheStats,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    ClaimsCache,
+    FileTokenStore,
+    FlowStateSigner,
+    Instrumentation,
+    InterProcessLock,
+    MemoryTokenStore,
+    Metric,
+    NativeAuthFlowManager,
+    OpenTelemetryInstrumentation,
+    Priority,
+    ProviderMetadata,
+    ProviderMetadataCache,
+    RateLimiter,
+    RateLimiterRegistry,
+    SQLiteTokenStore,
+    SessionProvider,
+    SharedTokenCache,
+    SingleFlight,
+    TokenCache,
+    TokenRefresher,
+    TokenStore,
+    TokenValidator,
+    decode_jwt,
+    default_circuit_breakers,
+    default_instrumentation,
+    default_provider_metadata,
+    default_rate_limiters,
+    default_session_provider,
+    normalize_scopes,
+    request_priority,
+)
 from .models import (
     AsgardeoConfig,
     AsgardeoError,
     AuthenticationError,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    FlowState,
     FlowStatus,
+    GrantType,
     NetworkError,
     OAuthToken,
+    RateLimitPolicy,
+    RetryPolicy,
+    RevocationResult,
     TokenError,
+    TokenType,
+    TokenValidationError,
     ValidationError,
 )
 from .auth.util import generate_pkce_pair, generate_state, build_authorization_url
@@ -34,12 +80,55 @@ __all__ = [
     "AsgardeoNativeAuthClient",
     "AsgardeoTokenClient",
     "AuthenticationError",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitBreakerPolicy",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "ClaimsCache",
+    "FlowState",
+    "FlowStateSigner",
+    "FileTokenStore",
     "FlowStatus",
+    "GrantType",
+    "Instrumentation",
+    "InterProcessLock",
+    "Metric",
+    "MemoryTokenStore",
+    "NativeAuthFlowManager",
     "NetworkError",
     "OAuthToken",
+    "OpenTelemetryInstrumentation",
+    "Priority",
+    "ProviderMetadata",
+    "ProviderMetadataCache",
+    "RateLimitPolicy",
+    "RateLimiter",
+    "RateLimiterRegistry",
+    "RetryPolicy",
+    "RevocationResult",
+    "SQLiteTokenStore",
+    "SessionProvider",
+    "SharedTokenCache",
+    "SingleFlight",
+    "TokenCache",
     "TokenError",
+    "TokenRefresher",
+    "TokenStore",
+    "TokenType",
+    "TokenValidationError",
+    "TokenValidator",
     "ValidationError",
     "generate_pkce_pair",
     "generate_state",
     "build_authorization_url",
+    "decode_jwt",
+    "default_circuit_breakers",
+    "default_instrumentation",
+    "default_provider_metadata",
+    "default_rate_limiters",
+    "default_session_provider",
+    "normalize_scopes",
+    "request_priority",
 ]
@@ -17,13 +17,52 @@ from ..models import (
     AsgardeoConfig,
     AsgardeoError,
     AuthenticationError,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    FlowState,
     FlowStatus,
+    GrantType,
     NetworkError,
     OAuthToken,
+    RateLimitPolicy,
+    RetryPolicy,
+    RevocationResult,
     TokenError,
+    TokenType,
+    TokenValidationError,
     ValidationError,
 )
+from .breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    default_circuit_breakers,
+)
+from .cache import CacheStats, ClaimsCache, TokenCache, normalize_scopes
 from .client import AsgardeoNativeAuthClient, AsgardeoTokenClient
+from .discovery import ProviderMetadata, ProviderMetadataCache, default_provider_metadata
+from .flow import FlowStateSigner
+from .flow_manager import NativeAuthFlowManager
+from .jwt import decode_jwt
+from .ratelimit import (
+    Priority,
+    RateLimiter,
+    RateLimiterRegistry,
+    default_rate_limiters,
+    request_priority,
+)
+from .refresher import TokenRefresher
+from .shared import InterProcessLock, SharedTokenCache
+from .singleflight import SingleFlight
+from .store import FileTokenStore, MemoryTokenStore, SQLiteTokenStore, TokenStore
+from .telemetry import (
+    Instrumentation,
+    Metric,
+    OpenTelemetryInstrumentation,
+    default_instrumentation,
+)
+from .transport import SessionProvider, default_session_provider
+from .validator import TokenValidator
 from .util import generate_pkce_pair, generate_state, build_authorization_url
 
 __version__ = "0.2.1"
@@ -34,12 +73,55 @@ __all__ = [
     "AsgardeoNativeAuthClient",
     "AsgardeoTokenClient",
     "AuthenticationError",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitBreakerPolicy",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "ClaimsCache",
+    "FlowState",
+    "FlowStateSigner",
+    "FileTokenStore",
     "FlowStatus",
+    "GrantType",
+    "Instrumentation",
+    "InterProcessLock",
+    "Metric",
+    "MemoryTokenStore",
+    "NativeAuthFlowManager",
     "NetworkError",
     "OAuthToken",
+    "OpenTelemetryInstrumentation",
+    "Priority",
+    "ProviderMetadata",
+    "ProviderMetadataCache",
+    "RateLimitPolicy",
+    "RateLimiter",
+    "RateLimiterRegistry",
+    "RetryPolicy",
+    "RevocationResult",
+    "SQLiteTokenStore",
+    "SessionProvider",
+    "SharedTokenCache",
+    "SingleFlight",
+    "TokenCache",
     "TokenError",
+    "TokenRefresher",
+    "TokenStore",
+    "TokenType",
+    "TokenValidationError",
+    "TokenValidator",
     "ValidationError",
     "generate_pkce_pair",
     "generate_state",
     "build_authorization_url",
+    "decode_jwt",
+    "default_circuit_breakers",
+    "default_instrumentation",
+    "default_provider_metadata",
+    "default_rate_limiters",
+    "default_session_provider",
+    "normalize_scopes",
+    "request_priority",
 ]
@@ -0,0 +1,246 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Per-endpoint circuit breakers."""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from ..models import AsgardeoConfig, CircuitBreakerPolicy, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+StateListener = Callable[[str, str, str], None]
+
+
+class CircuitState:
+    """Circuit breaker state constants."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Circuit breaker guarding the requests to one endpoint.
+
+    While the circuit is open requests raise CircuitOpenError immediately instead of
+    waiting for the endpoint to time out. Listeners are called with
+    ``(endpoint, old_state, new_state)`` on every state change.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        policy: CircuitBreakerPolicy | None = None,
+        on_state_change: StateListener | None = None,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        :param endpoint: Endpoint URL the breaker guards
+        :param policy: Thresholds of the breaker
+        :param on_state_change: Optional listener called on every state change
+        """
+        self.endpoint = endpoint
+        self.policy = policy or CircuitBreakerPolicy()
+        self.state = CircuitState.CLOSED
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=self.policy.window_size)
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._listeners: list[StateListener] = [on_state_change] if on_state_change else []
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Add a state change listener.
+
+        :param listener: Callable receiving (endpoint, old_state, new_state)
+        """
+        self._listeners.append(listener)
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, reserving a probe slot when half-open.
+
+        :return: True if the request may be sent
+        """
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self._opened_at < self.policy.open_duration:
+                return False
+            self._transition(CircuitState.HALF_OPEN)
+        if self.state == CircuitState.HALF_OPEN:
+            if self._probes >= self.policy.half_open_max_calls:
+                return False
+            self._probes += 1
+        return True
+
+    def record(self, failed: bool, duration: float = 0.0) -> None:
+        """Record the outcome of a request allowed by :meth:`allow_request`.
+
+        :param failed: Whether the request failed
+        :param duration: Duration of the request in seconds
+        """
+        slow = self.policy.slow_call_duration is not None and duration >= self.policy.slow_call_duration
+        if self.state == CircuitState.HALF_OPEN:
+            if failed or slow:
+                self._open()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.policy.half_open_max_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+        if self.state != CircuitState.CLOSED:
+            return
+
+        self._outcomes.append((failed, slow))
+        calls = len(self._outcomes)
+        if calls < self.policy.minimum_calls:
+            return
+        failures = sum(1 for failed, _ in self._outcomes if failed)
+        slow_calls = sum(1 for _, slow in self._outcomes if slow)
+        if (
+            failures / calls >= self.policy.failure_rate_threshold
+            or (self.policy.slow_call_duration is not None
+                and slow_calls / calls >= self.policy.slow_call_rate_threshold)
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Release a probe slot of a request that ended without an outcome (e.g. cancelled)."""
+        if self.state == CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    async def call(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Send a request through the breaker.
+
+        Network errors, 429 and 5xx responses are recorded as failures.
+
+        :param send: Callable sending the request
+        :return: HTTP response
+        """
+        if not self.allow_request():
+            remaining = max(0.0, self.policy.open_duration - (time.monotonic() - self._opened_at))
+            raise CircuitOpenError(
+                f"Circuit breaker for {self.endpoint} is {self.state}, retry in {remaining:.1f}s.",
+            )
+        start = time.monotonic()
+        recorded = False
+        try:
+            response = await send()
+            status_code = response.status_code
+            recorded = True
+            self.record(status_code == 429 or status_code >= 500, time.monotonic() - start)
+            return response
+        except httpx.RequestError:
+            recorded = True
+            self.record(True, time.monotonic() - start)
+            raise
+        finally:
+            if not recorded:
+                self.release()
+
+    def reset(self) -> None:
+        """Close the circuit and forget the recorded outcomes."""
+        self._outcomes.clear()
+        self._transition(CircuitState.CLOSED)
+
+    def _open(self) -> None:
+        """Open the circuit."""
+        self._opened_at = time.monotonic()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: str) -> None:
+        """Change the state and notify the listeners."""
+        old_state = self.state
+        self.state = state
+        self._probes = 0
+        self._probe_successes = 0
+        if state == CircuitState.CLOSED:
+            self._outcomes.clear()
+        if old_state == state:
+            return
+        logger.warning(f"Circuit breaker for {self.endpoint} changed from {old_state} to {state}")
+        for listener in self._listeners:
+            try:
+                listener(self.endpoint, old_state, state)
+            except Exception as e:
+                logger.error(f"Circuit breaker listener failed: {e}")
+
+
+class CircuitBreakerRegistry:
+    """Process-wide registry of circuit breakers, one per endpoint URL."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._listeners: list[StateListener] = []
+
+    def get(self, endpoint: str, policy: CircuitBreakerPolicy | None = None) -> CircuitBreaker:
+        """Get the breaker of an endpoint, creating it with the given policy if needed.
+
+        :param endpoint: Endpoint URL
+        :param policy: Thresholds used if the breaker is created
+        :return: CircuitBreaker of the endpoint
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint, policy, on_state_change=self._notify)
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    def add_listener(self, listener: StateListener) -> None:
+        """Add a listener called on state changes of every breaker.
+
+        :param listener: Callable receiving (endpoint, old_state, new_state)
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StateListener) -> None:
+        """Remove a listener added with :meth:`add_listener`.
+
+        :param listener: Listener to remove
+        """
+        self._listeners.remove(listener)
+
+    def states(self) -> dict[str, str]:
+        """Return the state of every breaker by endpoint."""
+        return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        for breaker in self._breakers.values():
+            breaker.reset()
+
+    def _notify(self, endpoint: str, old_state: str, new_state: str) -> None:
+        """Forward a state change to the registry listeners."""
+        for listener in list(self._listeners):
+            listener(endpoint, old_state, new_state)
+
+
+default_circuit_breakers = CircuitBreakerRegistry()
+
+
+def circuit_breaker_for(config: AsgardeoConfig, endpoint: str) -> CircuitBreaker | None:
+    """Return the shared breaker of an endpoint if circuit breaking is enabled.
+
+    :param config: AsgardeoConfig instance with the circuit breaker policy
+    :param endpoint: Endpoint URL
+    :return: CircuitBreaker, or None if config.circuit_breaker is not set
+    """
+    if config.circuit_breaker is None:
+        return None
+    return default_circuit_breakers.get(endpoint, config.circuit_breaker)
@@ -0,0 +1,364 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""In-memory token caches."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from ..models import OAuthToken
+from .store import TokenStore, decode_key, encode_key
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_scopes(scopes: str | Iterable[str] | None) -> tuple[str, ...]:
+    """Normalize a scope string or list of scopes into a sorted, de-duplicated tuple.
+
+    :param scopes: Space separated scope string or an iterable of scopes
+    :return: Tuple of unique scopes in sorted order
+    """
+    if not scopes:
+        return ()
+    if isinstance(scopes, str):
+        scopes = scopes.split()
+    return tuple(sorted({scope for scope in scopes if scope}))
+
+
+class TokenCache:
+    """LRU cache of OAuth tokens that honours the token ``expires_in``.
+
+    A cached token is treated as expired ``skew`` seconds before its real expiry so
+    that callers never receive a token the IdP is about to reject. Until its real
+    expiry it can still be read with ``stale_ok`` (e.g. while the IdP is unavailable).
+    Tokens without an ``expires_in`` are not cached since their lifetime is unknown.
+    A ``maxsize`` of 0 disables caching.
+
+    With a TokenStore, cached tokens are written through to the store and a new cache
+    is warmed from it, so restarted processes reuse tokens instead of requesting new
+    ones. Keys must then be strings, numbers or (nested) tuples of them.
+    """
+
+    def __init__(self, maxsize: int = 1024, skew: float = 30.0, store: TokenStore | None = None) -> None:
+        """Initialize the token cache.
+
+        :param maxsize: Maximum number of tokens to keep before evicting the least recently used
+        :param skew: Seconds subtracted from the token lifetime as a safety margin
+        :param store: Optional persistent store the cache is warmed from and written through to
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative.")
+        if skew < 0:
+            raise ValueError("skew must not be negative.")
+        self.maxsize = maxsize
+        self.skew = skew
+        self._entries: OrderedDict[Hashable, tuple[OAuthToken, float, float]] = OrderedDict()
+        self.store = store
+        if store is not None:
+            self.warm()
+
+    def warm(self) -> int:
+        """Load the tokens of the store that have not expired into the cache.
+
+        :return: Number of loaded tokens
+        """
+        if self.store is None:
+            return 0
+        loaded = 0
+        now = time.time()
+        for key, token, expires_at in self.store.items():
+            try:
+                key = decode_key(key)
+            except ValueError:
+                continue
+            if self._put(key, token, expires_at - now):
+                loaded += 1
+        return loaded
+
+    def get(self, key: Hashable, stale_ok: bool = False) -> OAuthToken | None:
+        """Return the cached token for a key if it is still valid.
+
+        :param key: Cache key
+        :param stale_ok: Also return a token within the skew of its expiry
+        :return: Cached OAuthToken or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        token, refresh_at, expires_at = entry
+        now = time.monotonic()
+        if now >= expires_at:
+            del self._entries[key]
+            return None
+        if now >= refresh_at and not stale_ok:
+            return None
+        self._entries.move_to_end(key)
+        return token
+
+    def set(self, key: Hashable, token: OAuthToken) -> None:
+        """Cache a token under a key.
+
+        :param key: Cache key
+        :param token: Token to cache
+        """
+        if not token.expires_in:
+            return
+        if self._put(key, token, token.expires_in) and self.store is not None:
+            try:
+                self.store.set(encode_key(key), token, time.time() + token.expires_in)
+            except TypeError as e:
+                logger.debug(f"Not storing token with a key that cannot be encoded: {e}")
+
+    async def fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[OAuthToken]],
+        force: bool = False,
+    ) -> OAuthToken:
+        """Get a new token with fetch and cache it under a key.
+
+        Subclasses sharing tokens with other processes override this to avoid fetching
+        a token another process has just obtained.
+
+        :param key: Cache key
+        :param fetch: Callable requesting a new token
+        :param force: Request a new token even if one is cached
+        :return: New token
+        """
+        token = await fetch()
+        self.set(key, token)
+        return token
+
+    def _put(self, key: Hashable, token: OAuthToken, remaining: float) -> bool:
+        """Cache a token for its remaining lifetime, returning whether it was cached."""
+        lifetime = remaining - self.skew
+        if self.maxsize == 0 or lifetime <= 0:
+            return False
+        now = time.monotonic()
+        self._entries[key] = (token, now + lifetime, now + remaining)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a key from the cache.
+
+        :param key: Cache key
+        """
+        self._entries.pop(key, None)
+        self._delete_stored(key)
+
+    def discard_token(self, token: str) -> None:
+        """Remove every entry holding a token as its access or refresh token.
+
+        :param token: Access or refresh token (e.g. after it has been revoked)
+        """
+        self._discard_stored(self._discard_entries({token}), {token})
+
+    async def discard_tokens(self, tokens: Iterable[str]) -> None:
+        """Remove every entry holding one of the tokens, e.g. after a bulk revocation.
+
+        The stored copies are deleted in a worker thread, so the event loop is not
+        blocked on the store.
+
+        :param tokens: Access or refresh tokens
+        """
+        tokens = set(tokens)
+        stale = self._discard_entries(tokens)
+        if self.store is not None:
+            await asyncio.to_thread(self._discard_stored, stale, tokens)
+
+    def _discard_entries(self, tokens: Iterable[str]) -> list[Hashable]:
+        """Remove the memory entries holding one of the tokens and return their keys."""
+        stale = [
+            key for key, (cached, _, _) in self._entries.items()
+            if cached.access_token in tokens or cached.refresh_token in tokens
+        ]
+        for key in stale:
+            del self._entries[key]
+        return stale
+
+    def _discard_stored(self, keys: list[Hashable], tokens: Iterable[str]) -> None:
+        """Remove the stored copies of discarded entries."""
+        for key in keys:
+            self._delete_stored(key)
+
+    def clear(self) -> None:
+        """Remove all cached tokens, including their stored copies."""
+        for key in self._entries:
+            self._delete_stored(key)
+        self._entries.clear()
+
+    def flush(self) -> None:
+        """Persist the writes buffered by the store, e.g. before the process exits."""
+        if self.store is not None:
+            self.store.flush()
+
+    def _delete_stored(self, key: Hashable) -> None:
+        """Remove the stored copy of a key."""
+        if self.store is not None:
+            try:
+                self.store.delete(encode_key(key))
+            except TypeError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key) is not None
+
+
+@dataclass
+class CacheStats:
+    """Hit-rate statistics of a cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+    memory_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ClaimsCache:
+    """Bounded cache of validated token claims keyed by a digest of the token.
+
+    Entries expire at the token ``exp`` claim and are evicted least recently used first
+    once either ``maxsize`` entries or roughly ``max_bytes`` of claims are cached. The
+    raw token is never stored.
+    """
+
+    _ENTRY_OVERHEAD = 200
+
+    def __init__(self, maxsize: int = 10000, max_bytes: int | None = 16 * 1024 * 1024) -> None:
+        """Initialize the claims cache.
+
+        :param maxsize: Maximum number of cached tokens
+        :param max_bytes: Approximate memory budget for cached claims, None for no budget
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative.")
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, tuple[dict[str, Any], float, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._stats = CacheStats()
+
+    @staticmethod
+    def token_key(token: str, *scope: str | None) -> bytes:
+        """Return the cache key for a token.
+
+        :param token: Raw token
+        :param scope: Additional values the validation result depends on (e.g. audience)
+        :return: SHA-256 digest identifying the token
+        """
+        digest = hashlib.sha256(token.encode("utf-8"))
+        for value in scope:
+            digest.update(b"\0" + (value or "").encode("utf-8"))
+        return digest.digest()
+
+    def get(self, key: bytes) -> dict[str, Any] | None:
+        """Return the cached claims for a key if the token has not expired.
+
+        :param key: Key from :meth:`token_key`
+        :return: Copy of the cached claims or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        claims, expires_at, size = entry
+        if time.time() >= expires_at:
+            self._remove(key)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return dict(claims)
+
+    def set(self, key: bytes, claims: dict[str, Any], ttl: float | None = None) -> None:
+        """Cache validated claims until the token expires.
+
+        :param key: Key from :meth:`token_key`
+        :param claims: Validated claims, cached until their ``exp`` claim
+        :param ttl: Optional maximum lifetime in seconds, required if claims have no ``exp``
+        """
+        now = time.time()
+        exp = claims.get("exp")
+        exp = float(exp) if isinstance(exp, (int, float)) else None
+        if ttl is not None:
+            exp = min(exp, now + ttl) if exp is not None else now + ttl
+        if self.maxsize == 0 or exp is None or exp <= now:
+            return
+        size = len(json.dumps(claims, default=str)) + self._ENTRY_OVERHEAD
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (dict(claims), exp, size)
+        self._memory_bytes += size
+        while len(self._entries) > self.maxsize or (
+            self.max_bytes is not None and self._memory_bytes > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def invalidate(self, key: bytes) -> None:
+        """Remove a key from the cache.
+
+        :param key: Key from :meth:`token_key`
+        """
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all cached claims."""
+        self._entries.clear()
+        self._memory_bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the cache statistics."""
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            expirations=self._stats.expirations,
+            size=len(self._entries),
+            memory_bytes=self._memory_bytes,
+        )
+
+    def _remove(self, key: bytes) -> None:
+        """Remove an entry and release its memory budget."""
+        _, _, size = self._entries.pop(key)
+        self._memory_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -16,8 +16,13 @@ under the License.
 
 """Async Asgardeo authentication and token clients."""
 
+import asyncio
+import dataclasses
 import json
 import logging
+import time
+import uuid
+from collections.abc import Iterable
 from typing import Any
 from urllib.parse import urlencode
 
@@ -27,26 +32,55 @@ from ..models import (
     AsgardeoConfig,
     AsgardeoError,
     AuthenticationError,
+    CircuitOpenError,
+    FlowState,
     FlowStatus,
+    GrantType,
     NetworkError,
     OAuthToken,
+    RetryPolicy,
+    RevocationResult,
     TokenError,
+    TokenType,
     ValidationError,
 )
+from .breaker import circuit_breaker_for
+from .cache import ClaimsCache
+from .discovery import default_provider_metadata, provider_metadata_for
+from .flow import FlowStateSigner
+from .jwt import load_private_key, sign_jwt
+from .ratelimit import rate_limiter_for
+from .retry import send_with_retry
+from .singleflight import SingleFlight
+from .telemetry import Metric, instrumentation_for, traced
+from .transport import SessionProvider, default_session_provider
+from .util import generate_pkce_pair
 
 logger = logging.getLogger(__name__)
 
+CLIENT_ASSERTION_TYPE = "urn:ietf:params:oauth:client-assertion-type:jwt-bearer"
+
 class AsgardeoNativeAuthClient:
     """Async client for handling Asgardeo App Native Authentication flows.
 
     This client manages the authentication process without browser redirects and keeps track of the flow status.
-    It also creates an internal TokenClient for token operations.
+    It also creates an internal TokenClient for token operations unless one is provided.
+    The stateless :meth:`authenticate_flow` API keeps no per-flow state on the client, so
+    one client can serve any number of concurrent flows and any worker can continue a
+    flow from its serialized FlowState.
     """
 
-    def __init__(self, config: AsgardeoConfig) -> None:
+    def __init__(
+        self,
+        config: AsgardeoConfig,
+        token_client: "AsgardeoTokenClient | None" = None,
+        session_provider: SessionProvider | None = None,
+    ) -> None:
         """Initialize the Auth Client.
 
         :param config: AsgardeoConfig instance with configuration
+        :param token_client: Optional token client to use (it is not closed with this client)
+        :param session_provider: Optional provider of the shared HTTP session (defaults to the process-wide provider)
         """
         self.config = config
         self.base_url = config.base_url.rstrip("/")
@@ -54,29 +88,40 @@ class AsgardeoNativeAuthClient:
             "Accept": "application/json",
             "Content-Type": "application/x-www-form-urlencoded",
         }
-        self.session = httpx.AsyncClient()
+        self.session_provider = session_provider or default_session_provider
+        self.session = self.session_provider.acquire(config)
         self.flow_id: str | None = None
         self.flow_status: str | None = None
         self.next_step: dict[str, Any] | None = None
         self.auth_data: dict[str, Any] | None = None
-        self.token_client = AsgardeoTokenClient(config)
+        self._owns_token_client = token_client is None
+        self.token_client = token_client or AsgardeoTokenClient(
+            config,
+            session_provider=self.session_provider,
+        )
+        self._flow_signer: FlowStateSigner | None = None
+        self._closed = False
 
+    @traced("authorize")
     async def _initiate_auth(
         self,
         state: str | None = None,
         params: dict[str, Any] | None = None,
+        scope: str | None = None,
     ) -> dict[str, Any]:
         """Private method to initiate the authentication flow.
 
         :param state: Optional state parameter
+        :param params: Optional additional parameters of the initiation request
+        :param scope: Optional space separated scopes (defaults to config.scope)
         :return: Dictionary response from the initiation request
         """
-        url = f"{self.base_url}/oauth2/authorize"
+        url = (await provider_metadata_for(self.config, self.session)).authorization_endpoint
         data = {
             "client_id": self.config.client_id,
             "response_type": "code",
             "redirect_uri": self.config.redirect_uri,
-            "scope": self.config.scope,
+            "scope": scope or self.config.scope,
             "response_mode": "direct",
         }
 
@@ -89,26 +134,36 @@ class AsgardeoNativeAuthClient:
             data.update(params)
 
         try:
-            response = await self.session.post(
-                url,
-                headers=self.headers,
-                data=urlencode(data),
+            response = await send_with_retry(
+                self.config.retry_policy,
+                lambda: self.session.post(
+                    url,
+                    headers=self.headers,
+                    data=urlencode(data),
+                ),
+                breaker=circuit_breaker_for(self.config, url),
+                limiter=rate_limiter_for(self.config, "authorize", url),
+                instrumentation=instrumentation_for(self.config),
+                endpoint="authorize",
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
             raise AuthenticationError(
                 f"Authentication initiation failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
             )
         except httpx.RequestError as e:
             raise NetworkError(
                 f"Network error during authentication initiation: {e!s}",
             )
+        except CircuitOpenError:
+            raise
         except Exception as e:
             raise AsgardeoError(
                 f"Unexpected error during authentication initiation: {e!s}",
             )
 
+    @traced("authn")
     async def _perform_auth_step(
         self,
         flow_id: str,
@@ -124,7 +179,7 @@ class AsgardeoNativeAuthClient:
         :param scenario: Optional scenario
         :return: Dictionary response from the authentication step
         """
-        url = f"{self.base_url}/oauth2/authn"
+        url = (await provider_metadata_for(self.config, self.session)).authn_endpoint
         body = {
             "flowId": flow_id,
         }
@@ -137,19 +192,31 @@ class AsgardeoNativeAuthClient:
 
         headers = {"Content-Type": "application/json"}
         try:
-            response = await self.session.post(
-                url,
-                headers=headers,
-                data=json.dumps(body),
+            # Authentication steps submit credentials and advance the flow, so they are
+            # only retried when the request did not reach the server.
+            response = await send_with_retry(
+                self.config.retry_policy,
+                lambda: self.session.post(
+                    url,
+                    headers=headers,
+                    data=json.dumps(body),
+                ),
+                idempotent=False,
+                breaker=circuit_breaker_for(self.config, url),
+                limiter=rate_limiter_for(self.config, "authn", url),
+                instrumentation=instrumentation_for(self.config),
+                endpoint="authn",
             )
-            response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
             raise AuthenticationError(
                 f"Authentication step failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
             )
         except httpx.RequestError as e:
             raise NetworkError(f"Network error during authentication step: {e!s}")
+        except CircuitOpenError:
+            raise
         except Exception as e:
             raise AsgardeoError(
                 f"Unexpected error during authentication step: {e!s}",
@@ -162,6 +229,7 @@ class AsgardeoNativeAuthClient:
         params: dict[str, Any] | None = None,
         scenario: str | None = None,
         state: str | None = None,
+        scope: str | None = None,
     ) -> dict[str, Any]:
         """Unified authentication function. If flow_id is not provided, uses the internal flow_id if available.
 
@@ -173,11 +241,12 @@ class AsgardeoNativeAuthClient:
         :param params: Dictionary of parameters for the authenticator (e.g., {'username': 'user', 'password': 'pass'})
         :param scenario: Optional scenario, e.g., 'PROCEED_PUSH_AUTHENTICATION' for push notifications
         :param state: Optional state parameter (for initiation)
+        :param scope: Optional space separated scopes (for initiation, defaults to config.scope)
         :return: Dictionary response with flowId, flowStatus, nextStep, etc. (or authData if completed)
         """
         if flow_id is None and self.flow_id is None:
             # Initiation
-            resp_json = await self._initiate_auth(state, params)
+            resp_json = await self._initiate_auth(state, params, scope)
         else:
             # Authentication step
             effective_flow_id = flow_id or self.flow_id
@@ -204,6 +273,98 @@ class AsgardeoNativeAuthClient:
 
         return resp_json
 
+    async def authenticate_flow(
+        self,
+        flow_state: FlowState | str | None = None,
+        authenticator_id: str | None = None,
+        params: dict[str, Any] | None = None,
+        scenario: str | None = None,
+        state: str | None = None,
+        pkce: bool = False,
+        scope: str | None = None,
+    ) -> FlowState:
+        """Stateless variant of :meth:`authenticate`.
+
+        Initiates a flow when no flow state is given, else performs the next step of the
+        given flow. The client itself is not modified.
+
+        :param flow_state: FlowState, or a string from :meth:`dump_flow_state`, of the flow to continue
+        :param authenticator_id: Authenticator ID to use (required for steps after initiation)
+        :param params: Dictionary of parameters for the authenticator
+        :param scenario: Optional scenario, e.g., 'PROCEED_PUSH_AUTHENTICATION' for push notifications
+        :param state: Optional state parameter (for initiation)
+        :param pkce: Initiate the flow with PKCE, the code verifier is kept in the flow state
+        :param scope: Optional space separated scopes (for initiation, defaults to config.scope)
+        :return: FlowState after the request
+        """
+        if isinstance(flow_state, str):
+            flow_state = self.load_flow_state(flow_state)
+
+        if flow_state is None or flow_state.flow_id is None:
+            code_verifier = None
+            if pkce:
+                code_verifier, code_challenge = generate_pkce_pair()
+                params = {**(params or {}), "code_challenge": code_challenge, "code_challenge_method": "S256"}
+            resp_json = await self._initiate_auth(state, params, scope)
+            flow_id = None
+        else:
+            code_verifier = flow_state.code_verifier
+            flow_id = flow_state.flow_id
+            resp_json = await self._perform_auth_step(flow_id, authenticator_id, params, scenario)
+
+        flow_status = resp_json.get("flowStatus")
+        return FlowState(
+            flow_id=resp_json.get("flowId", flow_id),
+            flow_status=flow_status,
+            next_step=resp_json.get("nextStep"),
+            auth_data=resp_json.get("authData") if flow_status == FlowStatus.SUCCESS_COMPLETED else None,
+            code_verifier=code_verifier,
+        )
+
+    async def get_flow_token(self, flow_state: FlowState | str) -> OAuthToken:
+        """Exchange the authorization code of a completed stateless flow for tokens.
+
+        :param flow_state: FlowState, or a string from :meth:`dump_flow_state`, of a completed flow
+        :return: OAuthToken instance with access_token, id_token, etc.
+        """
+        if isinstance(flow_state, str):
+            flow_state = self.load_flow_state(flow_state)
+        if not flow_state.auth_data or "code" not in flow_state.auth_data:
+            raise TokenError(
+                "Authentication not completed or no authorization code available.",
+            )
+        kwargs = {"code": flow_state.auth_data["code"]}
+        if flow_state.code_verifier:
+            kwargs["code_verifier"] = flow_state.code_verifier
+        return await self.token_client.get_token("authorization_code", **kwargs)
+
+    def dump_flow_state(self, flow_state: FlowState) -> str:
+        """Serialize a flow state into a compact string signed with config.flow_state_secret.
+
+        :param flow_state: Flow state to serialize
+        :return: Signed string accepted by :meth:`authenticate_flow` on any worker
+        """
+        return self._get_flow_signer().dumps(flow_state)
+
+    def load_flow_state(self, value: str) -> FlowState:
+        """Verify and deserialize a string from :meth:`dump_flow_state`.
+
+        :param value: Signed flow state string
+        :return: Flow state
+        """
+        return self._get_flow_signer().loads(value)
+
+    def _get_flow_signer(self) -> FlowStateSigner:
+        """Return the flow state signer, created from the configuration on first use."""
+        if self._flow_signer is None:
+            if not self.config.flow_state_secret:
+                raise ValidationError("config.flow_state_secret is required to serialize flow state.")
+            self._flow_signer = FlowStateSigner(
+                self.config.flow_state_secret,
+                self.config.flow_state_max_age,
+            )
+        return self._flow_signer
+
     async def get_token(self) -> OAuthToken:
         """Convenience method to exchange the authorization code for tokens after successful authentication.
 
@@ -238,20 +399,25 @@ class AsgardeoNativeAuthClient:
 
     async def close(self):
         """Close the auth client and cleanup resources."""
-        await self.session.aclose()
-        await self.token_client.close()
+        if self._closed:
+            return
+        self._closed = True
+        await self.session_provider.release(self.session)
+        if self._owns_token_client:
+            await self.token_client.close()
 
     async def authenticate_with_password(
-        self, username: str, password: str
+        self, username: str, password: str, scope: str | None = None
     ) -> OAuthToken:
         """Complete authentication flow with username/password in one call.
 
         :param username: Username for authentication
         :param password: Password for authentication
+        :param scope: Optional space separated scopes (defaults to config.scope)
         :return: OAuthToken instance with tokens
         """
         # Start authentication flow
-        await self.authenticate()
+        await self.authenticate(scope=scope)
 
         # Complete with credentials
         await self.authenticate(
@@ -271,33 +437,53 @@ class AsgardeoNativeAuthClient:
 class AsgardeoTokenClient:
     """Async client for handling token operations in Asgardeo.
 
-    This client manages token exchange and refresh.
+    This client manages token exchange, refresh, revocation and introspection.
     """
 
-    def __init__(self, config: AsgardeoConfig) -> None:
+    def __init__(
+        self,
+        config: AsgardeoConfig,
+        session_provider: SessionProvider | None = None,
+    ) -> None:
         """Initialize the Token Client.
 
         :param config: AsgardeoConfig instance with configuration
+        :param session_provider: Optional provider of the shared HTTP session (defaults to the process-wide provider)
         """
         self.config = config
         self.base_url = config.base_url.rstrip("/")
         self.headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        self.session = httpx.AsyncClient()
+        self.session_provider = session_provider or default_session_provider
+        self.session = self.session_provider.acquire(config)
+        self._singleflight = SingleFlight()
+        self.introspection_cache = ClaimsCache()
+        # Introspections in flight per token digest, and the digests revoked meanwhile,
+        # whose possibly outdated introspection results must not be cached.
+        self._introspecting: dict[bytes, int] = {}
+        self._revoked_while_introspecting: set[bytes] = set()
+        self._private_key = None
+        self._closed = False
 
     async def get_token(self, grant_type: str, **kwargs: Any) -> OAuthToken:
         """Unified token request function for various grant types.
 
-        :param grant_type: The grant type (e.g., 'authorization_code', 'refresh_token')
+        Concurrent identical requests (same grant, credentials and scopes) share a single
+        HTTP call and all receive its result or its exception.
+
+        :param grant_type: The grant type (e.g., 'authorization_code', 'refresh_token', 'client_credentials',
+            or GrantType.TOKEN_EXCHANGE)
         :param kwargs: Additional parameters based on grant type:
             - For 'authorization_code': code (required), redirect_uri (optional, uses config.redirect_uri if not provided)
             - For 'refresh_token': refresh_token (required), scope (optional)
+            - For 'client_credentials': scope (optional)
+            - For GrantType.TOKEN_EXCHANGE (RFC 8693): subject_token (required), subject_token_type (optional,
+              defaults to TokenType.ACCESS_TOKEN), actor_token, actor_token_type, requested_token_type,
+              audience, resource and scope (optional)
         :return: OAuthToken instance with access_token, id_token, etc.
         """
-        url = f"{self.base_url}/oauth2/token"
         data = {"grant_type": grant_type, "client_id": self.config.client_id}
-
-        if self.config.client_secret and "code_verifier" not in kwargs:
-            data["client_secret"] = self.config.client_secret
+        # PKCE requests are sent as a public client without client authentication.
+        authenticate = "code_verifier" not in kwargs
 
         if grant_type == "authorization_code":
             code = kwargs.get("code")
@@ -321,16 +507,65 @@ class AsgardeoTokenClient:
             scope = kwargs.get("scope")
             if scope:
                 data["scope"] = scope
+        elif grant_type == "client_credentials":
+            if not self.config.client_secret and not self.config.private_key:
+                raise ValidationError(
+                    "A client secret or private key is required for 'client_credentials' grant type.",
+                )
+            scope = kwargs.get("scope")
+            if scope:
+                data["scope"] = scope
+        elif grant_type == GrantType.TOKEN_EXCHANGE:
+            subject_token = kwargs.get("subject_token")
+            if not subject_token:
+                raise ValidationError(
+                    "Subject token is required for token exchange grant type.",
+                )
+            data["subject_token"] = subject_token
+            data["subject_token_type"] = kwargs.get("subject_token_type") or TokenType.ACCESS_TOKEN
+            actor_token = kwargs.get("actor_token")
+            if actor_token:
+                data["actor_token"] = actor_token
+                data["actor_token_type"] = kwargs.get("actor_token_type") or TokenType.ACCESS_TOKEN
+            for name in ("requested_token_type", "audience", "resource", "scope"):
+                if kwargs.get(name):
+                    data[name] = kwargs[name]
         else:
             raise ValidationError(f"Unsupported grant type: {grant_type}")
 
+        return await self._singleflight.do(
+            (authenticate, *sorted(data.items())),
+            lambda: self._request_token(data, authenticate),
+        )
+
+    @traced("token")
+    async def _request_token(self, data: dict[str, Any], authenticate: bool = True) -> OAuthToken:
+        """Private method to send a token request to the token endpoint.
+
+        :param data: Form parameters of the token request
+        :param authenticate: Whether to add the client authentication parameters
+        :return: OAuthToken instance with access_token, id_token, etc.
+        """
+        url = (await provider_metadata_for(self.config, self.session)).token_endpoint
+        # Authorization codes are single use and refresh tokens may be rotated, so these
+        # grants are only retried when the request did not reach the server.
+        idempotent = data["grant_type"] not in (GrantType.AUTHORIZATION_CODE, GrantType.REFRESH_TOKEN)
+
+        def send():
+            # Client assertions are single use, so each attempt gets a fresh one.
+            form = {**data, **self._client_auth_data()} if authenticate else data
+            return self.session.post(url, headers=self.headers, data=urlencode(form))
+
         try:
-            response = await self.session.post(
-                url,
-                headers=self.headers,
-                data=urlencode(data),
+            response = await send_with_retry(
+                self.config.retry_policy,
+                send,
+                idempotent=idempotent,
+                breaker=circuit_breaker_for(self.config, url),
+                limiter=rate_limiter_for(self.config, "token", url),
+                instrumentation=instrumentation_for(self.config),
+                endpoint="token",
             )
-            response.raise_for_status()
             resp_json = response.json()
             return OAuthToken(
                 access_token=resp_json["access_token"],
@@ -338,15 +573,19 @@ class AsgardeoTokenClient:
                 refresh_token=resp_json.get("refresh_token"),
                 expires_in=resp_json.get("expires_in"),
                 scope=resp_json.get("scope"),
+                issued_token_type=resp_json.get("issued_token_type"),
             )
         except httpx.HTTPStatusError as e:
             raise TokenError(
                 f"Token request failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
             )
         except httpx.RequestError as e:
             raise NetworkError(f"Network error during token request: {e!s}")
         except KeyError as e:
             raise TokenError(f"Missing required field in token response: {e!s}")
+        except CircuitOpenError:
+            raise
         except Exception as e:
             raise AsgardeoError(f"Unexpected error during token request: {e!s}")
 
@@ -358,15 +597,249 @@ class AsgardeoTokenClient:
         """
         return await self.get_token("refresh_token", refresh_token=refresh_token)
 
+    def _client_auth_data(self) -> dict[str, Any]:
+        """Return the client authentication parameters for form requests.
+
+        Uses private_key_jwt when a private key is configured, else client_secret_post.
+        """
+        data = {"client_id": self.config.client_id}
+        if self.config.private_key:
+            data["client_assertion_type"] = CLIENT_ASSERTION_TYPE
+            data["client_assertion"] = self._client_assertion()
+        elif self.config.client_secret:
+            data["client_secret"] = self.config.client_secret
+        return data
+
+    def _client_assertion(self) -> str:
+        """Create a signed JWT client assertion for private_key_jwt authentication."""
+        if self._private_key is None:
+            self._private_key = load_private_key(self.config.private_key)
+        now = int(time.time())
+        claims = {
+            "iss": self.config.client_id,
+            "sub": self.config.client_id,
+            "aud": default_provider_metadata.cached(self.config).token_endpoint,
+            "jti": uuid.uuid4().hex,
+            "iat": now,
+            "exp": now + 300,
+        }
+        return sign_jwt(
+            claims,
+            self._private_key,
+            self.config.client_assertion_algorithm,
+            self.config.private_key_id,
+        )
+
+    async def revoke_token(
+        self,
+        token: str,
+        token_type_hint: str | None = "access_token",
+    ) -> bool:
+        """Revoke an access or refresh token.
+
+        Transient failures are retried according to config.retry_policy, as revoking a
+        token twice is harmless. Any cached introspection result for the token is
+        evicted, and results of introspections still in flight are not cached.
+
+        :param token: Token to revoke
+        :param token_type_hint: Type of the token ('access_token' or 'refresh_token')
+        :return: True if the token was revoked
+        """
+        await self._request_revocation(token, token_type_hint, self.config.retry_policy)
+        return True
+
+    @traced("revoke")
+    async def _request_revocation(
+        self,
+        token: str,
+        token_type_hint: str | None,
+        policy: RetryPolicy,
+        attempts: list[int] | None = None,
+    ) -> None:
+        """Private method to send a revocation request.
+
+        :param token: Token to revoke
+        :param token_type_hint: Optional type of the token
+        :param policy: Retry policy of the request
+        :param attempts: Optional one-element list counting the attempts sent
+        """
+        if not token:
+            raise ValidationError("Token is required for revocation.")
+        cache_key = ClaimsCache.token_key(token)
+        self.introspection_cache.invalidate(cache_key)
+
+        url = (await provider_metadata_for(self.config, self.session)).revocation_endpoint
+        data = {"token": token}
+        if token_type_hint:
+            data["token_type_hint"] = token_type_hint
+
+        def send():
+            if attempts is not None:
+                attempts[0] += 1
+            # Client assertions are single use, so each attempt gets a fresh one.
+            form = {**data, **self._client_auth_data()}
+            return self.session.post(url, headers=self.headers, data=urlencode(form))
+
+        try:
+            await send_with_retry(
+                policy,
+                send,
+                idempotent=True,
+                breaker=circuit_breaker_for(self.config, url),
+                limiter=rate_limiter_for(self.config, "revoke", url),
+                instrumentation=instrumentation_for(self.config),
+                endpoint="revoke",
+            )
+        except httpx.HTTPStatusError as e:
+            raise TokenError(
+                f"Token revocation failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
+            )
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error during token revocation: {e!s}")
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            raise AsgardeoError(f"Unexpected error during token revocation: {e!s}")
+
+        # Introspections that completed while the revocation was sent may have cached
+        # the token as active, and those still in flight must not do so.
+        self.introspection_cache.invalidate(cache_key)
+        if cache_key in self._introspecting:
+            self._revoked_while_introspecting.add(cache_key)
+
+    async def revoke_many(
+        self,
+        tokens: Iterable[str | tuple[str, str | None]],
+        concurrency: int = 20,
+        max_attempts: int | None = None,
+    ) -> list[RevocationResult]:
+        """Revoke many tokens concurrently over the shared connection pool.
+
+        Transient failures are retried according to config.retry_policy, like
+        :meth:`revoke_token`. Failures never raise, they are reported per token.
+
+        :param tokens: Tokens to revoke, either plain tokens or (token, token_type_hint) tuples
+        :param concurrency: Maximum number of revocation requests in flight
+        :param max_attempts: Maximum number of attempts per token, overriding the retry policy
+        :return: List of RevocationResult in the order of the given tokens
+        """
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(concurrency)
+        policy = self.config.retry_policy
+        if max_attempts is not None:
+            policy = dataclasses.replace(policy, max_attempts=max_attempts)
+
+        async def revoke(item: str | tuple[str, str | None]) -> RevocationResult:
+            token, token_type_hint = (item, "access_token") if isinstance(item, str) else item
+            attempts = [0]
+            try:
+                async with semaphore:
+                    await self._request_revocation(token, token_type_hint, policy, attempts)
+            except AsgardeoError as e:
+                return RevocationResult(token=token, revoked=False, attempts=attempts[0], error=str(e))
+            return RevocationResult(token=token, revoked=True, attempts=attempts[0])
+
+        return list(await asyncio.gather(*(revoke(item) for item in tokens)))
+
+    async def introspect_token(
+        self,
+        token: str,
+        token_type_hint: str | None = None,
+    ) -> dict[str, Any]:
+        """Introspect a token.
+
+        Results are cached for config.introspection_cache_ttl seconds, capped at the
+        token expiry, and concurrent introspections of the same token share one request.
+
+        :param token: Token to introspect
+        :param token_type_hint: Optional type of the token ('access_token' or 'refresh_token')
+        :return: Dictionary introspection response, with 'active' indicating token validity
+        """
+        if not token:
+            raise ValidationError("Token is required for introspection.")
+        cache_key = ClaimsCache.token_key(token)
+        result = self.introspection_cache.get(cache_key)
+        instrumentation = instrumentation_for(self.config)
+        if result is not None:
+            instrumentation.count(Metric.CACHE_HITS, attributes={"cache": "introspection"})
+            return result
+        instrumentation.count(Metric.CACHE_MISSES, attributes={"cache": "introspection"})
+
+        self._introspecting[cache_key] = self._introspecting.get(cache_key, 0) + 1
+        try:
+            result = await self._singleflight.do(
+                ("introspect", cache_key),
+                lambda: self._request_introspection(token, token_type_hint),
+            )
+        finally:
+            revoked = cache_key in self._revoked_while_introspecting
+            self._introspecting[cache_key] -= 1
+            if not self._introspecting[cache_key]:
+                del self._introspecting[cache_key]
+                self._revoked_while_introspecting.discard(cache_key)
+        if self.config.introspection_cache_ttl > 0 and not revoked:
+            self.introspection_cache.set(cache_key, result, ttl=self.config.introspection_cache_ttl)
+        return dict(result)
+
+    @traced("introspect")
+    async def _request_introspection(
+        self,
+        token: str,
+        token_type_hint: str | None,
+    ) -> dict[str, Any]:
+        """Private method to send an introspection request.
+
+        :param token: Token to introspect
+        :param token_type_hint: Optional type of the token
+        :return: Dictionary introspection response
+        """
+        url = (await provider_metadata_for(self.config, self.session)).introspection_endpoint
+        data = {"token": token}
+        if token_type_hint:
+            data["token_type_hint"] = token_type_hint
+        try:
+            response = await send_with_retry(
+                self.config.retry_policy,
+                lambda: self.session.post(
+                    url,
+                    headers=self.headers,
+                    data=urlencode({**data, **self._client_auth_data()}),
+                ),
+                breaker=circuit_breaker_for(self.config, url),
+                limiter=rate_limiter_for(self.config, "introspect", url),
+                instrumentation=instrumentation_for(self.config),
+                endpoint="introspect",
+            )
+            resp_json = response.json()
+            if "active" not in resp_json:
+                raise TokenError("Missing required field in introspection response: 'active'")
+            return resp_json
+        except httpx.HTTPStatusError as e:
+            raise TokenError(
+                f"Token introspection failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
+            )
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error during token introspection: {e!s}")
+        except (TokenError, CircuitOpenError):
+            raise
+        except Exception as e:
+            raise AsgardeoError(f"Unexpected error during token introspection: {e!s}")
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.session.aclose()
+        await self.close()
         return False
 
     async def close(self):
         """Close the token client and cleanup resources."""
-        await self.session.aclose()
+        if self._closed:
+            return
+        self._closed = True
+        await self.session_provider.release(self.session)
@@ -0,0 +1,259 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""OpenID Connect discovery and endpoint metadata caching."""
+
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from ..models import AsgardeoConfig, AsgardeoError, NetworkError
+from .retry import send_with_retry
+from .singleflight import SingleFlight
+from .telemetry import instrumentation_for
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_PATH = "/oauth2/token/.well-known/openid-configuration"
+
+# Seconds before a failed revalidation is retried while stale metadata is served.
+_FAILED_REVALIDATION_TTL = 30.0
+_MAX_AGE = re.compile(r"max-age\s*=\s*\"?(\d+)")
+
+
+@dataclass
+class ProviderMetadata:
+    """Endpoint URLs of a tenant, as published in its discovery document."""
+
+    issuer: str
+    authorization_endpoint: str
+    authn_endpoint: str
+    token_endpoint: str
+    revocation_endpoint: str
+    introspection_endpoint: str
+    jwks_uri: str
+    document: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_base_url(cls, base_url: str) -> "ProviderMetadata":
+        """Build the default endpoint URLs of a tenant.
+
+        :param base_url: Tenant base URL, e.g. https://api.asgardeo.io/t/<tenant>
+        :return: ProviderMetadata with the default Asgardeo endpoint paths
+        """
+        base_url = base_url.rstrip("/")
+        return cls(
+            issuer=f"{base_url}/oauth2/token",
+            authorization_endpoint=f"{base_url}/oauth2/authorize",
+            authn_endpoint=f"{base_url}/oauth2/authn",
+            token_endpoint=f"{base_url}/oauth2/token",
+            revocation_endpoint=f"{base_url}/oauth2/revoke",
+            introspection_endpoint=f"{base_url}/oauth2/introspect",
+            jwks_uri=f"{base_url}/oauth2/jwks",
+        )
+
+    @classmethod
+    def from_document(cls, document: dict[str, Any], base_url: str) -> "ProviderMetadata":
+        """Build the endpoint URLs from a discovery document.
+
+        Endpoints missing from the document fall back to the default paths. The App
+        Native Authentication endpoint is not part of the discovery document, it is
+        derived from the authorization endpoint.
+
+        :param document: Parsed discovery document
+        :param base_url: Tenant base URL used for missing endpoints
+        :return: ProviderMetadata of the tenant
+        """
+        if not isinstance(document, dict):
+            raise AsgardeoError("Invalid discovery document: expected a JSON object.")
+        defaults = cls.from_base_url(base_url)
+        authorization_endpoint = document.get("authorization_endpoint") or defaults.authorization_endpoint
+        authn_endpoint = defaults.authn_endpoint
+        if authorization_endpoint.endswith("/authorize"):
+            authn_endpoint = authorization_endpoint[: -len("/authorize")] + "/authn"
+        return cls(
+            issuer=document.get("issuer") or defaults.issuer,
+            authorization_endpoint=authorization_endpoint,
+            authn_endpoint=authn_endpoint,
+            token_endpoint=document.get("token_endpoint") or defaults.token_endpoint,
+            revocation_endpoint=document.get("revocation_endpoint") or defaults.revocation_endpoint,
+            introspection_endpoint=document.get("introspection_endpoint") or defaults.introspection_endpoint,
+            jwks_uri=document.get("jwks_uri") or defaults.jwks_uri,
+            document=document,
+        )
+
+
+@dataclass
+class _Entry:
+    """Cached discovery document with its validators."""
+
+    metadata: ProviderMetadata
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ProviderMetadataCache:
+    """Process-wide cache of tenant endpoint metadata.
+
+    With discovery enabled in the config, the discovery document of a tenant is fetched
+    once and shared by every client of the tenant. It is kept for the max-age of its
+    Cache-Control header (config.discovery_ttl if there is none) and then revalidated
+    with If-None-Match / If-Modified-Since, so an unchanged document costs a 304. If a
+    revalidation fails, the cached metadata is served until a later attempt succeeds.
+    Without discovery the default endpoint paths are returned.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: dict[str, _Entry] = {}
+        self._defaults: dict[str, ProviderMetadata] = {}
+        self._singleflight = SingleFlight()
+
+    async def get(self, config: AsgardeoConfig, session: httpx.AsyncClient) -> ProviderMetadata:
+        """Get the endpoint metadata of a tenant, fetching or revalidating it when needed.
+
+        :param config: AsgardeoConfig instance of the tenant
+        :param session: HTTP session used for the discovery request
+        :return: ProviderMetadata of the tenant
+        """
+        if not config.discovery:
+            return self.defaults(config)
+        url = discovery_url(config)
+        entry = self._entries.get(url)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            return entry.metadata
+        return await self._singleflight.do(url, lambda: self._fetch(config, session, url))
+
+    def cached(self, config: AsgardeoConfig) -> ProviderMetadata:
+        """Get the endpoint metadata of a tenant without any network request.
+
+        :param config: AsgardeoConfig instance of the tenant
+        :return: Cached metadata, possibly stale, or the defaults if none was fetched yet
+        """
+        if config.discovery:
+            entry = self._entries.get(discovery_url(config))
+            if entry is not None:
+                return entry.metadata
+        return self.defaults(config)
+
+    def defaults(self, config: AsgardeoConfig) -> ProviderMetadata:
+        """Get the default endpoint metadata of a tenant.
+
+        :param config: AsgardeoConfig instance of the tenant
+        :return: ProviderMetadata with the default endpoint paths
+        """
+        metadata = self._defaults.get(config.base_url)
+        if metadata is None:
+            metadata = ProviderMetadata.from_base_url(config.base_url)
+            self._defaults[config.base_url] = metadata
+        return metadata
+
+    def invalidate(self, config: AsgardeoConfig | None = None) -> None:
+        """Drop cached metadata, so that it is fetched again on the next use.
+
+        :param config: AsgardeoConfig of the tenant to drop, or None to drop all tenants
+        """
+        if config is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(discovery_url(config), None)
+
+    async def _fetch(self, config: AsgardeoConfig, session: httpx.AsyncClient, url: str) -> ProviderMetadata:
+        """Fetch or revalidate the discovery document of a tenant."""
+        entry = self._entries.get(url)
+        headers = {"Accept": "application/json"}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        instrumentation = instrumentation_for(config)
+        try:
+            with instrumentation.span("asgardeo.discovery", {"asgardeo.endpoint": "discovery"}):
+                response = await send_with_retry(
+                    config.retry_policy,
+                    lambda: session.get(url, headers=headers),
+                    instrumentation=instrumentation,
+                    endpoint="discovery",
+                )
+            metadata = ProviderMetadata.from_document(response.json(), config.base_url)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 304 and entry is not None:
+                entry.expires_at = time.monotonic() + _max_age(e.response, config.discovery_ttl)
+                entry.etag = e.response.headers.get("ETag", entry.etag)
+                return entry.metadata
+            error = AsgardeoError(
+                f"Discovery request failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
+            )
+        except httpx.RequestError as e:
+            error = NetworkError(f"Network error during discovery request: {e!s}")
+        except AsgardeoError as e:
+            error = e
+        except ValueError as e:
+            error = AsgardeoError(f"Invalid discovery document: {e!s}")
+        else:
+            self._entries[url] = _Entry(
+                metadata=metadata,
+                expires_at=time.monotonic() + _max_age(response, config.discovery_ttl),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            return metadata
+
+        if entry is None:
+            raise error
+        logger.warning(f"Discovery revalidation failed, using cached metadata: {error}")
+        entry.expires_at = time.monotonic() + min(config.discovery_ttl, _FAILED_REVALIDATION_TTL)
+        return entry.metadata
+
+
+default_provider_metadata = ProviderMetadataCache()
+
+
+def discovery_url(config: AsgardeoConfig) -> str:
+    """Return the discovery document URL of a tenant.
+
+    :param config: AsgardeoConfig instance of the tenant
+    :return: config.discovery_url, or the tenant's well-known openid-configuration URL
+    """
+    return config.discovery_url or f"{config.base_url.rstrip('/')}{DISCOVERY_PATH}"
+
+
+async def provider_metadata_for(config: AsgardeoConfig, session: httpx.AsyncClient) -> ProviderMetadata:
+    """Return the endpoint metadata of a tenant from the process-wide cache.
+
+    :param config: AsgardeoConfig instance of the tenant
+    :param session: HTTP session used if the discovery document has to be fetched
+    :return: ProviderMetadata of the tenant
+    """
+    return await default_provider_metadata.get(config, session)
+
+
+def _max_age(response: httpx.Response, default: float) -> float:
+    """Return the freshness lifetime of a response from its Cache-Control header."""
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match is None:
+        return default
+    return float(match.group(1))
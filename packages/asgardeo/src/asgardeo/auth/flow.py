@@ -0,0 +1,92 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Signed serialization of native authentication flow state."""
+
+import dataclasses
+import hashlib
+import hmac
+import json
+import time
+import zlib
+from collections.abc import Iterable
+
+from ..models import FlowState, ValidationError
+from .jwt import b64url_decode, b64url_encode
+
+
+class FlowStateSigner:
+    """Serializes FlowState values into compact, HMAC-SHA256 signed strings.
+
+    The state is compressed, not encrypted: it carries the flow id, the next step and
+    (when set) the PKCE code verifier, so it must only be handed to trusted parties such
+    as other workers or a server-side session. Several secrets can be given to rotate
+    keys, the first one signs and all of them verify.
+    """
+
+    def __init__(self, secrets: str | Iterable[str], max_age: float | None = 600.0) -> None:
+        """Initialize the signer.
+
+        :param secrets: Signing secret, or secrets with the current one first
+        :param max_age: Seconds after which a serialized state is rejected, None to never expire
+        """
+        secrets = [secrets] if isinstance(secrets, str) else list(secrets)
+        if not secrets or not all(secrets):
+            raise ValidationError("At least one non-empty flow state secret is required.")
+        self._keys = [secret.encode("utf-8") for secret in secrets]
+        self.max_age = max_age
+
+    def dumps(self, state: FlowState) -> str:
+        """Serialize and sign a flow state.
+
+        :param state: Flow state to serialize
+        :return: Compact signed string
+        """
+        if state.issued_at is None:
+            state = dataclasses.replace(state, issued_at=time.time())
+        data = {key: value for key, value in dataclasses.asdict(state).items() if value is not None}
+        payload = b64url_encode(zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8")))
+        return f"{payload}.{self._sign(self._keys[0], payload)}"
+
+    def loads(self, value: str) -> FlowState:
+        """Verify and deserialize a flow state.
+
+        :param value: String created by :meth:`dumps`
+        :return: Flow state
+        """
+        if not isinstance(value, str):
+            raise ValidationError("Malformed flow state: expected a string.")
+        payload, _, signature = value.rpartition(".")
+        # The value is client controlled, so signatures are compared as bytes: comparing
+        # non-ASCII strings would raise TypeError.
+        signature = signature.encode("utf-8")
+        if not payload or not any(
+            hmac.compare_digest(signature, self._sign(key, payload).encode("ascii")) for key in self._keys
+        ):
+            raise ValidationError("Invalid flow state signature.")
+        try:
+            data = json.loads(zlib.decompress(b64url_decode(payload)))
+            state = FlowState(**data)
+            issued_at = float(state.issued_at or 0)
+        except (ValueError, TypeError, zlib.error) as e:
+            raise ValidationError(f"Malformed flow state: {e!s}")
+        if self.max_age is not None and issued_at + self.max_age < time.time():
+            raise ValidationError("Flow state has expired.")
+        return state
+
+    @staticmethod
+    def _sign(key: bytes, payload: str) -> str:
+        """Return the signature of a payload."""
+        return b64url_encode(hmac.new(key, payload.encode("utf-8"), hashlib.sha256).digest())
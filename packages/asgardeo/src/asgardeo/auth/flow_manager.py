@@ -0,0 +1,274 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Tracking of many concurrent native authentication flows."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from ..models import AsgardeoConfig, FlowState, OAuthToken, ValidationError
+from .client import AsgardeoNativeAuthClient
+from .transport import SessionProvider
+
+logger = logging.getLogger(__name__)
+
+
+class _FlowEntry:
+    """Flow state with its expiry deadline."""
+
+    __slots__ = ("state", "deadline", "ttl")
+
+    def __init__(self, state: FlowState, deadline: float, ttl: float) -> None:
+        self.state = state
+        self.deadline = deadline
+        self.ttl = ttl
+
+
+class NativeAuthFlowManager:
+    """Runs many concurrent App Native Authentication flows over one shared client.
+
+    Flows are kept by flow id. Every step extends the flow's time to live, and flows
+    that see no step for ``ttl`` seconds are expired by a hashed timer wheel that
+    advances every ``resolution`` seconds, so expiry costs O(1) per flow. At most
+    ``max_flows`` flows are kept, the least recently active flow is evicted first.
+    """
+
+    def __init__(
+        self,
+        config: AsgardeoConfig,
+        client: AsgardeoNativeAuthClient | None = None,
+        session_provider: SessionProvider | None = None,
+        ttl: float = 300.0,
+        max_flows: int = 100000,
+        resolution: float = 1.0,
+        wheel_size: int = 512,
+        on_expire: Callable[[FlowState], None] | None = None,
+    ) -> None:
+        """Initialize the flow manager.
+
+        :param config: AsgardeoConfig instance with configuration
+        :param client: Optional native auth client to use (it is not closed with this manager)
+        :param session_provider: Optional provider of the shared HTTP session (defaults to the process-wide provider)
+        :param ttl: Seconds of inactivity after which a flow expires
+        :param max_flows: Maximum number of tracked flows
+        :param resolution: Seconds between timer wheel ticks, the precision of the expiry
+        :param wheel_size: Number of timer wheel slots
+        :param on_expire: Optional callback invoked with the state of every expired or evicted flow
+        """
+        if ttl <= 0 or resolution <= 0:
+            raise ValueError("ttl and resolution must be positive.")
+        if max_flows < 1 or wheel_size < 1:
+            raise ValueError("max_flows and wheel_size must be at least 1.")
+        self.config = config
+        self._owns_client = client is None
+        self.client = client or AsgardeoNativeAuthClient(config, session_provider=session_provider)
+        self.ttl = ttl
+        self.max_flows = max_flows
+        self.resolution = resolution
+        self.on_expire = on_expire
+        self._flows: OrderedDict[str, _FlowEntry] = OrderedDict()
+        self._counts: Counter = Counter()
+        self._wheel: list[set[str]] = [set() for _ in range(wheel_size)]
+        self._tick = 0
+        self._started_at = time.monotonic()
+        self._task: asyncio.Task | None = None
+
+    async def start_flow(
+        self,
+        state: str | None = None,
+        params: dict[str, Any] | None = None,
+        pkce: bool = False,
+        ttl: float | None = None,
+        scope: str | None = None,
+    ) -> FlowState:
+        """Initiate a new flow and start tracking it.
+
+        :param state: Optional state parameter
+        :param params: Optional parameters of the initiation request
+        :param pkce: Initiate the flow with PKCE
+        :param ttl: Optional time to live of this flow overriding the manager default
+        :param scope: Optional space separated scopes (defaults to config.scope)
+        :return: FlowState of the new flow
+        """
+        flow_state = await self.client.authenticate_flow(state=state, params=params, pkce=pkce, scope=scope)
+        if not flow_state.flow_id:
+            raise ValidationError("Authentication initiation response has no flow ID.")
+        self._track(flow_state, ttl or self.ttl)
+        return flow_state
+
+    async def continue_flow(
+        self,
+        flow_id: str,
+        authenticator_id: str | None = None,
+        params: dict[str, Any] | None = None,
+        scenario: str | None = None,
+    ) -> FlowState:
+        """Perform the next step of a tracked flow.
+
+        :param flow_id: Flow ID returned by :meth:`start_flow`
+        :param authenticator_id: Authenticator ID to use
+        :param params: Dictionary of parameters for the authenticator
+        :param scenario: Optional scenario
+        :return: FlowState after the step
+        """
+        entry = self._get_entry(flow_id)
+        flow_state = await self.client.authenticate_flow(
+            entry.state,
+            authenticator_id=authenticator_id,
+            params=params,
+            scenario=scenario,
+        )
+        if self._flows.get(flow_id) is entry:
+            self._update(flow_id, entry, flow_state)
+        return flow_state
+
+    async def complete_flow(self, flow_id: str) -> OAuthToken:
+        """Exchange the authorization code of a completed flow for tokens and stop tracking it.
+
+        :param flow_id: Flow ID of a successfully completed flow
+        :return: OAuthToken instance with access_token, id_token, etc.
+        """
+        entry = self._get_entry(flow_id)
+        token = await self.client.get_flow_token(entry.state)
+        self.discard(flow_id)
+        return token
+
+    def get(self, flow_id: str) -> FlowState | None:
+        """Return the state of a tracked flow.
+
+        :param flow_id: Flow ID
+        :return: FlowState, or None if the flow is unknown or has expired
+        """
+        entry = self._flows.get(flow_id)
+        if entry is None or entry.deadline <= time.monotonic():
+            return None
+        return entry.state
+
+    def discard(self, flow_id: str) -> None:
+        """Stop tracking a flow.
+
+        :param flow_id: Flow ID
+        """
+        entry = self._flows.pop(flow_id, None)
+        if entry is not None:
+            self._counts[entry.state.flow_status] -= 1
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of tracked flows by FlowStatus."""
+        return {status: count for status, count in self._counts.items() if count > 0}
+
+    def __len__(self) -> int:
+        return len(self._flows)
+
+    def _get_entry(self, flow_id: str) -> _FlowEntry:
+        """Return the live entry of a flow or raise ValidationError."""
+        entry = self._flows.get(flow_id)
+        if entry is None or entry.deadline <= time.monotonic():
+            raise ValidationError(f"Unknown or expired flow: {flow_id}")
+        return entry
+
+    def _track(self, flow_state: FlowState, ttl: float) -> None:
+        """Start tracking a new flow, evicting the least recently active flows if full."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        flow_id = flow_state.flow_id
+        self.discard(flow_id)
+        while len(self._flows) >= self.max_flows:
+            _, evicted = self._flows.popitem(last=False)
+            self._counts[evicted.state.flow_status] -= 1
+            self._notify(evicted.state)
+        entry = _FlowEntry(flow_state, time.monotonic() + ttl, ttl)
+        self._flows[flow_id] = entry
+        self._counts[flow_state.flow_status] += 1
+        self._schedule(flow_id, entry.deadline)
+
+    def _update(self, flow_id: str, entry: _FlowEntry, flow_state: FlowState) -> None:
+        """Store the state after a step and extend the flow's time to live."""
+        self._counts[entry.state.flow_status] -= 1
+        self._counts[flow_state.flow_status] += 1
+        entry.state = flow_state
+        # The wheel slot is not moved, the flow is rescheduled when its old slot fires.
+        entry.deadline = time.monotonic() + entry.ttl
+        self._flows.move_to_end(flow_id)
+
+    def _schedule(self, flow_id: str, deadline: float) -> None:
+        """Put a flow into the wheel slot of its deadline (or the furthest slot)."""
+        due_tick = math.ceil((deadline - self._started_at) / self.resolution)
+        ticks = min(max(due_tick - self._tick, 1), len(self._wheel) - 1 or 1)
+        self._wheel[(self._tick + ticks) % len(self._wheel)].add(flow_id)
+
+    def _advance(self) -> None:
+        """Process the wheel slots up to the current time."""
+        current = int((time.monotonic() - self._started_at) / self.resolution)
+        now = time.monotonic()
+        while self._tick < current:
+            self._tick += 1
+            slot = self._wheel[self._tick % len(self._wheel)]
+            if not slot:
+                continue
+            due = list(slot)
+            slot.clear()
+            for flow_id in due:
+                entry = self._flows.get(flow_id)
+                if entry is None:
+                    continue
+                if entry.deadline <= now:
+                    del self._flows[flow_id]
+                    self._counts[entry.state.flow_status] -= 1
+                    self._notify(entry.state)
+                else:
+                    self._schedule(flow_id, entry.deadline)
+
+    def _notify(self, flow_state: FlowState) -> None:
+        """Invoke the expiry callback."""
+        if self.on_expire is None:
+            return
+        try:
+            self.on_expire(flow_state)
+        except Exception as e:
+            logger.error(f"Flow expiry callback failed: {e}")
+
+    async def _run(self) -> None:
+        """Advance the timer wheel every tick."""
+        while True:
+            await asyncio.sleep(self.resolution)
+            self._advance()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+        return False
+
+    async def close(self):
+        """Stop expiring flows, forget all flows and cleanup resources."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._flows.clear()
+        self._counts.clear()
+        for slot in self._wheel:
+            slot.clear()
+        if self._owns_client:
+            await self.client.close()
@@ -0,0 +1,198 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""JSON Web Token (JWT) and JSON Web Key (JWK) helpers."""
+
+import base64
+import json
+from typing import Any
+
+from ..models import AsgardeoError, TokenValidationError, ValidationError
+
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, padding, rsa
+    from cryptography.hazmat.primitives.asymmetric.utils import (
+        decode_dss_signature,
+        encode_dss_signature,
+    )
+except ImportError:  # pragma: no cover - optional dependency
+    hashes = None
+
+_HASHES = {"256": "SHA256", "384": "SHA384", "512": "SHA512"}
+_CURVES = {"P-256": "SECP256R1", "P-384": "SECP384R1", "P-521": "SECP521R1"}
+SUPPORTED_ALGORITHMS = (
+    "RS256", "RS384", "RS512",
+    "PS256", "PS384", "PS512",
+    "ES256", "ES384", "ES512",
+)
+
+
+def _require_cryptography() -> None:
+    """Raise a helpful error if the optional cryptography package is missing."""
+    if hashes is None:
+        raise AsgardeoError(
+            "JWT support requires the 'cryptography' package, install it with 'pip install asgardeo[jwt]'.",
+        )
+
+
+def b64url_encode(data: bytes) -> str:
+    """Encode bytes as unpadded base64url."""
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def b64url_decode(data: str) -> bytes:
+    """Decode unpadded base64url."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _b64url_uint(data: str) -> int:
+    """Decode a base64url encoded unsigned big-endian integer."""
+    return int.from_bytes(b64url_decode(data), "big")
+
+
+def decode_jwt(token: str) -> tuple[dict[str, Any], dict[str, Any], bytes, bytes]:
+    """Split a compact JWS into its parts without verifying it.
+
+    :param token: Compact serialized JWT
+    :return: Tuple of (header, claims, signing_input, signature)
+    """
+    try:
+        header_b64, claims_b64, signature_b64 = token.split(".")
+        header = json.loads(b64url_decode(header_b64))
+        claims = json.loads(b64url_decode(claims_b64))
+        signature = b64url_decode(signature_b64)
+    except (ValueError, TypeError) as e:
+        raise TokenValidationError(f"Malformed JWT: {e!s}")
+    if not isinstance(header, dict) or not isinstance(claims, dict):
+        raise TokenValidationError("Malformed JWT: header and claims must be JSON objects.")
+    return header, claims, f"{header_b64}.{claims_b64}".encode("ascii"), signature
+
+
+def public_key_from_jwk(jwk: dict[str, Any]) -> Any:
+    """Load a public key from an RSA or EC JSON Web Key.
+
+    :param jwk: JSON Web Key
+    :return: cryptography public key
+    """
+    _require_cryptography()
+    kty = jwk.get("kty")
+    if kty == "RSA":
+        return rsa.RSAPublicNumbers(_b64url_uint(jwk["e"]), _b64url_uint(jwk["n"])).public_key()
+    if kty == "EC":
+        curve = getattr(ec, _CURVES[jwk["crv"]])()
+        return ec.EllipticCurvePublicNumbers(
+            _b64url_uint(jwk["x"]),
+            _b64url_uint(jwk["y"]),
+            curve,
+        ).public_key()
+    raise ValidationError(f"Unsupported JWK key type: {kty}")
+
+
+def verify_signature(key: Any, algorithm: str, signing_input: bytes, signature: bytes) -> None:
+    """Verify a JWS signature.
+
+    :param key: cryptography public key
+    :param algorithm: JWS algorithm (e.g. 'RS256')
+    :param signing_input: Signed part of the JWT
+    :param signature: Decoded signature
+    """
+    _require_cryptography()
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise TokenValidationError(f"Unsupported JWT algorithm: {algorithm}")
+    hash_algorithm = getattr(hashes, _HASHES[algorithm[2:]])()
+    try:
+        if algorithm.startswith("RS"):
+            key.verify(signature, signing_input, padding.PKCS1v15(), hash_algorithm)
+        elif algorithm.startswith("PS"):
+            key.verify(
+                signature,
+                signing_input,
+                padding.PSS(mgf=padding.MGF1(hash_algorithm), salt_length=hash_algorithm.digest_size),
+                hash_algorithm,
+            )
+        else:
+            size = (key.curve.key_size + 7) // 8
+            if len(signature) != 2 * size:
+                raise TokenValidationError("Invalid JWT signature.")
+            der_signature = encode_dss_signature(
+                int.from_bytes(signature[:size], "big"),
+                int.from_bytes(signature[size:], "big"),
+            )
+            key.verify(der_signature, signing_input, ec.ECDSA(hash_algorithm))
+    except InvalidSignature:
+        raise TokenValidationError("Invalid JWT signature.")
+    except (TypeError, AttributeError):
+        raise TokenValidationError(f"Key type does not match JWT algorithm {algorithm}.")
+
+
+def load_private_key(pem: str | bytes, password: bytes | None = None) -> Any:
+    """Load a PEM encoded RSA or EC private key.
+
+    :param pem: PEM encoded private key
+    :param password: Optional password of an encrypted key
+    :return: cryptography private key
+    """
+    _require_cryptography()
+    if isinstance(pem, str):
+        pem = pem.encode("utf-8")
+    try:
+        return serialization.load_pem_private_key(pem, password=password)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(f"Invalid private key: {e!s}")
+
+
+def sign_jwt(
+    claims: dict[str, Any],
+    key: Any,
+    algorithm: str = "RS256",
+    kid: str | None = None,
+) -> str:
+    """Create a compact signed JWT.
+
+    :param claims: Claims to sign
+    :param key: cryptography private key (see :func:`load_private_key`)
+    :param algorithm: JWS algorithm (e.g. 'RS256')
+    :param kid: Optional key id added to the header
+    :return: Compact serialized JWT
+    """
+    _require_cryptography()
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValidationError(f"Unsupported JWT algorithm: {algorithm}")
+    header = {"alg": algorithm, "typ": "JWT"}
+    if kid:
+        header["kid"] = kid
+    signing_input = (
+        f"{b64url_encode(json.dumps(header, separators=(',', ':')).encode('utf-8'))}."
+        f"{b64url_encode(json.dumps(claims, separators=(',', ':')).encode('utf-8'))}"
+    ).encode("ascii")
+    hash_algorithm = getattr(hashes, _HASHES[algorithm[2:]])()
+    try:
+        if algorithm.startswith("RS"):
+            signature = key.sign(signing_input, padding.PKCS1v15(), hash_algorithm)
+        elif algorithm.startswith("PS"):
+            signature = key.sign(
+                signing_input,
+                padding.PSS(mgf=padding.MGF1(hash_algorithm), salt_length=hash_algorithm.digest_size),
+                hash_algorithm,
+            )
+        else:
+            size = (key.curve.key_size + 7) // 8
+            r, s = decode_dss_signature(key.sign(signing_input, ec.ECDSA(hash_algorithm)))
+            signature = r.to_bytes(size, "big") + s.to_bytes(size, "big")
+    except (TypeError, AttributeError):
+        raise ValidationError(f"Key type does not match JWT algorithm {algorithm}.")
+    return f"{signing_input.decode('ascii')}.{b64url_encode(signature)}"
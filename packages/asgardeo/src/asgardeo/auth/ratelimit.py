@@ -0,0 +1,220 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Client-side rate limiting of requests to Asgardeo endpoints."""
+
+import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from ..models import AsgardeoConfig, RateLimitPolicy
+
+T = TypeVar("T")
+
+
+class Priority:
+    """Request priority constants, lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 10
+
+
+_priority: ContextVar[int] = ContextVar("asgardeo_request_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Set the priority of the requests made in a block.
+
+    Requests default to Priority.INTERACTIVE. Background work such as proactive token
+    refreshes should run with Priority.BACKGROUND so it queues behind user logins.
+
+    :param priority: Priority of the requests, lower values are admitted first
+    """
+    reset_token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(reset_token)
+
+
+def current_priority() -> int:
+    """Return the request priority of the current context."""
+    return _priority.get()
+
+
+class RateLimiter:
+    """Async token bucket combined with a limit on the requests in flight.
+
+    Waiting requests are admitted strictly by priority and in arrival order within a
+    priority, so a burst of background refreshes cannot delay interactive logins.
+    """
+
+    def __init__(self, policy: RateLimitPolicy) -> None:
+        """Initialize the rate limiter.
+
+        :param policy: Limits of the endpoint
+        """
+        if policy.rate is not None and policy.rate <= 0:
+            raise ValueError("rate must be positive.")
+        if policy.burst < 1:
+            raise ValueError("burst must be at least 1.")
+        if policy.max_in_flight is not None and policy.max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        self.policy = policy
+        self._tokens = float(policy.burst)
+        self._updated = time.monotonic()
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted requests that have not been released."""
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting to be admitted."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, priority: int | None = None) -> None:
+        """Wait until a request may be sent. Every call must be paired with :meth:`release`.
+
+        :param priority: Priority of the request (defaults to the context priority)
+        """
+        if not self._waiters and self._try_admit():
+            return
+        if priority is None:
+            priority = current_priority()
+        waiter = asyncio.get_running_loop().create_future()
+        self._counter += 1
+        heapq.heappush(self._waiters, (priority, self._counter, waiter))
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just before being cancelled, hand the slot to the next request.
+                self.release()
+            else:
+                waiter.cancel()
+                self._dispatch()
+            raise
+
+    def release(self) -> None:
+        """Release the in-flight slot of an admitted request."""
+        self._in_flight -= 1
+        self._dispatch()
+
+    async def call(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Send a request once admitted by the limiter.
+
+        :param send: Callable sending the request
+        :return: Result of the request
+        """
+        await self.acquire()
+        try:
+            return await send()
+        finally:
+            self.release()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        if self.policy.rate is None:
+            return
+        now = time.monotonic()
+        self._tokens = min(float(self.policy.burst), self._tokens + (now - self._updated) * self.policy.rate)
+        self._updated = now
+
+    def _try_admit(self) -> bool:
+        """Admit a request if both limits allow it."""
+        if self.policy.max_in_flight is not None and self._in_flight >= self.policy.max_in_flight:
+            return False
+        if self.policy.rate is not None:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        self._in_flight += 1
+        return True
+
+    def _dispatch(self) -> None:
+        """Admit waiting requests in priority order while the limits allow."""
+        while self._waiters:
+            waiter = self._waiters[0][2]
+            if waiter.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_admit():
+                break
+            heapq.heappop(self._waiters)
+            waiter.set_result(None)
+
+        if self._waiters and self.policy.rate is not None and self._tokens < 1 and self._timer is None:
+            delay = (1 - self._tokens) / self.policy.rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """Admit waiting requests once a token has accrued."""
+        self._timer = None
+        self._dispatch()
+
+
+class RateLimiterRegistry:
+    """Process-wide registry of rate limiters, one per endpoint URL."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._limiters: dict[str, RateLimiter] = {}
+
+    def get(self, endpoint: str, policy: RateLimitPolicy) -> RateLimiter:
+        """Get the limiter of an endpoint, creating it with the given policy if needed.
+
+        :param endpoint: Endpoint URL
+        :param policy: Limits used if the limiter is created
+        :return: RateLimiter of the endpoint
+        """
+        limiter = self._limiters.get(endpoint)
+        if limiter is None:
+            limiter = RateLimiter(policy)
+            self._limiters[endpoint] = limiter
+        return limiter
+
+    def clear(self) -> None:
+        """Forget every limiter."""
+        self._limiters.clear()
+
+
+default_rate_limiters = RateLimiterRegistry()
+
+
+def rate_limiter_for(config: AsgardeoConfig, name: str, endpoint: str) -> RateLimiter | None:
+    """Return the shared limiter of an endpoint if it is rate limited.
+
+    :param config: AsgardeoConfig instance with the rate limits
+    :param name: Endpoint name used as key in config.rate_limits (e.g. 'token')
+    :param endpoint: Endpoint URL
+    :return: RateLimiter, or None if the endpoint has no limits configured
+    """
+    policy = (config.rate_limits or {}).get(name)
+    if policy is None:
+        return None
+    return default_rate_limiters.get(endpoint, policy)
@@ -0,0 +1,199 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Background proactive refresh of OAuth tokens."""
+
+import asyncio
+import dataclasses
+import heapq
+import logging
+import random
+import time
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING
+
+from ..models import AsgardeoError, OAuthToken, ValidationError
+from .ratelimit import Priority, request_priority
+
+if TYPE_CHECKING:
+    from .client import AsgardeoTokenClient
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefresher:
+    """Keeps registered tokens fresh from an asyncio background task.
+
+    Each token is refreshed with its refresh token once a jittered fraction of its
+    ``expires_in`` has elapsed, and the new token is swapped in atomically. Readers call
+    :meth:`get`, which never awaits the network. Refresh requests run with
+    Priority.BACKGROUND, so rate limited endpoints admit interactive requests first.
+    """
+
+    def __init__(
+        self,
+        token_client: "AsgardeoTokenClient",
+        refresh_ratio: float = 0.75,
+        jitter: float = 0.1,
+        retry_interval: float = 5.0,
+        on_refresh: Callable[[Hashable, OAuthToken], None] | None = None,
+    ) -> None:
+        """Initialize the token refresher.
+
+        :param token_client: Token client used to refresh tokens
+        :param refresh_ratio: Fraction of the token lifetime after which it is refreshed
+        :param jitter: Maximum random deviation applied to refresh_ratio
+        :param retry_interval: Seconds to wait before retrying a failed refresh
+        :param on_refresh: Optional callback invoked with (key, token) after each refresh
+        """
+        if not 0 < refresh_ratio < 1:
+            raise ValueError("refresh_ratio must be between 0 and 1.")
+        if not 0 <= jitter < refresh_ratio:
+            raise ValueError("jitter must be non-negative and smaller than refresh_ratio.")
+        self.token_client = token_client
+        self.refresh_ratio = refresh_ratio
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.on_refresh = on_refresh
+        self._tokens: dict[Hashable, tuple[OAuthToken, float]] = {}
+        self._schedule: list[tuple[float, int, Hashable]] = []
+        self._generations: dict[Hashable, int] = {}
+        self._counter = 0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._refreshes: set[asyncio.Task] = set()
+
+    def register(self, key: Hashable, token: OAuthToken) -> None:
+        """Track a token and schedule its proactive refresh.
+
+        Registering an existing key replaces its token.
+
+        :param key: Key used to read the token back
+        :param token: Token with a refresh_token and expires_in
+        """
+        if not token.refresh_token:
+            raise ValidationError("A refresh token is required to register a token for refresh.")
+        if not token.expires_in:
+            raise ValidationError("expires_in is required to register a token for refresh.")
+        self._store(key, token)
+
+    def unregister(self, key: Hashable) -> None:
+        """Stop tracking a token.
+
+        :param key: Key of the token
+        """
+        self._tokens.pop(key, None)
+        self._generations.pop(key, None)
+
+    def get(self, key: Hashable) -> OAuthToken | None:
+        """Return the current token for a key without awaiting the network.
+
+        :param key: Key of the token
+        :return: Current OAuthToken, or None if the key is unknown or the token has expired
+        """
+        entry = self._tokens.get(key)
+        if entry is None:
+            return None
+        token, expires_at = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return token
+
+    def start(self) -> None:
+        """Start the background refresh task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh task and any refresh in progress."""
+        tasks = [task for task in (self._task, *self._refreshes) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._refreshes.clear()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.stop()
+        return False
+
+    def _store(self, key: Hashable, token: OAuthToken) -> None:
+        """Swap in a token and schedule its next refresh."""
+        now = time.monotonic()
+        self._tokens[key] = (token, now + token.expires_in)
+        ratio = self.refresh_ratio + random.uniform(-self.jitter, self.jitter)
+        self._schedule_at(key, now + token.expires_in * ratio)
+
+    def _schedule_at(self, key: Hashable, due: float) -> None:
+        """Schedule a refresh, superseding any refresh already scheduled for the key."""
+        self._counter += 1
+        self._generations[key] = self._counter
+        heapq.heappush(self._schedule, (due, self._counter, key))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Wait for the next due refresh and run it in the background."""
+        while True:
+            self._wakeup.clear()
+            now = time.monotonic()
+            while self._schedule and self._schedule[0][0] <= now:
+                _, generation, key = heapq.heappop(self._schedule)
+                if self._generations.get(key) != generation:
+                    continue
+                task = asyncio.create_task(self._refresh(key))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refreshes.discard)
+
+            timeout = self._schedule[0][0] - now if self._schedule else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refresh(self, key: Hashable) -> None:
+        """Refresh a single token and swap it in."""
+        entry = self._tokens.get(key)
+        if entry is None:
+            return
+        token, expires_at = entry
+        try:
+            with request_priority(Priority.BACKGROUND):
+                new_token = await self.token_client.refresh_access_token(token.refresh_token)
+        except AsgardeoError as e:
+            if self._tokens.get(key) is not entry:
+                return
+            if time.monotonic() + self.retry_interval < expires_at:
+                logger.warning(f"Token refresh failed, retrying in {self.retry_interval}s: {e}")
+                self._schedule_at(key, time.monotonic() + self.retry_interval)
+            else:
+                logger.error(f"Token refresh failed before expiry: {e}")
+            return
+
+        # The key was unregistered or registered with another token during the refresh.
+        if self._tokens.get(key) is not entry:
+            return
+        if not new_token.refresh_token:
+            new_token = dataclasses.replace(new_token, refresh_token=token.refresh_token)
+        if not new_token.expires_in:
+            new_token = dataclasses.replace(new_token, expires_in=token.expires_in)
+        self._store(key, new_token)
+        if self.on_refresh:
+            self.on_refresh(key, new_token)
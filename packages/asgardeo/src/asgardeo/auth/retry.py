@@ -0,0 +1,137 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Retrying of transient request failures."""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from ..models import RetryPolicy
+from .breaker import CircuitBreaker
+from .ratelimit import RateLimiter
+from .telemetry import Instrumentation, Metric
+
+logger = logging.getLogger(__name__)
+
+# Errors raised before the request was sent, safe to retry for any request.
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Errors after which the server may or may not have processed the request.
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+_UNSAFE_RETRY_STATUSES = frozenset({429})
+
+
+def is_retryable(policy: RetryPolicy, error: Exception, idempotent: bool = True) -> bool:
+    """Check whether a failed request may be retried.
+
+    :param policy: Retry policy
+    :param error: Error raised by the request
+    :param idempotent: Whether the request can safely be sent more than once
+    :return: True if the request may be retried
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if status_code not in policy.retry_statuses:
+            return False
+        return idempotent or status_code in _UNSAFE_RETRY_STATUSES
+    if isinstance(error, _CONNECT_ERRORS):
+        return True
+    return idempotent and isinstance(error, _TRANSIENT_ERRORS)
+
+
+def retry_after(response: httpx.Response) -> float | None:
+    """Parse the Retry-After header of a response.
+
+    :param response: HTTP response
+    :return: Delay in seconds, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def send_with_retry(
+    policy: RetryPolicy,
+    send: Callable[[], Awaitable[httpx.Response]],
+    idempotent: bool = True,
+    breaker: CircuitBreaker | None = None,
+    limiter: RateLimiter | None = None,
+    instrumentation: Instrumentation | None = None,
+    endpoint: str = "",
+) -> httpx.Response:
+    """Send a request, retrying transient failures according to a retry policy.
+
+    Error responses are raised as ``httpx.HTTPStatusError``, so callers handle the
+    final failure exactly like a single attempt. Every attempt goes through the circuit
+    breaker if one is given, and an open circuit raises CircuitOpenError without retrying.
+    With a rate limiter every attempt first waits to be admitted; the time spent queued
+    does not count towards the circuit breaker latency. With an instrumentation the
+    latency and status of every attempt is recorded, and retries are counted.
+
+    :param policy: Retry policy
+    :param send: Callable sending the request
+    :param idempotent: Whether the request can safely be sent more than once
+    :param breaker: Optional circuit breaker of the endpoint
+    :param limiter: Optional rate limiter of the endpoint
+    :param instrumentation: Optional instrumentation receiving the request metrics
+    :param endpoint: Endpoint name reported to the instrumentation
+    :return: Successful HTTP response
+    """
+    if breaker is not None:
+        send = functools.partial(breaker.call, send)
+    if limiter is not None:
+        send = functools.partial(limiter.call, send)
+
+    start = time.monotonic()
+    delay = policy.base_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        sent_at = time.perf_counter()
+        try:
+            response = await send()
+            if instrumentation is not None:
+                instrumentation.record_request(endpoint, response.status_code, time.perf_counter() - sent_at)
+            response.raise_for_status()
+            return response
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            if instrumentation is not None and isinstance(e, httpx.RequestError):
+                instrumentation.record_request(endpoint, type(e).__name__, time.perf_counter() - sent_at)
+            if attempt >= policy.max_attempts or not is_retryable(policy, e, idempotent):
+                raise
+            delay = min(policy.max_delay, random.uniform(policy.base_delay, delay * 3))
+            wait = delay
+            if policy.respect_retry_after and isinstance(e, httpx.HTTPStatusError):
+                wait = max(wait, retry_after(e.response) or 0.0)
+            if policy.deadline is not None and time.monotonic() - start + wait > policy.deadline:
+                raise
+            logger.debug(f"Retrying request in {wait:.2f}s after attempt {attempt}: {e!s}")
+            if instrumentation is not None:
+                instrumentation.count(Metric.RETRIES, attributes={"endpoint": endpoint})
+            await asyncio.sleep(wait)
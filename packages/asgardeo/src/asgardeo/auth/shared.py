@@ -0,0 +1,217 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Token cache shared by the processes of a host."""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+
+from ..models import AsgardeoError, OAuthToken
+from .cache import TokenCache
+from .store import SQLiteTokenStore, encode_key
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class InterProcessLock:
+    """Advisory file lock (``flock``) usable from asyncio without blocking the loop."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the lock.
+
+        :param path: Path of the lock file, created if missing
+        """
+        if fcntl is None:
+            raise AsgardeoError("Inter-process locking requires a POSIX platform.")
+        self.path = path
+        self._fd: int | None = None
+
+    async def acquire(self, timeout: float | None = None) -> bool:
+        """Wait for the lock.
+
+        :param timeout: Maximum seconds to wait, None to wait forever
+        :return: True if the lock was acquired, False on timeout
+        """
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.005
+        try:
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    self._fd = fd
+                    return True
+                except BlockingIOError:
+                    pass
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        except BaseException:
+            # Also closes the file when the waiting task is cancelled.
+            os.close(fd)
+            raise
+        os.close(fd)
+        return False
+
+    def release(self) -> None:
+        """Release the lock."""
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class SharedTokenCache(TokenCache):
+    """Token cache shared by all processes on a host, e.g. the workers of a server.
+
+    Tokens are kept in a SQLiteTokenStore that every process opens, with each process
+    holding an in-memory copy in front of it. A miss in memory reads the store, and
+    :meth:`fetch` takes a per-key file lock so only one process requests a new token
+    while the others wait for it and read it from the store. Once another process has
+    written to the store, a memory hit is checked against the store again, so tokens
+    invalidated or discarded (e.g. revoked) by one process are dropped by all of them.
+    Place the database on a host-local file system; a tmpfs path such as ``/dev/shm``
+    keeps it in memory.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        maxsize: int = 1024,
+        skew: float = 30.0,
+        encryption_key: str | bytes | None = None,
+        lock_dir: str | None = None,
+        lock_timeout: float = 30.0,
+    ) -> None:
+        """Initialize the shared token cache.
+
+        :param path: Path of the shared SQLite database
+        :param maxsize: Maximum number of tokens kept in the memory of this process
+        :param skew: Seconds subtracted from the token lifetime as a safety margin
+        :param encryption_key: Optional Fernet key used to encrypt tokens at rest
+        :param lock_dir: Directory of the lock files (defaults to '<path>.locks')
+        :param lock_timeout: Maximum seconds to wait for another process fetching the same token
+        """
+        self.lock_dir = lock_dir or f"{path}.locks"
+        self.lock_timeout = lock_timeout
+        os.makedirs(self.lock_dir, mode=0o700, exist_ok=True)
+        store = SQLiteTokenStore(path, encryption_key=encryption_key, batch_size=1)
+        # Keys whose memory copy matched the store since it was last written by another process.
+        self._verified: set[Hashable] = set()
+        self._data_version = store.data_version()
+        super().__init__(maxsize=maxsize, skew=skew, store=store)
+
+    def get(self, key: Hashable, stale_ok: bool = False) -> OAuthToken | None:
+        """Return the cached token for a key, reading the shared store on a miss.
+
+        :param key: Cache key
+        :param stale_ok: Also return a token within the skew of its expiry
+        :return: Cached OAuthToken or None on a miss
+        """
+        version = self.store.data_version()
+        if version != self._data_version:
+            self._data_version = version
+            self._verified.clear()
+        token = super().get(key, stale_ok)
+        if token is not None and key not in self._verified:
+            if self._matches_store(key, token):
+                self._verified.add(key)
+            else:
+                self._entries.pop(key, None)
+                token = None
+        if token is None and self._load(key):
+            self._verified.add(key)
+            token = super().get(key, stale_ok)
+        return token
+
+    def set(self, key: Hashable, token: OAuthToken) -> None:
+        """Cache a token under a key in memory and in the shared store.
+
+        :param key: Cache key
+        :param token: Token to cache
+        """
+        super().set(key, token)
+        self._verified.add(key)
+
+    def _discard_stored(self, keys: list[Hashable], tokens: Iterable[str]) -> None:
+        """Remove discarded tokens from the shared store, including those only other processes hold in memory."""
+        self.store.delete_tokens(tokens)
+
+    async def fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[OAuthToken]],
+        force: bool = False,
+    ) -> OAuthToken:
+        """Get a token with fetch while holding the key's lock, unless another process just did.
+
+        :param key: Cache key
+        :param fetch: Callable requesting a new token
+        :param force: Request a new token even if the store holds a valid one
+        :return: Token from the store or from fetch
+        """
+        lock = InterProcessLock(os.path.join(self.lock_dir, self._lock_name(key)))
+        if not await lock.acquire(self.lock_timeout):
+            logger.warning("Timed out waiting for another process to fetch the token, fetching it directly.")
+            return await super().fetch(key, fetch, force)
+        try:
+            if not force:
+                token = self.get(key)
+                if token is not None:
+                    return token
+            return await super().fetch(key, fetch, force)
+        finally:
+            lock.release()
+
+    def close(self) -> None:
+        """Close the shared store."""
+        self.store.close()
+
+    def _matches_store(self, key: Hashable, token: OAuthToken) -> bool:
+        """Return whether the shared store still holds a token for a key.
+
+        Keys that cannot be stored are only cached in memory and always match.
+        """
+        try:
+            entry = self.store.get(encode_key(key))
+        except TypeError:
+            return True
+        return entry is not None and entry[0].access_token == token.access_token
+
+    def _load(self, key: Hashable) -> bool:
+        """Copy a token from the shared store into memory."""
+        try:
+            entry = self.store.get(encode_key(key))
+        except TypeError:
+            return False
+        if entry is None:
+            return False
+        token, expires_at = entry
+        return self._put(key, token, expires_at - time.time())
+
+    @staticmethod
+    def _lock_name(key: Hashable) -> str:
+        """Return the lock file name of a key."""
+        return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:32] + ".lock"
@@ -0,0 +1,61 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Single-flight deduplication of concurrent async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into a single in-flight call.
+
+    The first caller for a key starts the call, every caller that arrives while it is
+    still running awaits the same result (or exception). Cancelling one waiter does not
+    cancel the shared call for the others.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the single-flight group."""
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` for a key, or join the call already in flight for that key.
+
+        :param key: Key identifying identical calls
+        :param func: Zero-argument callable returning the awaitable to run
+        :return: Result of the shared call
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """Drop a finished call so the next caller starts a new one."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            future.exception()
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._calls)
@@ -0,0 +1,500 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Persistent token stores."""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any
+
+from ..models import AsgardeoError, OAuthToken
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover - optional dependency
+    Fernet = None
+    InvalidToken = ValueError
+
+logger = logging.getLogger(__name__)
+
+
+def encode_key(key: Hashable) -> str:
+    """Encode a cache key (strings, numbers and nested tuples of them) as a string.
+
+    :param key: Cache key
+    :return: JSON representation of the key
+    """
+    return json.dumps(key, separators=(",", ":"))
+
+
+def decode_key(value: str) -> Hashable:
+    """Decode a key encoded with :func:`encode_key`, restoring tuples.
+
+    :param value: Encoded key
+    :return: Cache key
+    """
+
+    def to_tuple(item: Any) -> Any:
+        return tuple(to_tuple(part) for part in item) if isinstance(item, list) else item
+
+    return to_tuple(json.loads(value))
+
+
+def _token_digest(token: str) -> str:
+    """Return the digest identifying a stored access or refresh token."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenStore(ABC):
+    """Base class of persistent token stores.
+
+    A store maps string keys to tokens with an absolute expiry (seconds since the
+    epoch). Tokens are serialized to JSON and, when an ``encryption_key`` (a Fernet key,
+    see ``cryptography.fernet.Fernet.generate_key``) is given, encrypted at rest.
+    Subclasses implement :meth:`_read`, :meth:`_write`, :meth:`_delete` and
+    :meth:`_scan` on the serialized values.
+    """
+
+    def __init__(self, encryption_key: str | bytes | None = None) -> None:
+        """Initialize the token store.
+
+        :param encryption_key: Optional Fernet key used to encrypt tokens at rest
+        """
+        self._fernet = None
+        if encryption_key is not None:
+            if Fernet is None:
+                raise AsgardeoError(
+                    "Token encryption requires the 'cryptography' package, "
+                    "install it with 'pip install asgardeo[encryption]'.",
+                )
+            self._fernet = Fernet(encryption_key)
+
+    def get(self, key: str) -> tuple[OAuthToken, float] | None:
+        """Return a stored token that has not expired.
+
+        :param key: Store key
+        :return: Tuple of (token, expires_at) or None
+        """
+        entry = self._read(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            self._delete(key)
+            return None
+        token = self._deserialize(value)
+        return (token, expires_at) if token is not None else None
+
+    def set(self, key: str, token: OAuthToken, expires_at: float) -> None:
+        """Store a token.
+
+        :param key: Store key
+        :param token: Token to store
+        :param expires_at: Expiry of the token in seconds since the epoch
+        """
+        self._write(key, self._serialize(token), expires_at)
+
+    def delete(self, key: str) -> None:
+        """Remove a token.
+
+        :param key: Store key
+        """
+        self._delete(key)
+
+    def delete_tokens(self, tokens: Iterable[str]) -> None:
+        """Remove every stored token whose access or refresh token is one of tokens.
+
+        :param tokens: Access or refresh tokens (e.g. after they have been revoked)
+        """
+        tokens = set(tokens)
+        for key, token, _ in list(self.items()):
+            if token.access_token in tokens or token.refresh_token in tokens:
+                self.delete(key)
+
+    def items(self) -> Iterator[tuple[str, OAuthToken, float]]:
+        """Iterate over all tokens that have not expired.
+
+        :return: Iterator of (key, token, expires_at)
+        """
+        now = time.time()
+        for key, value, expires_at in self._scan():
+            if expires_at <= now:
+                continue
+            token = self._deserialize(value)
+            if token is not None:
+                yield key, token, expires_at
+
+    def flush(self) -> None:
+        """Persist any buffered writes."""
+
+    def close(self) -> None:
+        """Flush and release the store."""
+        self.flush()
+
+    def _serialize(self, token: OAuthToken) -> bytes:
+        """Serialize and optionally encrypt a token."""
+        value = json.dumps(dataclasses.asdict(token), separators=(",", ":")).encode("utf-8")
+        return self._fernet.encrypt(value) if self._fernet else value
+
+    def _deserialize(self, value: bytes) -> OAuthToken | None:
+        """Decrypt and deserialize a token, None if it cannot be read (e.g. wrong key)."""
+        try:
+            if self._fernet:
+                value = self._fernet.decrypt(value)
+            return OAuthToken(**json.loads(value))
+        except (InvalidToken, ValueError, TypeError) as e:
+            logger.warning(f"Skipping unreadable stored token: {e!r}")
+            return None
+
+    @abstractmethod
+    def _read(self, key: str) -> tuple[bytes, float] | None:
+        """Return the serialized value and expiry of a key."""
+
+    @abstractmethod
+    def _write(self, key: str, value: bytes, expires_at: float) -> None:
+        """Store a serialized value."""
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Remove a key."""
+
+    @abstractmethod
+    def _scan(self) -> Iterator[tuple[str, bytes, float]]:
+        """Iterate over all keys with their serialized values and expiry."""
+
+
+class MemoryTokenStore(TokenStore):
+    """Token store kept in process memory, mainly for tests and as a reference."""
+
+    def __init__(self, encryption_key: str | bytes | None = None) -> None:
+        """Initialize the memory token store.
+
+        :param encryption_key: Optional Fernet key used to encrypt tokens in memory
+        """
+        super().__init__(encryption_key)
+        self._entries: dict[str, tuple[bytes, float]] = {}
+
+    def _read(self, key: str) -> tuple[bytes, float] | None:
+        return self._entries.get(key)
+
+    def _write(self, key: str, value: bytes, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+
+    def _delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def _scan(self) -> Iterator[tuple[str, bytes, float]]:
+        for key, (value, expires_at) in list(self._entries.items()):
+            yield key, value, expires_at
+
+
+class _BufferedTokenStore(TokenStore):
+    """Token store that buffers writes and persists them in batches.
+
+    Buffered writes are persisted once batch_size writes are pending, and by a
+    background timer at most flush_interval seconds after they were buffered.
+    """
+
+    def __init__(
+        self,
+        encryption_key: str | bytes | None = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        super().__init__(encryption_key)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: dict[str, tuple[bytes, float] | None] = {}
+        self._flushed_at = time.monotonic()
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+
+    def _read(self, key: str) -> tuple[bytes, float] | None:
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            return self._load(key)
+
+    def _write(self, key: str, value: bytes, expires_at: float) -> None:
+        self._buffer(key, (value, expires_at))
+
+    def _delete(self, key: str) -> None:
+        self._buffer(key, None)
+
+    def _scan(self) -> Iterator[tuple[str, bytes, float]]:
+        with self._lock:
+            self.flush()
+            return iter(list(self._load_all()))
+
+    def _buffer(self, key: str, entry: tuple[bytes, float] | None) -> None:
+        """Buffer a write or deletion and flush once the batch is full or old enough."""
+        with self._lock:
+            self._pending[key] = entry
+            if (
+                len(self._pending) >= self.batch_size
+                or time.monotonic() - self._flushed_at >= self.flush_interval
+            ):
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_in_background(self) -> None:
+        """Flush from the timer thread, logging instead of raising errors."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Flushing buffered token writes failed: {e!r}")
+
+    def flush(self) -> None:
+        """Persist the buffered writes."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending:
+                self._persist(self._pending)
+                self._pending = {}
+            self._flushed_at = time.monotonic()
+
+    @abstractmethod
+    def _load(self, key: str) -> tuple[bytes, float] | None:
+        """Read a persisted key."""
+
+    @abstractmethod
+    def _load_all(self) -> Iterator[tuple[str, bytes, float]]:
+        """Read all persisted keys."""
+
+    @abstractmethod
+    def _persist(self, pending: dict[str, tuple[bytes, float] | None]) -> None:
+        """Persist buffered writes, None values are deletions."""
+
+
+class SQLiteTokenStore(_BufferedTokenStore):
+    """Token store in a SQLite database in WAL mode.
+
+    Writes are buffered and committed in one transaction once batch_size writes are
+    pending or flush_interval seconds have passed, and on :meth:`flush` and
+    :meth:`close`. Several processes on a host can share one database file. The
+    database and its -wal and -shm files are only accessible to their owner (0600).
+    Rows are indexed by a SHA-256 digest of their access and refresh tokens, so
+    :meth:`delete_tokens` does not read the whole store.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encryption_key: str | bytes | None = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the SQLite token store.
+
+        :param path: Path of the database file
+        :param encryption_key: Optional Fernet key used to encrypt tokens at rest
+        :param batch_size: Number of buffered writes that triggers a commit
+        :param flush_interval: Maximum seconds a write stays buffered before it is flushed in the background
+        """
+        super().__init__(encryption_key, batch_size, flush_interval)
+        self.path = path
+        # SQLite creates the -wal and -shm files with the mode of the database file.
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        self._connection = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, access_digest TEXT, refresh_digest TEXT)",
+        )
+        self._connection.commit()
+        self._migrate()
+        self._connection.execute("CREATE INDEX IF NOT EXISTS tokens_access_digest ON tokens (access_digest)")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS tokens_refresh_digest ON tokens (refresh_digest)")
+        self._connection.commit()
+        # Token digests of the buffered writes, persisted with them.
+        self._digests: dict[str, tuple[str, str | None]] = {}
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.chmod(path + suffix, 0o600)
+            except FileNotFoundError:
+                pass
+
+    def _migrate(self) -> None:
+        """Add the token digest columns to databases created without them."""
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(tokens)")}
+        if "access_digest" in columns:
+            return
+        for column in ("access_digest", "refresh_digest"):
+            try:
+                self._connection.execute(f"ALTER TABLE tokens ADD COLUMN {column} TEXT")
+            except sqlite3.OperationalError as e:
+                # Another process added the column first.
+                if "duplicate column" not in str(e):
+                    raise
+        with self._connection:
+            for key, value, _ in self._connection.execute("SELECT key, value, expires_at FROM tokens").fetchall():
+                token = self._deserialize(value)
+                if token is not None:
+                    self._connection.execute(
+                        "UPDATE tokens SET access_digest = ?, refresh_digest = ? WHERE key = ?",
+                        (*self._token_digests(token), key),
+                    )
+
+    @staticmethod
+    def _token_digests(token: OAuthToken) -> tuple[str, str | None]:
+        """Return the digests of the access and refresh token of a token."""
+        return (
+            _token_digest(token.access_token),
+            _token_digest(token.refresh_token) if token.refresh_token else None,
+        )
+
+    def set(self, key: str, token: OAuthToken, expires_at: float) -> None:
+        """Store a token.
+
+        :param key: Store key
+        :param token: Token to store
+        :param expires_at: Expiry of the token in seconds since the epoch
+        """
+        with self._lock:
+            self._digests[key] = self._token_digests(token)
+            super().set(key, token, expires_at)
+
+    def delete_tokens(self, tokens: Iterable[str]) -> None:
+        """Remove every stored token whose access or refresh token is one of tokens.
+
+        :param tokens: Access or refresh tokens (e.g. after they have been revoked)
+        """
+        digests = [(digest, digest) for digest in {_token_digest(token) for token in tokens}]
+        with self._lock:
+            self.flush()
+            with self._connection:
+                self._connection.executemany(
+                    "DELETE FROM tokens WHERE access_digest = ? OR refresh_digest = ?",
+                    digests,
+                )
+
+    def _load(self, key: str) -> tuple[bytes, float] | None:
+        row = self._connection.execute(
+            "SELECT value, expires_at FROM tokens WHERE key = ?", (key,),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _load_all(self) -> Iterator[tuple[str, bytes, float]]:
+        return iter(self._connection.execute(
+            "SELECT key, value, expires_at FROM tokens WHERE expires_at > ?", (time.time(),),
+        ).fetchall())
+
+    def _persist(self, pending: dict[str, tuple[bytes, float] | None]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO tokens (key, value, expires_at, access_digest, refresh_digest) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (key, entry[0], entry[1], *self._digests.get(key, (None, None)))
+                    for key, entry in pending.items() if entry is not None
+                ],
+            )
+            self._connection.executemany(
+                "DELETE FROM tokens WHERE key = ?",
+                [(key,) for key, entry in pending.items() if entry is None],
+            )
+            self._connection.execute("DELETE FROM tokens WHERE expires_at <= ?", (time.time(),))
+        for key in pending:
+            self._digests.pop(key, None)
+
+    def data_version(self) -> int:
+        """Return a number that changes whenever another connection commits to the database."""
+        with self._lock:
+            return self._connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self) -> None:
+        """Flush the buffered writes and close the database."""
+        with self._lock:
+            self.flush()
+            self._connection.close()
+
+
+class FileTokenStore(_BufferedTokenStore):
+    """Token store in a single JSON file.
+
+    The file is read once and rewritten atomically (write to a temporary file, then
+    rename) when buffered writes are flushed, so readers never see a partial file.
+    Suited to a single process with a modest number of tokens; use SQLiteTokenStore
+    for large or shared stores.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encryption_key: str | bytes | None = None,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ) -> None:
+        """Initialize the file token store.
+
+        :param path: Path of the JSON file
+        :param encryption_key: Optional Fernet key used to encrypt tokens at rest
+        :param batch_size: Number of buffered writes that triggers a rewrite
+        :param flush_interval: Maximum seconds a write stays buffered before it is flushed in the background
+        """
+        super().__init__(encryption_key, batch_size, flush_interval)
+        self.path = path
+        self._entries: dict[str, tuple[bytes, float]] = {}
+        try:
+            with open(path, encoding="utf-8") as file:
+                for key, (value, expires_at) in json.load(file).items():
+                    self._entries[key] = (value.encode("ascii"), expires_at)
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable token store file {path}: {e}")
+
+    def _load(self, key: str) -> tuple[bytes, float] | None:
+        return self._entries.get(key)
+
+    def _load_all(self) -> Iterator[tuple[str, bytes, float]]:
+        return ((key, value, expires_at) for key, (value, expires_at) in self._entries.items())
+
+    def _persist(self, pending: dict[str, tuple[bytes, float] | None]) -> None:
+        for key, entry in pending.items():
+            if entry is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = entry
+        now = time.time()
+        data = {
+            key: (value.decode("ascii"), expires_at)
+            for key, (value, expires_at) in self._entries.items() if expires_at > now
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file, separators=(",", ":"))
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,163 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Tracing and metrics hooks."""
+
+import contextlib
+import functools
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..models import AsgardeoConfig, AsgardeoError
+
+_NOOP_SPAN = contextlib.nullcontext()
+
+
+class Metric:
+    """Names of the metrics reported to an Instrumentation."""
+
+    REQUEST_DURATION = "asgardeo.client.request.duration"
+    RETRIES = "asgardeo.client.retries"
+    ERRORS = "asgardeo.client.errors"
+    CACHE_HITS = "asgardeo.cache.hits"
+    CACHE_MISSES = "asgardeo.cache.misses"
+
+
+class Instrumentation:
+    """Receives the spans and metrics of the SDK.
+
+    This base implementation discards everything and is the default. Subclass it to
+    forward spans and metrics to a monitoring system, see OpenTelemetryInstrumentation.
+    Endpoints are named like the rate limits ('authorize', 'authn', 'token', 'revoke',
+    'introspect').
+    """
+
+    def span(self, name: str, attributes: dict[str, Any] | None = None) -> contextlib.AbstractContextManager:
+        """Return a context manager covering one operation, e.g. a flow step.
+
+        :param name: Span name
+        :param attributes: Optional span attributes
+        :return: Context manager of the span
+        """
+        return _NOOP_SPAN
+
+    def record_request(self, endpoint: str, status: int | str, duration: float) -> None:
+        """Record the latency of one HTTP request attempt.
+
+        :param endpoint: Endpoint name
+        :param status: HTTP status code, or the error class name if no response was received
+        :param duration: Duration in seconds
+        """
+
+    def count(self, name: str, value: int = 1, attributes: dict[str, Any] | None = None) -> None:
+        """Increment a counter.
+
+        :param name: Metric name (see Metric)
+        :param value: Increment
+        :param attributes: Optional metric attributes
+        """
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Instrumentation reporting spans and metrics through OpenTelemetry.
+
+    Requires the ``opentelemetry-api`` package (``pip install asgardeo[opentelemetry]``).
+    Without explicit providers the globally configured ones are used.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None) -> None:
+        """Initialize the OpenTelemetry instrumentation.
+
+        :param tracer_provider: Optional TracerProvider (defaults to the global provider)
+        :param meter_provider: Optional MeterProvider (defaults to the global provider)
+        """
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError:
+            raise AsgardeoError(
+                "OpenTelemetry instrumentation requires the 'opentelemetry-api' package. "
+                "Install it with 'pip install asgardeo[opentelemetry]'.",
+            )
+        from .. import __version__
+
+        self._tracer = trace.get_tracer("asgardeo", __version__, tracer_provider=tracer_provider)
+        meter = metrics.get_meter("asgardeo", __version__, meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            Metric.REQUEST_DURATION,
+            unit="s",
+            description="Duration of HTTP requests to the IdP",
+        )
+        self._counters = {
+            Metric.RETRIES: meter.create_counter(Metric.RETRIES, description="Retried HTTP requests"),
+            Metric.ERRORS: meter.create_counter(Metric.ERRORS, description="Failed operations"),
+            Metric.CACHE_HITS: meter.create_counter(Metric.CACHE_HITS, description="Cache hits"),
+            Metric.CACHE_MISSES: meter.create_counter(Metric.CACHE_MISSES, description="Cache misses"),
+        }
+
+    def span(self, name: str, attributes: dict[str, Any] | None = None) -> contextlib.AbstractContextManager:
+        """Start an OpenTelemetry span, recording escaping exceptions on it."""
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+    def record_request(self, endpoint: str, status: int | str, duration: float) -> None:
+        """Record the latency in the request duration histogram."""
+        self._duration.record(duration, {"endpoint": endpoint, "status": str(status)})
+
+    def count(self, name: str, value: int = 1, attributes: dict[str, Any] | None = None) -> None:
+        """Add to the counter of a metric."""
+        counter = self._counters.get(name)
+        if counter is not None:
+            counter.add(value, attributes)
+
+
+default_instrumentation = Instrumentation()
+
+
+def instrumentation_for(config: AsgardeoConfig) -> Instrumentation:
+    """Return the instrumentation of a configuration, the no-op default if none is set.
+
+    :param config: AsgardeoConfig instance
+    :return: Instrumentation
+    """
+    return config.instrumentation or default_instrumentation
+
+
+def traced(endpoint: str) -> Callable:
+    """Decorate a client method with a span and an error counter for an endpoint.
+
+    The decorated method must be a coroutine of an object with a ``config`` attribute.
+
+    :param endpoint: Endpoint name, the span is named 'asgardeo.<endpoint>'
+    :return: Decorator
+    """
+    name = f"asgardeo.{endpoint}"
+    attributes = {"asgardeo.endpoint": endpoint}
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            instrumentation = instrumentation_for(self.config)
+            with instrumentation.span(name, attributes):
+                try:
+                    return await func(self, *args, **kwargs)
+                except Exception as e:
+                    instrumentation.count(
+                        Metric.ERRORS,
+                        attributes={"endpoint": endpoint, "error": type(e).__name__},
+                    )
+                    raise
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,166 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Shared HTTP sessions for Asgardeo clients."""
+
+import asyncio
+from collections.abc import Hashable
+from http.cookiejar import CookieJar
+
+import httpx
+
+from ..models import AsgardeoConfig, AsgardeoError
+
+
+class _StreamLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that bounds the number of requests in flight."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limit: int) -> None:
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._semaphore:
+            response = await self._transport.handle_async_request(request)
+            await response.aread()
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _NoCookieJar(CookieJar):
+    """Cookie jar that never stores cookies."""
+
+    def set_cookie(self, cookie) -> None:
+        pass
+
+    def extract_cookies(self, response, request) -> None:
+        pass
+
+
+class SessionProvider:
+    """Shares one keep-alive ``httpx.AsyncClient`` per base URL and pool settings.
+
+    Clients acquire a session when they are created and release it when they are
+    closed. The session is closed once the last client releases it, so connections
+    (and their TLS handshakes) are reused by every client alive at the same time.
+    Sessions never store cookies, so IdP session cookies (e.g. commonAuthId) set
+    during one client's flow are not sent on the flows of other clients.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """Initialize the session provider.
+
+        :param transport: Optional transport used by every session (e.g. httpx.MockTransport)
+        """
+        self.transport = transport
+        self._sessions: dict[Hashable, httpx.AsyncClient] = {}
+        self._keys: dict[int, Hashable] = {}
+        self._refcounts: dict[Hashable, int] = {}
+
+    @staticmethod
+    def _pool_key(config: AsgardeoConfig) -> Hashable:
+        """Return the key identifying sessions that can be shared for a configuration."""
+        return (
+            config.base_url.rstrip("/"),
+            config.max_connections,
+            config.max_keepalive_connections,
+            config.keepalive_expiry,
+            config.timeout,
+            config.http2,
+            config.http2_max_concurrent_streams,
+        )
+
+    def _create_session(self, config: AsgardeoConfig) -> httpx.AsyncClient:
+        """Create a new session with the pool settings of the configuration."""
+        limits = httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+        transport = self.transport
+        try:
+            if config.http2 and config.http2_max_concurrent_streams and config.max_connections is not None:
+                # Streams are capped client-side, so excess requests queue instead of
+                # opening new connections or exceeding the server stream limit. Without a
+                # connection limit there is no total to cap.
+                if transport is None:
+                    transport = httpx.AsyncHTTPTransport(http2=True, limits=limits)
+                transport = _StreamLimitedTransport(
+                    transport,
+                    config.http2_max_concurrent_streams * config.max_connections,
+                )
+            return httpx.AsyncClient(
+                limits=limits,
+                timeout=httpx.Timeout(config.timeout),
+                transport=transport,
+                http2=config.http2,
+                cookies=_NoCookieJar(),
+            )
+        except ImportError as e:
+            raise AsgardeoError(
+                f"HTTP/2 support requires the 'h2' package, install it with 'pip install asgardeo[http2]': {e!s}",
+            )
+
+    def acquire(self, config: AsgardeoConfig) -> httpx.AsyncClient:
+        """Get the shared session for a configuration, creating it if needed.
+
+        Every call must be paired with a call to :meth:`release`.
+
+        :param config: AsgardeoConfig instance with the pool settings
+        :return: Shared httpx.AsyncClient
+        """
+        key = self._pool_key(config)
+        session = self._sessions.get(key)
+        if session is None or session.is_closed:
+            if session is not None:
+                self._keys.pop(id(session), None)
+            session = self._create_session(config)
+            self._sessions[key] = session
+            self._keys[id(session)] = key
+            self._refcounts[key] = 0
+        self._refcounts[key] += 1
+        return session
+
+    async def release(self, session: httpx.AsyncClient) -> None:
+        """Release a session acquired from this provider.
+
+        Sessions that were not acquired from this provider are closed directly.
+
+        :param session: Session returned by :meth:`acquire`
+        """
+        key = self._keys.get(id(session))
+        if key is None or self._sessions.get(key) is not session:
+            await session.aclose()
+            return
+        self._refcounts[key] -= 1
+        if self._refcounts[key] <= 0:
+            del self._sessions[key]
+            del self._keys[id(session)]
+            del self._refcounts[key]
+            await session.aclose()
+
+    async def aclose(self) -> None:
+        """Close every session held by this provider."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._keys.clear()
+        self._refcounts.clear()
+        for session in sessions:
+            await session.aclose()
+
+
+default_session_provider = SessionProvider()
@@ -0,0 +1,246 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Local validation of JWT access and ID tokens."""
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+import httpx
+
+from ..models import (
+    AsgardeoConfig,
+    AsgardeoError,
+    NetworkError,
+    TokenValidationError,
+)
+from .cache import ClaimsCache
+from .discovery import default_provider_metadata, provider_metadata_for
+from .jwt import (
+    SUPPORTED_ALGORITHMS,
+    _require_cryptography,
+    decode_jwt,
+    public_key_from_jwk,
+    verify_signature,
+)
+from .singleflight import SingleFlight
+from .telemetry import Metric, instrumentation_for, traced
+from .transport import SessionProvider, default_session_provider
+
+logger = logging.getLogger(__name__)
+
+
+class TokenValidator:
+    """Validates JWT access and ID tokens in-process using the tenant JWKS.
+
+    The JWKS is fetched once and cached. It is refetched when the cache TTL elapses or
+    when a token is signed with an unknown ``kid`` (at most once per
+    ``min_refresh_interval``), so signing key rotation is picked up without a network
+    call per validation. Validated claims are kept in a ClaimsCache until the token
+    expires, so repeated validations of the same token are a dictionary lookup.
+    Requires the optional ``cryptography`` package (``pip install asgardeo[jwt]``).
+    """
+
+    def __init__(
+        self,
+        config: AsgardeoConfig,
+        audience: str | None = None,
+        issuer: str | None = None,
+        jwks_uri: str | None = None,
+        algorithms: Iterable[str] = SUPPORTED_ALGORITHMS,
+        leeway: float = 60.0,
+        jwks_cache_ttl: float = 3600.0,
+        min_refresh_interval: float = 30.0,
+        session_provider: SessionProvider | None = None,
+        claims_cache: ClaimsCache | None = None,
+    ) -> None:
+        """Initialize the token validator.
+
+        :param config: AsgardeoConfig instance with configuration
+        :param audience: Expected audience (defaults to config.client_id)
+        :param issuer: Expected issuer (defaults to the tenant issuer)
+        :param jwks_uri: JWKS endpoint (defaults to the tenant JWKS endpoint)
+        :param algorithms: Accepted signing algorithms
+        :param leeway: Allowed clock skew in seconds for exp and nbf
+        :param jwks_cache_ttl: Seconds after which the JWKS is refetched
+        :param min_refresh_interval: Minimum seconds between JWKS fetches triggered by unknown key ids
+        :param session_provider: Optional provider of the shared HTTP session (defaults to the process-wide provider)
+        :param claims_cache: Optional cache of validated claims (a default cache is created if not provided)
+        """
+        _require_cryptography()
+        self.config = config
+        self.base_url = config.base_url.rstrip("/")
+        self.audience = audience or config.client_id
+        metadata = default_provider_metadata.cached(config)
+        self.issuer = issuer or metadata.issuer
+        self.jwks_uri = jwks_uri or metadata.jwks_uri
+        self._discover_issuer = issuer is None
+        self._discover_jwks_uri = jwks_uri is None
+        self.algorithms = frozenset(algorithms)
+        self.leeway = leeway
+        self.jwks_cache_ttl = jwks_cache_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.session_provider = session_provider or default_session_provider
+        self.session = self.session_provider.acquire(config)
+        self._keys: dict[str | None, Any] | None = None
+        self._fetched_at = 0.0
+        self._singleflight = SingleFlight()
+        self.claims_cache = claims_cache if claims_cache is not None else ClaimsCache()
+        self._closed = False
+
+    async def validate(self, token: str, audience: str | None = None) -> dict[str, Any]:
+        """Validate a JWT and return its claims.
+
+        Verifies the signature, exp, nbf, iss and aud claims.
+
+        :param token: Compact serialized JWT (e.g. OAuthToken.access_token or id_token)
+        :param audience: Expected audience overriding the validator default
+        :return: Dictionary of token claims
+        """
+        audience = audience or self.audience
+        claims = self.claims_cache.get(self._cache_key(token, audience))
+        instrumentation = instrumentation_for(self.config)
+        if claims is not None:
+            instrumentation.count(Metric.CACHE_HITS, attributes={"cache": "claims"})
+            return claims
+        instrumentation.count(Metric.CACHE_MISSES, attributes={"cache": "claims"})
+
+        header, claims, signing_input, signature = decode_jwt(token)
+        algorithm = header.get("alg")
+        if algorithm not in self.algorithms:
+            raise TokenValidationError(f"JWT algorithm not allowed: {algorithm}")
+
+        key = await self._get_key(header.get("kid"))
+        verify_signature(key, algorithm, signing_input, signature)
+        self._validate_claims(claims, audience)
+        self.claims_cache.set(self._cache_key(token, audience), claims)
+        return claims
+
+    def _cache_key(self, token: str, audience: str) -> bytes:
+        """Return the claims cache key of a token for the settings of this validator.
+
+        The key includes the issuer, JWKS URI and accepted algorithms, so validators of
+        other tenants sharing the claims cache never see each other's results.
+        """
+        return ClaimsCache.token_key(
+            token,
+            audience,
+            self.issuer,
+            self.jwks_uri,
+            ",".join(sorted(self.algorithms)),
+        )
+
+    def _validate_claims(self, claims: dict[str, Any], audience: str | None) -> None:
+        """Validate the registered claims of a token."""
+        now = time.time()
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise TokenValidationError("JWT has no valid 'exp' claim.")
+        if now > exp + self.leeway:
+            raise TokenValidationError("JWT has expired.")
+        nbf = claims.get("nbf")
+        if isinstance(nbf, (int, float)) and now + self.leeway < nbf:
+            raise TokenValidationError("JWT is not valid yet.")
+        if self.issuer and claims.get("iss") != self.issuer:
+            raise TokenValidationError(f"Invalid JWT issuer: {claims.get('iss')}")
+        if audience:
+            token_audience = claims.get("aud")
+            if isinstance(token_audience, str):
+                token_audience = [token_audience]
+            if not token_audience or audience not in token_audience:
+                raise TokenValidationError(f"Invalid JWT audience: {claims.get('aud')}")
+
+    async def _get_key(self, kid: str | None) -> Any:
+        """Return the signing key for a key id, refreshing the JWKS when needed."""
+        if self._keys is None or time.monotonic() - self._fetched_at >= self.jwks_cache_ttl:
+            try:
+                await self._singleflight.do("jwks", self._load_keys)
+            except AsgardeoError as e:
+                if self._keys is None:
+                    raise
+                logger.warning(f"JWKS refresh failed, using cached keys: {e}")
+
+        key = self._lookup_key(kid)
+        if key is None and time.monotonic() - self._fetched_at >= self.min_refresh_interval:
+            # Unknown key id, the signing keys may have been rotated.
+            await self._singleflight.do("jwks", self._load_keys)
+            key = self._lookup_key(kid)
+        if key is None:
+            raise TokenValidationError(f"No signing key found for key id: {kid}")
+        return key
+
+    def _lookup_key(self, kid: str | None) -> Any:
+        """Find a cached key by id, falling back to the only key when the token has no kid."""
+        if kid is None and len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(kid)
+
+    @traced("jwks")
+    async def _load_keys(self) -> None:
+        """Fetch the JWKS and replace the cached keys."""
+        if self._discover_issuer or self._discover_jwks_uri:
+            metadata = await provider_metadata_for(self.config, self.session)
+            if self._discover_issuer:
+                self.issuer = metadata.issuer
+            if self._discover_jwks_uri:
+                self.jwks_uri = metadata.jwks_uri
+        try:
+            sent_at = time.perf_counter()
+            response = await self.session.get(self.jwks_uri, headers={"Accept": "application/json"})
+            instrumentation_for(self.config).record_request(
+                "jwks",
+                response.status_code,
+                time.perf_counter() - sent_at,
+            )
+            response.raise_for_status()
+            jwks = response.json()
+        except httpx.HTTPStatusError as e:
+            raise TokenValidationError(
+                f"JWKS request failed: {e.response.status_code} {e.response.text}",
+                status_code=e.response.status_code,
+            )
+        except httpx.RequestError as e:
+            raise NetworkError(f"Network error during JWKS request: {e!s}")
+        except Exception as e:
+            raise AsgardeoError(f"Unexpected error during JWKS request: {e!s}")
+
+        keys = {}
+        for jwk in jwks.get("keys", []):
+            if jwk.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[jwk.get("kid")] = public_key_from_jwk(jwk)
+            except (AsgardeoError, KeyError, ValueError) as e:
+                logger.warning(f"Skipping unsupported JWK {jwk.get('kid')}: {e}")
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+        return False
+
+    async def close(self):
+        """Close the validator and cleanup resources."""
+        if self._closed:
+            return
+        self._closed = True
+        await self.session_provider.release(self.session)
@@ -17,12 +17,22 @@ under the License.
 
 """Data models for Asgardeo SDK."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 
 class AsgardeoError(Exception):
     """Base exception class for Asgardeo SDK errors."""
 
+    def __init__(self, message: str = "", status_code: int | None = None) -> None:
+        """Initialize the error.
+
+        :param message: Error message
+        :param status_code: HTTP status code of the failed response, if any
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class AuthenticationError(AsgardeoError):
     """Raised when authentication fails."""
@@ -32,23 +42,134 @@ class TokenError(AsgardeoError):
     """Raised when token operations fail."""
 
 
+class TokenValidationError(TokenError):
+    """Raised when a token fails local validation."""
+
+
 class NetworkError(AsgardeoError):
     """Raised when network requests fail."""
 
 
+class CircuitOpenError(NetworkError):
+    """Raised without sending a request while the circuit breaker of an endpoint is open."""
+
+
 class ValidationError(AsgardeoError):
     """Raised when input validation fails."""
 
 
+@dataclass
+class RetryPolicy:
+    """Retry policy for requests to Asgardeo.
+
+    Failed requests are retried with decorrelated jitter backoff: each delay is drawn
+    from ``[base_delay, 3 * previous delay]`` and capped at max_delay. A ``Retry-After``
+    header longer than the computed delay is honoured. No retry is started once the
+    total time would exceed deadline seconds.
+
+    Requests that must not be replayed (authorization code and refresh token grants,
+    authentication steps) are only retried when they never reached the server
+    (connection errors) or were rejected with 429, so consumed authorization codes,
+    rotated refresh tokens and submitted credentials are never sent twice.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 5.0
+    deadline: float | None = 30.0
+    retry_statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+
+
+@dataclass
+class CircuitBreakerPolicy:
+    """Thresholds of the per-endpoint circuit breakers.
+
+    The outcomes of the last window_size requests to an endpoint are tracked. Network
+    errors, 429 and 5xx responses count as failures, and requests slower than
+    slow_call_duration seconds count as slow. Once at least minimum_calls outcomes are
+    recorded and the failure or slow call rate reaches its threshold, the circuit opens
+    and requests fail fast for open_duration seconds. Then up to half_open_max_calls
+    probe requests are let through, closing the circuit if they all succeed.
+    """
+
+    failure_rate_threshold: float = 0.5
+    slow_call_duration: float | None = None
+    slow_call_rate_threshold: float = 0.8
+    window_size: int = 20
+    minimum_calls: int = 10
+    open_duration: float = 30.0
+    half_open_max_calls: int = 1
+
+
+@dataclass
+class RateLimitPolicy:
+    """Client-side limits of the requests to one endpoint.
+
+    Requests are admitted by a token bucket refilled at rate requests per second and
+    holding up to burst tokens, and at most max_in_flight requests are in flight at once.
+    None disables the respective limit. Waiting requests are admitted in priority order
+    (see request_priority), first come first served within a priority.
+    """
+
+    rate: float | None = None
+    burst: int = 10
+    max_in_flight: int | None = None
+
+
 @dataclass
 class AsgardeoConfig:
-    """Configuration for Asgardeo clients."""
+    """Configuration for Asgardeo clients.
+
+    The connection pool settings (max_connections, max_keepalive_connections,
+    keepalive_expiry and timeout) apply to the HTTP session shared by all clients
+    created with an equivalent configuration. None disables the respective limit.
+    Setting http2 multiplexes concurrent requests over a few connections (requires the
+    ``h2`` package); http2_max_concurrent_streams caps the streams per connection
+    (only applied together with max_connections).
+    Token introspection results are cached for introspection_cache_ttl seconds
+    (capped at the token expiry), 0 disables the cache.
+    When private_key (a PEM encoded key) is set, the client authenticates with a signed
+    JWT assertion (private_key_jwt) instead of the client_secret.
+    Transient failures are retried according to retry_policy. Setting circuit_breaker
+    enables a circuit breaker per endpoint, shared by all clients in the process.
+    rate_limits maps endpoint names ('authorize', 'authn', 'token', 'revoke',
+    'introspect') to the RateLimitPolicy of a limiter shared by all clients in the process.
+    flow_state_secret signs serialized FlowState values (see
+    AsgardeoNativeAuthClient.authenticate_flow), which are rejected once older than
+    flow_state_max_age seconds.
+    instrumentation receives the spans and metrics of the clients (an Instrumentation
+    such as OpenTelemetryInstrumentation); None reports nothing.
+    With discovery enabled, endpoint URLs are read from the tenant's OpenID Connect
+    discovery document (discovery_url, defaulting to the tenant's well-known
+    openid-configuration), fetched once per process and revalidated after its
+    Cache-Control max-age, or after discovery_ttl seconds if it has none.
+    """
 
     base_url: str
     client_id: str
     redirect_uri: str
     client_secret: str | None = None
     scope: str = "openid internal_login"
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    timeout: float | None = 5.0
+    http2: bool = False
+    http2_max_concurrent_streams: int | None = None
+    introspection_cache_ttl: float = 60.0
+    private_key: str | None = None
+    private_key_id: str | None = None
+    client_assertion_algorithm: str = "RS256"
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    circuit_breaker: CircuitBreakerPolicy | None = None
+    rate_limits: dict[str, RateLimitPolicy] | None = None
+    flow_state_secret: str | None = None
+    flow_state_max_age: float = 600.0
+    instrumentation: Any = None
+    discovery: bool = False
+    discovery_url: str | None = None
+    discovery_ttl: float = 3600.0
 
 
 @dataclass
@@ -61,6 +182,7 @@ class OAuthToken:
     expires_in: int | None = None
     token_type: str = "Bearer"
     scope: str | None = None
+    issued_token_type: str | None = None
 
 
 class FlowStatus:
@@ -68,3 +190,48 @@ class FlowStatus:
 
     SUCCESS_COMPLETED = "SUCCESS_COMPLETED"
     INCOMPLETE = "INCOMPLETE"
+
+
+@dataclass
+class FlowState:
+    """State of an App Native Authentication flow, independent of any client instance."""
+
+    flow_id: str | None = None
+    flow_status: str | None = None
+    next_step: dict[str, Any] | None = None
+    auth_data: dict[str, Any] | None = None
+    code_verifier: str | None = None
+    issued_at: float | None = None
+
+    @property
+    def completed(self) -> bool:
+        """Whether the flow completed successfully."""
+        return self.flow_status == FlowStatus.SUCCESS_COMPLETED
+
+
+class GrantType:
+    """OAuth 2.0 grant type constants."""
+
+    AUTHORIZATION_CODE = "authorization_code"
+    REFRESH_TOKEN = "refresh_token"
+    CLIENT_CREDENTIALS = "client_credentials"
+    TOKEN_EXCHANGE = "urn:ietf:params:oauth:grant-type:token-exchange"
+
+
+class TokenType:
+    """Token type identifiers for token exchange (RFC 8693)."""
+
+    ACCESS_TOKEN = "urn:ietf:params:oauth:token-type:access_token"
+    REFRESH_TOKEN = "urn:ietf:params:oauth:token-type:refresh_token"
+    ID_TOKEN = "urn:ietf:params:oauth:token-type:id_token"
+    JWT = "urn:ietf:params:oauth:token-type:jwt"
+
+
+@dataclass
+class RevocationResult:
+    """Result of revoking a single token."""
+
+    token: str
+    revoked: bool
+    attempts: int
+    error: str | None = None
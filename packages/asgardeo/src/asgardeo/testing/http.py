@@ -0,0 +1,149 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Minimal HTTP/1.1 server running an httpx request handler."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_MAX_HEADER_LINES = 100
+_HOP_BY_HOP_HEADERS = frozenset({"connection", "content-length", "keep-alive", "transfer-encoding"})
+
+
+class LocalServer:
+    """Serves an async httpx request handler over HTTP/1.1 with keep-alive.
+
+    Meant for tests and benchmarks on the loopback interface, not for production
+    traffic: it supports Content-Length request bodies only and no TLS.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[httpx.Request], Awaitable[httpx.Response]],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        tenant: str = "mock",
+    ) -> None:
+        """Initialize the server.
+
+        :param handler: Coroutine function turning a request into a response
+        :param host: Host to listen on
+        :param port: Port to listen on, 0 picks a free port
+        :param tenant: Tenant name used in base_url
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.tenant = tenant
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the served tenant, to be used as AsgardeoConfig.base_url."""
+        return f"http://{self.host}:{self.port}/t/{self.tenant}"
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening and close all connections."""
+        if self._server is None:
+            return
+        self._server.close()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of one connection until it is closed."""
+        self.connections += 1
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                try:
+                    response = await self.handler(request)
+                    response.read()
+                except Exception as e:
+                    logger.error(f"Request handler failed: {e}")
+                    response = httpx.Response(500)
+                keep_alive = request.headers.get("Connection", "").lower() != "close"
+                writer.write(self._encode_response(response, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by close(), the connection is simply dropped.
+            pass
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> httpx.Request | None:
+        """Read one request, returning None when the client closed the connection."""
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+        headers = []
+        for _ in range(_MAX_HEADER_LINES):
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers.append((name.strip(), value.strip()))
+        else:
+            raise ValueError("Too many request headers.")
+        length = int(dict((name.lower(), value) for name, value in headers).get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        return httpx.Request(method, f"http://{self.host}:{self.port}{target}", headers=headers, content=body)
+
+    @staticmethod
+    def _encode_response(response: httpx.Response, keep_alive: bool) -> bytes:
+        """Serialize a response."""
+        lines = [f"HTTP/1.1 {response.status_code} {response.reason_phrase}"]
+        lines.extend(
+            f"{name}: {value}" for name, value in response.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        )
+        lines.append(f"Content-Length: {len(response.content)}")
+        lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + response.content
+
+    async def __aenter__(self):
+        """Async context manager entry, starts the server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+        return False
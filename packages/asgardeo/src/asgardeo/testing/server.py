@@ -0,0 +1,692 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Stand-in for the Asgardeo OAuth2 and App Native Authentication endpoints."""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import math
+import random
+import secrets
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qsl, unquote_plus
+
+import httpx
+
+from ..auth.jwt import _require_cryptography, b64url_encode, decode_jwt, sign_jwt, verify_signature
+from ..models import AsgardeoError, FlowStatus, GrantType, TokenType
+from .http import LocalServer
+
+BASIC_AUTHENTICATOR = {
+    "authenticatorId": "BasicAuthenticator",
+    "authenticator": "Username & Password",
+    "idp": "LOCAL",
+    "metadata": {
+        "i18nKey": "authenticator.basic",
+        "promptType": "USER_PROMPT",
+        "params": [
+            {"param": "username", "type": "STRING", "order": 0, "confidential": False},
+            {"param": "password", "type": "STRING", "order": 1, "confidential": True},
+        ],
+    },
+    "requiredParams": ["username", "password"],
+}
+_NEXT_STEP = {"stepType": "AUTHENTICATOR_PROMPT", "authenticators": [BASIC_AUTHENTICATOR]}
+_ENDPOINTS = {
+    "authorize": "authorize",
+    "authn": "authn",
+    "token": "token",
+    "revoke": "revoke",
+    "introspect": "introspect",
+    "jwks": "jwks",
+    "token/.well-known/openid-configuration": "discovery",
+}
+_CLIENT_ASSERTION_TYPE = "urn:ietf:params:oauth:client-assertion-type:jwt-bearer"
+# Grants a public client (one without credentials) may use.
+_PUBLIC_GRANTS = (GrantType.AUTHORIZATION_CODE, GrantType.REFRESH_TOKEN)
+# Expired tokens are pruned after every this many issued tokens.
+_PRUNE_INTERVAL = 1024
+
+
+class Latency:
+    """Distribution of simulated endpoint latencies in seconds."""
+
+    def __init__(self, sample: Callable[[random.Random], float]) -> None:
+        """Initialize the distribution.
+
+        :param sample: Callable drawing one latency from a random number generator
+        """
+        self._sample = sample
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency, never negative.
+
+        :param rng: Random number generator
+        :return: Latency in seconds
+        """
+        return max(0.0, self._sample(rng))
+
+    @classmethod
+    def constant(cls, seconds: float) -> "Latency":
+        """Always the same latency."""
+        return cls(lambda rng: seconds)
+
+    @classmethod
+    def uniform(cls, low: float, high: float) -> "Latency":
+        """Latency uniformly distributed between low and high."""
+        return cls(lambda rng: rng.uniform(low, high))
+
+    @classmethod
+    def normal(cls, mean: float, stddev: float) -> "Latency":
+        """Normally distributed latency, cut off at 0."""
+        return cls(lambda rng: rng.gauss(mean, stddev))
+
+    @classmethod
+    def lognormal(cls, median: float, p99: float) -> "Latency":
+        """Long-tailed latency given by its median and 99th percentile."""
+        if not 0 < median <= p99:
+            raise ValueError("median must be positive and not above p99.")
+        mu = math.log(median)
+        sigma = (math.log(p99) - mu) / 2.326
+        return cls(lambda rng: rng.lognormvariate(mu, sigma))
+
+
+@dataclass
+class EndpointProfile:
+    """Simulated behaviour of one endpoint.
+
+    A fraction error_rate of the requests fail with error_status. Of every
+    rate_limit_every requests the last rate_limit_burst are rejected with 429 and a
+    Retry-After of retry_after seconds, which simulates periodic bursts of rate limiting.
+    """
+
+    latency: Latency | float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_every: int | None = None
+    rate_limit_burst: int = 1
+    retry_after: float | None = 1.0
+
+
+@dataclass
+class _Flow:
+    """Pending native authentication flow."""
+
+    client_id: str
+    scope: str
+    state: str | None
+    code_challenge: str | None
+
+
+@dataclass
+class _Grant:
+    """Subject and scope an authorization code or refresh token was issued for."""
+
+    subject: str
+    client_id: str
+    scope: str
+    code_challenge: str | None = None
+    actor: str | None = None
+    expires_at: float | None = None
+
+
+class MockAsgardeoServer:
+    """In-process stand-in for an Asgardeo tenant.
+
+    Serves /oauth2/authorize (direct response mode), /oauth2/authn, /oauth2/token
+    (authorization_code with PKCE, refresh_token, client_credentials and token
+    exchange), /oauth2/revoke, /oauth2/introspect, /oauth2/jwks and the discovery
+    document at /oauth2/token/.well-known/openid-configuration under any base path,
+    either through :meth:`transport` as an httpx mock transport or through
+    :meth:`serve` as a local HTTP server. Latency, errors and 429 bursts are simulated
+    per endpoint ('authorize', 'authn', 'token', 'revoke', 'introspect', 'jwks',
+    'discovery') and are reproducible for a given seed and request order.
+
+    Access and ID tokens are JWTs. By default they are signed with HS256 and a random
+    secret, which clients can decode but not verify; with sign_tokens they are signed
+    with RS256 and the key is published at the JWKS endpoint (requires ``cryptography``).
+
+    The token, revoke and introspect endpoints authenticate the client with
+    client_secret_post, client_secret_basic or private_key_jwt. Client assertions are
+    verified against client_keys: signature, iss and sub equal to the client id, aud
+    equal to the token endpoint, exp, and jti against replay. Requests without
+    credentials are only accepted to redeem authorization codes with a PKCE code
+    verifier, and from public clients to redeem authorization codes and refresh tokens.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, EndpointProfile] | None = None,
+        default_profile: EndpointProfile | None = None,
+        users: dict[str, str] | None = None,
+        token_lifetime: int = 3600,
+        code_lifetime: int = 300,
+        rotate_refresh_tokens: bool = True,
+        sign_tokens: bool = False,
+        seed: int | None = None,
+        discovery_max_age: int | None = 3600,
+        clients: dict[str, str | None] | None = None,
+        client_keys: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the mock server.
+
+        :param profiles: Behaviour per endpoint name
+        :param default_profile: Behaviour of endpoints without a profile (defaults to no latency and no errors)
+        :param users: Usernames and passwords accepted by the authn endpoint, None accepts any non-empty password
+        :param token_lifetime: Lifetime of access tokens in seconds
+        :param code_lifetime: Lifetime of authorization codes in seconds
+        :param rotate_refresh_tokens: Issue a new refresh token on every refresh and invalidate the old one
+        :param sign_tokens: Sign tokens with RS256 and publish the key at the JWKS endpoint
+        :param seed: Seed of the random number generator for reproducible latencies and errors
+        :param discovery_max_age: Cache-Control max-age of the discovery document, None sends no Cache-Control
+        :param clients: Client ids and their secrets, a None secret registers a public client;
+            None accepts any client id with any non-empty secret
+        :param client_keys: Public keys (cryptography objects) of the clients using private_key_jwt, by client id
+        """
+        self.profiles = dict(profiles or {})
+        self.default_profile = default_profile or EndpointProfile()
+        self.users = users
+        self.token_lifetime = token_lifetime
+        self.code_lifetime = code_lifetime
+        self.rotate_refresh_tokens = rotate_refresh_tokens
+        self.discovery_max_age = discovery_max_age
+        self.clients = clients
+        self.client_keys = dict(client_keys or {})
+        self.requests: Counter = Counter()
+        self.responses: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._flows: dict[str, _Flow] = {}
+        self._codes: dict[str, _Grant] = {}
+        self._refresh_tokens: dict[str, _Grant] = {}
+        self._access_tokens: dict[str, dict[str, Any]] = {}
+        self._assertion_ids: dict[str, float] = {}
+        self._issued = 0
+        self._hmac_key = secrets.token_bytes(32)
+        self._signing_key = None
+        self._kid = uuid.uuid4().hex[:16]
+        if sign_tokens:
+            _require_cryptography()
+            from cryptography.hazmat.primitives.asymmetric import rsa
+
+            self._signing_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def transport(self) -> httpx.MockTransport:
+        """Return an httpx transport routing requests to this server.
+
+        Pass it to ``SessionProvider(transport=...)``; the base URL of the clients can be
+        any URL, e.g. 'https://localhost/t/mock'.
+
+        :return: httpx mock transport
+        """
+        return httpx.MockTransport(self.handle)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0, tenant: str = "mock") -> LocalServer:
+        """Return a local HTTP server for this mock, started with ``async with``.
+
+        :param host: Host to listen on
+        :param port: Port to listen on, 0 picks a free port
+        :param tenant: Tenant name used in LocalServer.base_url
+        :return: LocalServer
+        """
+        return LocalServer(self.handle, host=host, port=port, tenant=tenant)
+
+    def issue_code(
+        self,
+        subject: str,
+        scope: str = "openid",
+        client_id: str = "client-id",
+        code_challenge: str | None = None,
+    ) -> str:
+        """Issue an authorization code as if the user had signed in through the browser.
+
+        :param subject: User the code is issued for
+        :param scope: Granted scopes
+        :param client_id: Client the code is issued to
+        :param code_challenge: Optional S256 PKCE code challenge
+        :return: Authorization code
+        """
+        code = secrets.token_urlsafe(24)
+        self._codes[code] = _Grant(
+            subject=subject,
+            client_id=client_id,
+            scope=scope,
+            code_challenge=code_challenge,
+            expires_at=time.time() + self.code_lifetime,
+        )
+        return code
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Handle one request.
+
+        :param request: HTTP request
+        :return: HTTP response
+        """
+        base, _, name = request.url.path.rpartition("/oauth2/")
+        endpoint = _ENDPOINTS.get(name)
+        if endpoint is None:
+            return httpx.Response(404, json={"error": "not_found"})
+        self.requests[endpoint] += 1
+        profile = self.profiles.get(endpoint, self.default_profile)
+        latency = profile.latency
+        delay = latency.sample(self._rng) if isinstance(latency, Latency) else latency
+        response = self._fault(endpoint, profile)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if response is None:
+            issuer = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}{base}/oauth2/token"
+            response = getattr(self, f"_handle_{endpoint}")(request, issuer)
+        self.responses[endpoint, response.status_code] += 1
+        return response
+
+    def _fault(self, endpoint: str, profile: EndpointProfile) -> httpx.Response | None:
+        """Return a simulated rate limit or error response, or None."""
+        every = profile.rate_limit_every
+        if every and (self.requests[endpoint] - 1) % every >= every - profile.rate_limit_burst:
+            headers = {}
+            if profile.retry_after is not None:
+                headers["Retry-After"] = f"{profile.retry_after:g}"
+            return httpx.Response(429, headers=headers, json={"error": "rate_limit_exceeded"})
+        if profile.error_rate and self._rng.random() < profile.error_rate:
+            return httpx.Response(profile.error_status, json={"error": "server_error"})
+        return None
+
+    def _handle_authorize(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Initiate a native authentication flow."""
+        form = _form(request)
+        if form.get("response_type") != "code" or not form.get("client_id"):
+            return _oauth_error("invalid_request", "client_id and response_type=code are required.")
+        if form.get("response_mode") != "direct":
+            return _oauth_error("invalid_request", "Only response_mode=direct is supported.")
+        flow_id = str(uuid.uuid4())
+        self._flows[flow_id] = _Flow(
+            client_id=form["client_id"],
+            scope=form.get("scope", "openid"),
+            state=form.get("state"),
+            code_challenge=form.get("code_challenge"),
+        )
+        return httpx.Response(200, json={
+            "flowId": flow_id,
+            "flowStatus": FlowStatus.INCOMPLETE,
+            "flowType": "AUTHENTICATION",
+            "nextStep": _NEXT_STEP,
+            "links": [{"name": "authentication", "href": "/oauth2/authn", "method": "POST"}],
+        })
+
+    def _handle_authn(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Perform an authentication step."""
+        try:
+            body = json.loads(request.content or b"{}")
+        except ValueError:
+            return _oauth_error("invalid_request", "The request body is not JSON.")
+        flow_id = body.get("flowId")
+        flow = self._flows.get(flow_id)
+        if flow is None:
+            return httpx.Response(400, json={"code": "ABA-60001", "message": "Invalid flow id."})
+        selected = body.get("selectedAuthenticator") or {}
+        params = selected.get("params") or {}
+        username, password = params.get("username"), params.get("password")
+        if selected.get("authenticatorId") != BASIC_AUTHENTICATOR["authenticatorId"] or not self._check_password(
+            username, password
+        ):
+            return httpx.Response(200, json={
+                "flowId": flow_id,
+                "flowStatus": "FAIL_INCOMPLETE",
+                "nextStep": _NEXT_STEP,
+            })
+        del self._flows[flow_id]
+        auth_data = {"code": self.issue_code(username, flow.scope, flow.client_id, flow.code_challenge)}
+        if flow.state:
+            auth_data["state"] = flow.state
+        return httpx.Response(200, json={"flowStatus": FlowStatus.SUCCESS_COMPLETED, "authData": auth_data})
+
+    def _handle_token(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Issue tokens for a grant."""
+        form = _form(request)
+        grant_type = form.get("grant_type")
+        # An authorization code redeemed with a PKCE code verifier is bound to its client without credentials.
+        pkce = grant_type == GrantType.AUTHORIZATION_CODE and "code_verifier" in form
+        client_id = self._authenticate_client(request, form, issuer, public=grant_type in _PUBLIC_GRANTS, pkce=pkce)
+        if client_id is None:
+            return _oauth_error("invalid_client", "Client authentication failed.", 401)
+
+        if grant_type == GrantType.AUTHORIZATION_CODE:
+            grant = self._codes.pop(form.get("code", ""), None)
+            if grant is None or grant.expires_at < time.time() or grant.client_id != client_id:
+                return _oauth_error("invalid_grant", "Invalid authorization code.")
+            if grant.code_challenge and not _verify_pkce(form.get("code_verifier"), grant.code_challenge):
+                return _oauth_error("invalid_grant", "PKCE validation failed.")
+            actor = None
+            if form.get("actor_token"):
+                actor_claims = self._active_claims(form["actor_token"])
+                if actor_claims is None:
+                    return _oauth_error("invalid_grant", "Invalid actor token.")
+                actor = actor_claims["sub"]
+            scope = form.get("scope") or grant.scope
+            return self._issue(issuer, grant.subject, client_id, scope, actor=actor)
+
+        if grant_type == GrantType.REFRESH_TOKEN:
+            refresh_token = form.get("refresh_token", "")
+            grant = self._refresh_tokens.get(refresh_token)
+            if grant is None or grant.client_id != client_id:
+                return _oauth_error("invalid_grant", "Invalid refresh token.")
+            if self.rotate_refresh_tokens:
+                del self._refresh_tokens[refresh_token]
+            return self._issue(
+                issuer,
+                grant.subject,
+                client_id,
+                grant.scope,
+                actor=grant.actor,
+                refresh_token=None if self.rotate_refresh_tokens else refresh_token,
+            )
+
+        if grant_type == GrantType.CLIENT_CREDENTIALS:
+            return self._issue(issuer, client_id, client_id, form.get("scope", ""), refresh=False)
+
+        if grant_type == GrantType.TOKEN_EXCHANGE:
+            subject_claims = self._active_claims(form.get("subject_token", ""))
+            if subject_claims is None:
+                return _oauth_error("invalid_grant", "Invalid subject token.")
+            response = self._issue(
+                issuer,
+                subject_claims["sub"],
+                client_id,
+                form.get("scope") or subject_claims.get("scope", ""),
+                audience=form.get("audience"),
+                refresh=False,
+            )
+            payload = json.loads(response.content)
+            payload["issued_token_type"] = TokenType.ACCESS_TOKEN
+            return httpx.Response(200, json=payload)
+
+        return _oauth_error("unsupported_grant_type", f"Unsupported grant type: {grant_type}")
+
+    def _handle_revoke(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Revoke an access or refresh token."""
+        form = _form(request)
+        if self._authenticate_client(request, form, issuer) is None:
+            return _oauth_error("invalid_client", "Client authentication failed.", 401)
+        token = form.get("token", "")
+        self._access_tokens.pop(token, None)
+        self._refresh_tokens.pop(token, None)
+        return httpx.Response(200)
+
+    def _handle_introspect(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Introspect an access or refresh token."""
+        form = _form(request)
+        if self._authenticate_client(request, form, issuer) is None:
+            return _oauth_error("invalid_client", "Client authentication failed.", 401)
+        token = form.get("token", "")
+        claims = self._active_claims(token)
+        if claims is not None:
+            return httpx.Response(200, json={"active": True, "token_type": "Bearer", **claims})
+        grant = self._refresh_tokens.get(token)
+        if grant is not None:
+            return httpx.Response(200, json={
+                "active": True,
+                "token_type": "Refresh",
+                "sub": grant.subject,
+                "client_id": grant.client_id,
+                "scope": grant.scope,
+            })
+        return httpx.Response(200, json={"active": False})
+
+    def _handle_jwks(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Publish the token signing key."""
+        if self._signing_key is None:
+            return httpx.Response(200, json={"keys": []})
+        numbers = self._signing_key.public_key().public_numbers()
+        return httpx.Response(200, json={"keys": [{
+            "kty": "RSA",
+            "use": "sig",
+            "alg": "RS256",
+            "kid": self._kid,
+            "n": b64url_encode(numbers.n.to_bytes((numbers.n.bit_length() + 7) // 8, "big")),
+            "e": b64url_encode(numbers.e.to_bytes((numbers.e.bit_length() + 7) // 8, "big")),
+        }]})
+
+    def _handle_discovery(self, request: httpx.Request, issuer: str) -> httpx.Response:
+        """Publish the OpenID Connect discovery document, answering 304 if it is unchanged."""
+        endpoints = issuer[: -len("/token")]
+        document = {
+            "issuer": issuer,
+            "authorization_endpoint": f"{endpoints}/authorize",
+            "token_endpoint": issuer,
+            "revocation_endpoint": f"{endpoints}/revoke",
+            "introspection_endpoint": f"{endpoints}/introspect",
+            "jwks_uri": f"{endpoints}/jwks",
+            "response_types_supported": ["code"],
+            "grant_types_supported": [
+                GrantType.AUTHORIZATION_CODE,
+                GrantType.REFRESH_TOKEN,
+                GrantType.CLIENT_CREDENTIALS,
+                GrantType.TOKEN_EXCHANGE,
+            ],
+            "code_challenge_methods_supported": ["S256"],
+            "id_token_signing_alg_values_supported": ["RS256" if self._signing_key else "HS256"],
+        }
+        content = json.dumps(document).encode()
+        headers = {"ETag": f'"{hashlib.sha256(content).hexdigest()[:32]}"'}
+        if self.discovery_max_age is not None:
+            headers["Cache-Control"] = f"public, max-age={self.discovery_max_age}"
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, headers={**headers, "Content-Type": "application/json"}, content=content)
+
+    def _issue(
+        self,
+        issuer: str,
+        subject: str,
+        client_id: str,
+        scope: str,
+        actor: str | None = None,
+        audience: str | None = None,
+        refresh: bool = True,
+        refresh_token: str | None = None,
+    ) -> httpx.Response:
+        """Issue an access token, and an ID token and a refresh token where applicable."""
+        self._issued += 1
+        if self._issued % _PRUNE_INTERVAL == 0:
+            self._prune()
+        now = int(time.time())
+        claims = {
+            "iss": issuer,
+            "sub": subject,
+            "aud": audience or client_id,
+            "client_id": client_id,
+            "scope": scope,
+            "iat": now,
+            "nbf": now,
+            "exp": now + self.token_lifetime,
+            "jti": uuid.uuid4().hex,
+        }
+        if actor:
+            claims["act"] = {"sub": actor}
+        access_token = self._sign(claims)
+        self._access_tokens[access_token] = claims
+        payload = {
+            "access_token": access_token,
+            "token_type": "Bearer",
+            "expires_in": self.token_lifetime,
+            "scope": scope,
+        }
+        if "openid" in scope.split():
+            payload["id_token"] = self._sign({
+                "iss": issuer,
+                "sub": subject,
+                "aud": client_id,
+                "iat": now,
+                "exp": now + self.token_lifetime,
+            })
+        if refresh:
+            refresh_token = refresh_token or secrets.token_urlsafe(32)
+            self._refresh_tokens[refresh_token] = _Grant(subject, client_id, scope, actor=actor)
+            payload["refresh_token"] = refresh_token
+        return httpx.Response(200, json=payload)
+
+    def _sign(self, claims: dict[str, Any]) -> str:
+        """Sign claims into a JWT."""
+        if self._signing_key is not None:
+            return sign_jwt(claims, self._signing_key, "RS256", kid=self._kid)
+        header = b64url_encode(b'{"alg":"HS256","typ":"JWT"}')
+        body = b64url_encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signature = hmac.new(self._hmac_key, f"{header}.{body}".encode("ascii"), hashlib.sha256).digest()
+        return f"{header}.{body}.{b64url_encode(signature)}"
+
+    def _active_claims(self, token: str) -> dict[str, Any] | None:
+        """Return the claims of an issued access token that is neither revoked nor expired."""
+        claims = self._access_tokens.get(token)
+        if claims is None or claims["exp"] <= time.time():
+            return None
+        return claims
+
+    def _authenticate_client(
+        self,
+        request: httpx.Request,
+        form: dict[str, str],
+        issuer: str,
+        public: bool = False,
+        pkce: bool = False,
+    ) -> str | None:
+        """Authenticate the client of a request.
+
+        :param request: HTTP request
+        :param form: Parsed form of the request
+        :param issuer: Token endpoint of the tenant, the expected client assertion audience
+        :param public: Whether a public client may make the request
+        :param pkce: Whether the request is bound to its client by PKCE, so any client may make it without credentials
+        :return: Client id, or None if client authentication failed
+        """
+        client_id = form.get("client_id")
+        basic = _basic_auth(request)
+        if basic is not None:
+            user, secret = basic
+            if client_id and client_id != user:
+                return None
+            return user if self._check_secret(user, secret) else None
+        if "client_assertion" in form:
+            if form.get("client_assertion_type") != _CLIENT_ASSERTION_TYPE:
+                return None
+            subject = self._verify_assertion(form["client_assertion"], issuer)
+            return subject if subject is not None and client_id in (None, subject) else None
+        if not client_id:
+            return None
+        if "client_secret" in form:
+            return client_id if self._check_secret(client_id, form["client_secret"]) else None
+        if pkce:
+            return client_id
+        if not public:
+            return None
+        if self.clients is not None and (client_id not in self.clients or self.clients[client_id] is not None):
+            return None
+        return client_id
+
+    def _check_secret(self, client_id: str, secret: str) -> bool:
+        """Check the secret of a confidential client."""
+        if not secret:
+            return False
+        if self.clients is None:
+            return True
+        expected = self.clients.get(client_id)
+        return expected is not None and hmac.compare_digest(expected.encode("utf-8"), secret.encode("utf-8"))
+
+    def _verify_assertion(self, assertion: str, issuer: str) -> str | None:
+        """Verify a private_key_jwt client assertion.
+
+        :param assertion: Signed JWT sent as client_assertion
+        :param issuer: Token endpoint of the tenant, the expected audience
+        :return: Client id the assertion was issued by, or None if it is invalid
+        """
+        try:
+            header, claims, signing_input, signature = decode_jwt(assertion)
+            client_id = claims.get("sub")
+            key = self.client_keys.get(client_id) if isinstance(client_id, str) else None
+            if key is None:
+                return None
+            verify_signature(key, header.get("alg"), signing_input, signature)
+        except AsgardeoError:
+            return None
+        audience = claims.get("aud")
+        audiences = audience if isinstance(audience, list) else [audience]
+        exp = claims.get("exp")
+        jti = claims.get("jti")
+        now = time.time()
+        if (
+            claims.get("iss") != client_id
+            or issuer not in audiences
+            or not isinstance(exp, (int, float))
+            or exp <= now
+            or not isinstance(jti, str)
+            or jti in self._assertion_ids
+        ):
+            return None
+        self._assertion_ids[jti] = exp
+        return client_id
+
+    def _check_password(self, username: str | None, password: str | None) -> bool:
+        """Check the credentials of a user."""
+        if not username or not password:
+            return False
+        if self.users is None:
+            return True
+        expected = self.users.get(username)
+        return expected is not None and hmac.compare_digest(expected, password)
+
+    def _prune(self) -> None:
+        """Forget expired access tokens and authorization codes."""
+        now = time.time()
+        self._access_tokens = {
+            token: claims for token, claims in self._access_tokens.items() if claims["exp"] > now
+        }
+        self._codes = {code: grant for code, grant in self._codes.items() if grant.expires_at > now}
+        self._assertion_ids = {jti: exp for jti, exp in self._assertion_ids.items() if exp > now}
+
+
+def _form(request: httpx.Request) -> dict[str, str]:
+    """Parse a form encoded request body."""
+    return dict(parse_qsl(request.content.decode("utf-8")))
+
+
+def _basic_auth(request: httpx.Request) -> tuple[str, str] | None:
+    """Return the user and password of HTTP basic authentication."""
+    scheme, _, value = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "basic":
+        return None
+    try:
+        user, _, password = base64.b64decode(value).decode("utf-8").partition(":")
+    except ValueError:
+        return None
+    return (unquote_plus(user), unquote_plus(password)) if user else None
+
+
+def _verify_pkce(code_verifier: str | None, code_challenge: str) -> bool:
+    """Verify an S256 PKCE code verifier."""
+    if not code_verifier:
+        return False
+    digest = b64url_encode(hashlib.sha256(code_verifier.encode("ascii")).digest())
+    return hmac.compare_digest(digest, code_challenge)
+
+
+def _oauth_error(error: str, description: str, status_code: int = 400) -> httpx.Response:
+    """Build an OAuth error response."""
+    return httpx.Response(status_code, json={"error": error, "error_description": description})
@@ -0,0 +1,65 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+"""Shared fixtures: a mock tenant and clients connected to it."""
+
+import pytest
+
+from asgardeo import (
+    AsgardeoConfig,
+    SessionProvider,
+    default_circuit_breakers,
+    default_provider_metadata,
+    default_rate_limiters,
+)
+from asgardeo.testing import MockAsgardeoServer
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Reset the process-wide registries between tests."""
+    yield
+    default_circuit_breakers.reset()
+    default_rate_limiters.clear()
+    default_provider_metadata.invalidate()
+
+
+@pytest.fixture
+def mock():
+    """Mock tenant with one confidential client, accepting any non-empty password."""
+    return MockAsgardeoServer(seed=1, clients={"client-id": "client-secret"})
+
+
+@pytest.fixture
+def session_provider(mock):
+    """Session provider routing every request to the mock tenant."""
+    return SessionProvider(transport=mock.transport())
+
+
+@pytest.fixture
+def config():
+    """Configuration of a confidential client of the mock tenant."""
+    return AsgardeoConfig(
+        base_url="https://localhost/t/mock",
+        client_id="client-id",
+        redirect_uri="https://localhost/callback",
+        client_secret="client-secret",
+    )
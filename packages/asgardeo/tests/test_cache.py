@@ -0,0 +1,131 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the token and claims caches."""
+
+import time
+
+import pytest
+
+from asgardeo import ClaimsCache, MemoryTokenStore, OAuthToken, TokenCache, normalize_scopes
+
+
+def token(name: str = "access", expires_in: int | None = 3600) -> OAuthToken:
+    return OAuthToken(access_token=name, refresh_token=f"{name}-refresh", expires_in=expires_in)
+
+
+def test_normalize_scopes():
+    assert normalize_scopes("b a  b") == ("a", "b")
+    assert normalize_scopes(["b", "a"]) == normalize_scopes("a b")
+    assert normalize_scopes(None) == ()
+
+
+def test_token_cache_hit_and_invalidate():
+    cache = TokenCache()
+    cache.set("key", token())
+    assert cache.get("key").access_token == "access"
+    cache.invalidate("key")
+    assert cache.get("key") is None
+
+
+def test_token_cache_skew():
+    cache = TokenCache(skew=30)
+    cache.set("key", token(expires_in=20))
+    assert cache.get("key") is None
+    cache.set("key", token(expires_in=40))
+    assert cache.get("key") is not None
+
+
+def test_token_cache_stale_ok_within_skew():
+    cache = TokenCache(skew=10)
+    cache.set("key", token(expires_in=60))
+    cache._entries["key"] = (cache._entries["key"][0], time.monotonic() - 1, time.monotonic() + 5)
+    assert cache.get("key") is None
+    assert cache.get("key", stale_ok=True) is not None
+
+
+def test_token_cache_skips_tokens_without_lifetime():
+    cache = TokenCache()
+    cache.set("key", token(expires_in=None))
+    assert len(cache) == 0
+
+
+def test_token_cache_lru_eviction():
+    cache = TokenCache(maxsize=2)
+    cache.set("a", token("a"))
+    cache.set("b", token("b"))
+    cache.get("a")
+    cache.set("c", token("c"))
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+
+
+def test_token_cache_discard_token():
+    cache = TokenCache()
+    cache.set("a", token("a"))
+    cache.set("b", token("b"))
+    cache.discard_token("a-refresh")
+    assert "a" not in cache
+    assert "b" in cache
+
+
+def test_token_cache_write_through_and_warm():
+    store = MemoryTokenStore()
+    cache = TokenCache(store=store)
+    cache.set(("agent", "a1", ("openid",)), token())
+
+    warmed = TokenCache(store=store)
+    assert warmed.get(("agent", "a1", ("openid",))).access_token == "access"
+
+    warmed.invalidate(("agent", "a1", ("openid",)))
+    assert len(TokenCache(store=store)) == 0
+
+
+@pytest.mark.anyio
+async def test_token_cache_fetch():
+    cache = TokenCache()
+
+    async def fetch():
+        return token("fetched")
+
+    assert (await cache.fetch("key", fetch)).access_token == "fetched"
+    assert cache.get("key").access_token == "fetched"
+
+
+def test_claims_cache_expiry_and_key_scope():
+    cache = ClaimsCache()
+    key = ClaimsCache.token_key("token", "audience")
+    assert key != ClaimsCache.token_key("token", "other")
+
+    cache.set(key, {"sub": "alice", "exp": time.time() + 60})
+    assert cache.get(key)["sub"] == "alice"
+
+    expired = ClaimsCache.token_key("expired")
+    cache.set(expired, {"sub": "bob", "exp": time.time() - 1})
+    assert cache.get(expired) is None
+    assert cache.stats().hits == 1
+
+
+def test_claims_cache_ttl_and_eviction():
+    cache = ClaimsCache(maxsize=2)
+    for name in ("a", "b", "c"):
+        cache.set(ClaimsCache.token_key(name), {"active": True}, ttl=60)
+    assert len(cache) == 2
+    assert cache.get(ClaimsCache.token_key("a")) is None
+    assert cache.stats().evictions == 1
+
+    cache.set(ClaimsCache.token_key("no-exp"), {"active": True})
+    assert cache.get(ClaimsCache.token_key("no-exp")) is None
@@ -0,0 +1,211 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Native authentication, token, introspection and revocation flows against the mock tenant."""
+
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+
+from asgardeo import (
+    AsgardeoNativeAuthClient,
+    AsgardeoTokenClient,
+    FlowStatus,
+    RetryPolicy,
+    SessionProvider,
+    TokenError,
+)
+from asgardeo.auth.jwt import decode_jwt
+from asgardeo.testing import MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_native_login(config, session_provider, mock):
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as client:
+        token = await client.authenticate_with_password("alice", "secret")
+
+    assert token.access_token
+    assert token.refresh_token
+    assert mock.requests["authorize"] == mock.requests["authn"] == mock.requests["token"] == 1
+
+
+async def test_native_login_rejects_wrong_password(config):
+    mock = MockAsgardeoServer(users={"alice": "secret"})
+    provider = SessionProvider(transport=mock.transport())
+    async with AsgardeoNativeAuthClient(config, session_provider=provider) as client:
+        await client.authenticate()
+        await client.authenticate(
+            authenticator_id="BasicAuthenticator",
+            params={"username": "alice", "password": "wrong"},
+        )
+        assert client.flow_status != FlowStatus.SUCCESS_COMPLETED
+    assert mock.requests["token"] == 0
+
+
+async def test_concurrent_logins_with_different_scopes(config, session_provider):
+    async def login(client, i):
+        flow = await client.authenticate_flow(scope=f"openid scope-{i}")
+        flow = await client.authenticate_flow(
+            flow,
+            authenticator_id="BasicAuthenticator",
+            params={"username": f"user-{i}", "password": "secret"},
+        )
+        return await client.get_flow_token(flow)
+
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as client:
+        tokens = await asyncio.gather(*(login(client, i) for i in range(10)))
+        assert [token.scope for token in tokens] == [f"openid scope-{i}" for i in range(10)]
+        # Without a scope the configured one is requested, the config is never modified.
+        assert (await client.authenticate_with_password("alice", "secret")).scope == config.scope
+    assert config.scope == "openid internal_login"
+
+
+async def test_refresh_token_rotation(config, session_provider):
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as client:
+        token = await client.authenticate_with_password("alice", "secret")
+        refreshed = await client.token_client.refresh_access_token(token.refresh_token)
+        assert refreshed.refresh_token != token.refresh_token
+        with pytest.raises(TokenError):
+            await client.token_client.refresh_access_token(token.refresh_token)
+
+
+async def test_introspection_is_cached_and_evicted_on_revoke(config, session_provider, mock):
+    async with AsgardeoTokenClient(config, session_provider=session_provider) as client:
+        token = await client.get_token("client_credentials")
+        assert (await client.introspect_token(token.access_token))["active"]
+        assert (await client.introspect_token(token.access_token))["active"]
+        assert mock.requests["introspect"] == 1
+
+        assert await client.revoke_token(token.access_token)
+        assert not (await client.introspect_token(token.access_token))["active"]
+        assert mock.requests["introspect"] == 2
+
+
+async def test_introspection_in_flight_during_revoke_is_not_cached(config, mock):
+    answered = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        # Answer introspections before the revocation but deliver them after it.
+        response = await mock.handle(request)
+        if request.url.path.endswith("/introspect"):
+            answered.set()
+            await release.wait()
+        return response
+
+    provider = SessionProvider(transport=httpx.MockTransport(handle))
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        token = await client.get_token("client_credentials")
+        introspection = asyncio.create_task(client.introspect_token(token.access_token))
+        await answered.wait()
+        assert await client.revoke_token(token.access_token)
+        release.set()
+        assert (await introspection)["active"]
+
+        assert not (await client.introspect_token(token.access_token))["active"]
+        assert mock.requests["introspect"] == 2
+
+
+def generate_key(algorithm):
+    """Generate a private key for a JWS algorithm and return it with its PEM encoding."""
+    pytest.importorskip("cryptography")
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+    if algorithm.startswith("ES"):
+        key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return key, pem.decode("ascii")
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "PS256", "ES256"])
+async def test_private_key_jwt(config, algorithm):
+    key, pem = generate_key(algorithm)
+    mock = MockAsgardeoServer(clients={}, client_keys={"client-id": key.public_key()})
+    assertions = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        form = dict(httpx.QueryParams(request.content.decode()))
+        assertions.append(form.get("client_assertion"))
+        assert "client_secret" not in form
+        return await mock.handle(request)
+
+    config = dataclasses.replace(
+        config,
+        client_secret=None,
+        private_key=pem,
+        private_key_id="key-1",
+        client_assertion_algorithm=algorithm,
+    )
+    provider = SessionProvider(transport=httpx.MockTransport(handle))
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        token = await client.get_token("client_credentials", scope="openid")
+        assert (await client.introspect_token(token.access_token))["active"]
+        assert await client.revoke_token(token.access_token)
+
+    assert mock.responses["token", 200] == mock.responses["introspect", 200] == mock.responses["revoke", 200] == 1
+    assert len(set(assertions)) == 3
+    header, claims, _, _ = decode_jwt(assertions[0])
+    assert header["alg"] == algorithm and header["kid"] == "key-1"
+    assert claims["iss"] == claims["sub"] == "client-id"
+    assert claims["aud"] == "https://localhost/t/mock/oauth2/token"
+
+
+async def test_private_key_jwt_retries_with_a_fresh_assertion(config):
+    key, pem = generate_key("RS256")
+    mock = MockAsgardeoServer(clients={}, client_keys={"client-id": key.public_key()})
+    assertions = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        # The first attempt reaches the server but its response is lost.
+        response = await mock.handle(request)
+        assertions.append(dict(httpx.QueryParams(request.content.decode()))["client_assertion"])
+        if len(assertions) == 1:
+            return httpx.Response(503)
+        return response
+
+    config = dataclasses.replace(
+        config,
+        client_secret=None,
+        private_key=pem,
+        retry_policy=RetryPolicy(base_delay=0.01),
+    )
+    provider = SessionProvider(transport=httpx.MockTransport(handle))
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        assert (await client.get_token("client_credentials")).access_token
+    assert len(assertions) == 2 and assertions[0] != assertions[1]
+    assert mock.responses["token", 200] == 2
+
+
+async def test_private_key_jwt_with_an_unregistered_key_fails(config):
+    key, _ = generate_key("RS256")
+    _, pem = generate_key("RS256")
+    mock = MockAsgardeoServer(clients={}, client_keys={"client-id": key.public_key()})
+    config = dataclasses.replace(config, client_secret=None, private_key=pem)
+    provider = SessionProvider(transport=mock.transport())
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        with pytest.raises(TokenError):
+            await client.get_token("client_credentials")
+    assert mock.responses["token", 401] == 1
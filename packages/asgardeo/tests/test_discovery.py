@@ -0,0 +1,160 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of OpenID Connect discovery and the endpoint metadata cache."""
+
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+
+from asgardeo import (
+    AsgardeoError,
+    AsgardeoTokenClient,
+    ProviderMetadata,
+    ProviderMetadataCache,
+    RetryPolicy,
+    SessionProvider,
+)
+from asgardeo.testing import EndpointProfile, MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def config(config):
+    """Configuration with discovery enabled and no retries."""
+    return dataclasses.replace(config, discovery=True, retry_policy=RetryPolicy(max_attempts=1))
+
+
+@pytest.fixture
+async def session(mock):
+    """HTTP session routed to the mock tenant."""
+    async with httpx.AsyncClient(transport=mock.transport()) as session:
+        yield session
+
+
+def test_metadata_from_document():
+    base_url = "https://localhost/t/mock"
+    metadata = ProviderMetadata.from_document(
+        {"authorization_endpoint": "https://idp.example/oauth2/authorize", "token_endpoint": "https://idp.example/token"},
+        base_url,
+    )
+    assert metadata.authn_endpoint == "https://idp.example/oauth2/authn"
+    assert metadata.token_endpoint == "https://idp.example/token"
+    assert metadata.jwks_uri == ProviderMetadata.from_base_url(base_url).jwks_uri
+    with pytest.raises(AsgardeoError):
+        ProviderMetadata.from_document(["not", "an", "object"], base_url)
+
+
+async def test_document_is_fetched_once_for_all_clients(config, mock):
+    provider = SessionProvider(transport=mock.transport())
+    async with AsgardeoTokenClient(config, session_provider=provider) as first:
+        async with AsgardeoTokenClient(config, session_provider=provider) as second:
+            await asyncio.gather(*(
+                client.get_token("client_credentials", scope=f"scope-{i}")
+                for i in range(5)
+                for client in (first, second)
+            ))
+    assert mock.requests["discovery"] == 1
+    assert mock.requests["token"] == 10
+
+
+async def test_endpoints_are_read_from_the_document(config, mock):
+    paths = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/openid-configuration"):
+            response = await mock.handle(request)
+            document = response.json()
+            document["token_endpoint"] = "https://localhost/t/moved/oauth2/token"
+            return httpx.Response(200, json=document)
+        return await mock.handle(request)
+
+    provider = SessionProvider(transport=httpx.MockTransport(handle))
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        token = await client.get_token("client_credentials")
+    assert token.access_token
+    assert paths == ["/t/mock/oauth2/token/.well-known/openid-configuration", "/t/moved/oauth2/token"]
+
+
+async def test_revalidation_with_etag(config):
+    mock = MockAsgardeoServer(seed=1, discovery_max_age=0)
+    cache = ProviderMetadataCache()
+    async with httpx.AsyncClient(transport=mock.transport()) as session:
+        metadata = await cache.get(config, session)
+        assert await cache.get(config, session) is metadata
+        assert await cache.get(config, session) is metadata
+    assert mock.responses["discovery", 200] == 1
+    assert mock.responses["discovery", 304] == 2
+
+
+async def test_revalidation_with_last_modified(config):
+    last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+    conditional = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        conditional.append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == last_modified:
+            return httpx.Response(304, headers={"Cache-Control": "no-cache"})
+        document = {"issuer": "https://localhost/t/mock/oauth2/token"}
+        return httpx.Response(200, headers={"Cache-Control": "no-cache", "Last-Modified": last_modified}, json=document)
+
+    cache = ProviderMetadataCache()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handle)) as session:
+        metadata = await cache.get(config, session)
+        assert await cache.get(config, session) is metadata
+    assert conditional == [None, last_modified]
+
+
+async def test_freshness_lifetime(config, mock, session):
+    cache = ProviderMetadataCache()
+    for _ in range(3):
+        await cache.get(config, session)
+    assert mock.requests["discovery"] == 1
+
+    mock.discovery_max_age = None
+    cache.invalidate(config)
+    no_ttl = dataclasses.replace(config, discovery_ttl=0)
+    for _ in range(3):
+        await cache.get(no_ttl, session)
+    # Without Cache-Control the document is kept for discovery_ttl.
+    assert mock.requests["discovery"] == 4
+
+
+async def test_stale_metadata_is_served_when_revalidation_fails(config):
+    mock = MockAsgardeoServer(seed=1, discovery_max_age=0)
+    cache = ProviderMetadataCache()
+    async with httpx.AsyncClient(transport=mock.transport()) as session:
+        metadata = await cache.get(config, session)
+        mock.profiles["discovery"] = EndpointProfile(error_rate=1.0)
+        assert await cache.get(config, session) is metadata
+        # The failed revalidation is not retried on every request.
+        assert await cache.get(config, session) is metadata
+        assert mock.responses["discovery", 503] == 1
+
+        cache.invalidate(config)
+        with pytest.raises(AsgardeoError):
+            await cache.get(config, session)
+
+
+async def test_discovery_disabled(config, mock, session):
+    config = dataclasses.replace(config, discovery=False)
+    metadata = await ProviderMetadataCache().get(config, session)
+    assert metadata == ProviderMetadata.from_base_url(config.base_url)
+    assert mock.requests["discovery"] == 0
@@ -0,0 +1,102 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of signed flow state and stateless native authentication flows."""
+
+import dataclasses
+import time
+
+import pytest
+
+from asgardeo import AsgardeoNativeAuthClient, FlowState, FlowStateSigner, FlowStatus, ValidationError
+
+STATE = FlowState(flow_id="flow-1", flow_status=FlowStatus.INCOMPLETE, code_verifier="verifier")
+
+
+def test_round_trip():
+    signer = FlowStateSigner("secret")
+    state = signer.loads(signer.dumps(STATE))
+    assert state.flow_id == "flow-1"
+    assert state.code_verifier == "verifier"
+    assert state.issued_at is not None
+
+
+@pytest.mark.parametrize("tamper", [
+    lambda value: value[:-2] + ("AA" if not value.endswith("AA") else "BB"),
+    lambda value: "x" + value,
+    lambda value: value.rpartition(".")[0] + ".",
+    lambda value: value.rpartition(".")[0] + ".é" * 4,
+    lambda value: "é" + value,
+])
+def test_tampered_state_is_rejected(tamper):
+    signer = FlowStateSigner("secret")
+    with pytest.raises(ValidationError):
+        signer.loads(tamper(signer.dumps(STATE)))
+
+
+@pytest.mark.parametrize("value", ["", ".", "no-signature", "é.é", None, 42])
+def test_malformed_state_is_rejected(value):
+    with pytest.raises(ValidationError):
+        FlowStateSigner("secret").loads(value)
+
+
+def test_validly_signed_garbage_is_rejected():
+    signer = FlowStateSigner("secret")
+    for payload in ("not-base64!", "AAAA"):
+        with pytest.raises(ValidationError):
+            signer.loads(f"{payload}.{signer._sign(signer._keys[0], payload)}")
+
+
+def test_key_rotation():
+    old = FlowStateSigner("old")
+    rotated = FlowStateSigner(["new", "old"])
+    assert rotated.loads(old.dumps(STATE)).flow_id == "flow-1"
+    assert FlowStateSigner("new").loads(rotated.dumps(STATE)).flow_id == "flow-1"
+    with pytest.raises(ValidationError):
+        FlowStateSigner("other").loads(rotated.dumps(STATE))
+
+
+def test_max_age():
+    signer = FlowStateSigner("secret", max_age=60)
+    assert signer.loads(signer.dumps(dataclasses.replace(STATE, issued_at=time.time() - 30)))
+    with pytest.raises(ValidationError):
+        signer.loads(signer.dumps(dataclasses.replace(STATE, issued_at=time.time() - 61)))
+    unlimited = FlowStateSigner("secret", max_age=None)
+    assert unlimited.loads(unlimited.dumps(dataclasses.replace(STATE, issued_at=1.0)))
+
+
+def test_empty_secret_is_rejected():
+    with pytest.raises(ValidationError):
+        FlowStateSigner([])
+    with pytest.raises(ValidationError):
+        FlowStateSigner(["secret", ""])
+
+
+@pytest.mark.anyio
+async def test_flow_continues_on_another_client(config, session_provider, mock):
+    config = dataclasses.replace(config, flow_state_secret="secret")
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as first:
+        state = first.dump_flow_state(await first.authenticate_flow(pkce=True))
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as second:
+        completed = await second.authenticate_flow(
+            state,
+            authenticator_id="BasicAuthenticator",
+            params={"username": "alice", "password": "secret"},
+        )
+        assert completed.completed
+        token = await second.get_flow_token(second.dump_flow_state(completed))
+    assert token.access_token
+    assert mock.requests["token"] == 1
@@ -0,0 +1,156 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the multiplexed native authentication flow manager."""
+
+import asyncio
+
+import pytest
+
+from asgardeo import FlowStatus, NativeAuthFlowManager, SessionProvider, ValidationError
+from asgardeo.testing import MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+ALICE = {"username": "alice", "password": "secret"}
+
+
+@pytest.fixture
+def mock():
+    """Mock tenant where only alice can sign in."""
+    return MockAsgardeoServer(seed=1, users={"alice": "secret"}, clients={"client-id": "client-secret"})
+
+
+@pytest.fixture
+async def expired(config, session_provider):
+    """Flow manager expiring flows after 50 ms, with the list of expired flow ids."""
+    expired = []
+    async with NativeAuthFlowManager(
+        config,
+        session_provider=session_provider,
+        ttl=0.05,
+        resolution=0.01,
+        wheel_size=8,
+        on_expire=lambda state: expired.append(state.flow_id),
+    ) as manager:
+        yield manager, expired
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"ttl": 0}, {"resolution": 0}, {"max_flows": 0}, {"wheel_size": 0}],
+)
+def test_invalid_arguments(config, kwargs):
+    with pytest.raises(ValueError):
+        NativeAuthFlowManager(config, **kwargs)
+
+
+async def test_flow_lifecycle(config, session_provider, mock):
+    async with NativeAuthFlowManager(config, session_provider=session_provider) as manager:
+        flows = [await manager.start_flow(pkce=True) for _ in range(3)]
+        assert manager.counts() == {FlowStatus.INCOMPLETE: 3}
+
+        completed = await manager.continue_flow(flows[0].flow_id, "BasicAuthenticator", ALICE)
+        assert completed.completed
+        assert manager.get(flows[0].flow_id) is completed
+        assert manager.counts() == {FlowStatus.INCOMPLETE: 2, FlowStatus.SUCCESS_COMPLETED: 1}
+
+        token = await manager.complete_flow(flows[0].flow_id)
+        assert token.access_token
+        assert manager.get(flows[0].flow_id) is None
+        assert manager.counts() == {FlowStatus.INCOMPLETE: 2}
+
+        manager.discard(flows[1].flow_id)
+        assert len(manager) == 1
+        assert manager.counts() == {FlowStatus.INCOMPLETE: 1}
+    assert len(manager) == 0
+    assert manager.counts() == {}
+
+
+async def test_failed_step_keeps_the_flow(config, session_provider):
+    async with NativeAuthFlowManager(config, session_provider=session_provider) as manager:
+        flow = await manager.start_flow()
+        failed = await manager.continue_flow(flow.flow_id, "BasicAuthenticator", {**ALICE, "password": "wrong"})
+        assert not failed.completed
+        assert manager.counts() == {failed.flow_status: 1}
+        completed = await manager.continue_flow(flow.flow_id, "BasicAuthenticator", ALICE)
+        assert completed.completed
+        assert manager.counts() == {FlowStatus.SUCCESS_COMPLETED: 1}
+
+
+async def test_idle_flows_expire(expired):
+    manager, expired = expired
+    flow = await manager.start_flow()
+    await asyncio.sleep(0.03)
+    assert manager.get(flow.flow_id) is flow
+    await asyncio.sleep(0.06)
+    assert manager.get(flow.flow_id) is None
+    assert expired == [flow.flow_id]
+    assert len(manager) == 0
+    assert manager.counts() == {}
+    with pytest.raises(ValidationError):
+        await manager.continue_flow(flow.flow_id, "BasicAuthenticator", ALICE)
+
+
+async def test_steps_extend_the_time_to_live(expired):
+    manager, expired = expired
+    idle = await manager.start_flow()
+    active = await manager.start_flow()
+    for _ in range(3):
+        await asyncio.sleep(0.03)
+        await manager.continue_flow(active.flow_id, "BasicAuthenticator", {**ALICE, "password": "wrong"})
+    assert expired == [idle.flow_id]
+    assert manager.get(active.flow_id) is not None
+    await asyncio.sleep(0.1)
+    assert expired == [idle.flow_id, active.flow_id]
+
+
+async def test_flow_ttl_overrides_the_default(expired):
+    manager, expired = expired
+    flow = await manager.start_flow(ttl=1.0)
+    await asyncio.sleep(0.1)
+    assert manager.get(flow.flow_id) is flow
+    assert expired == []
+
+
+async def test_least_recently_active_flow_is_evicted(config, session_provider):
+    evicted = []
+    async with NativeAuthFlowManager(
+        config,
+        session_provider=session_provider,
+        max_flows=2,
+        on_expire=lambda state: evicted.append(state.flow_id),
+    ) as manager:
+        first = await manager.start_flow()
+        second = await manager.start_flow()
+        await manager.continue_flow(first.flow_id, "BasicAuthenticator", {**ALICE, "password": "wrong"})
+        third = await manager.start_flow()
+
+        assert evicted == [second.flow_id]
+        assert manager.get(second.flow_id) is None
+        assert manager.get(first.flow_id) is not None and manager.get(third.flow_id) is third
+        assert len(manager) == 2
+        assert sum(manager.counts().values()) == 2
+
+
+async def test_flow_scope(config, session_provider):
+    async with NativeAuthFlowManager(config, session_provider=session_provider) as manager:
+        flows = [await manager.start_flow(scope=scope) for scope in ("openid profile", None)]
+        tokens = []
+        for flow in flows:
+            await manager.continue_flow(flow.flow_id, "BasicAuthenticator", ALICE)
+            tokens.append(await manager.complete_flow(flow.flow_id))
+    assert [token.scope for token in tokens] == ["openid profile", config.scope]
@@ -0,0 +1,177 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the client-side rate limiter."""
+
+import asyncio
+import dataclasses
+import time
+
+import httpx
+import pytest
+
+from asgardeo import (
+    AsgardeoTokenClient,
+    Priority,
+    RateLimiter,
+    RateLimitPolicy,
+    SessionProvider,
+    request_priority,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [RateLimitPolicy(rate=0), RateLimitPolicy(burst=0), RateLimitPolicy(max_in_flight=0)],
+)
+def test_invalid_policy(policy):
+    with pytest.raises(ValueError):
+        RateLimiter(policy)
+
+
+async def test_max_in_flight():
+    limiter = RateLimiter(RateLimitPolicy(max_in_flight=3))
+    in_flight = peak = 0
+
+    async def send():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    await asyncio.gather(*(limiter.call(send) for _ in range(20)))
+    assert peak == 3
+    assert limiter.in_flight == limiter.waiting == 0
+
+
+async def test_waiting_requests_are_admitted_by_priority():
+    limiter = RateLimiter(RateLimitPolicy(max_in_flight=1))
+    admitted = []
+    await limiter.acquire()
+
+    async def request(name, priority=None):
+        await limiter.acquire(priority)
+        admitted.append(name)
+        limiter.release()
+
+    waiting = [
+        asyncio.create_task(request("refresh-1", Priority.BACKGROUND)),
+        asyncio.create_task(request("refresh-2", Priority.BACKGROUND)),
+        asyncio.create_task(request("login-1")),
+        asyncio.create_task(request("login-2", Priority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    assert limiter.waiting == 4
+    limiter.release()
+    await asyncio.gather(*waiting)
+    assert admitted == ["login-1", "login-2", "refresh-1", "refresh-2"]
+
+
+async def test_priority_of_the_context():
+    limiter = RateLimiter(RateLimitPolicy(max_in_flight=1))
+    admitted = []
+    await limiter.acquire()
+
+    async def request(name):
+        await limiter.acquire()
+        admitted.append(name)
+        limiter.release()
+
+    with request_priority(Priority.BACKGROUND):
+        background = asyncio.create_task(request("refresh"))
+    interactive = asyncio.create_task(request("login"))
+    await asyncio.sleep(0)
+    limiter.release()
+    await asyncio.gather(background, interactive)
+    assert admitted == ["login", "refresh"]
+
+
+async def test_token_bucket():
+    limiter = RateLimiter(RateLimitPolicy(rate=50, burst=2))
+    admitted = []
+    start = time.monotonic()
+
+    async def request():
+        await limiter.acquire()
+        admitted.append(time.monotonic() - start)
+        limiter.release()
+
+    await asyncio.gather(*(request() for _ in range(6)))
+    # The burst is admitted at once, then one request every 20 ms.
+    assert admitted[1] < 0.01
+    assert admitted[-1] >= 0.07
+
+
+async def test_cancelled_waiters_do_not_hold_slots():
+    limiter = RateLimiter(RateLimitPolicy(max_in_flight=1))
+    await limiter.acquire()
+    cancelled = asyncio.create_task(limiter.acquire())
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+
+    limiter.release()
+    await waiting
+    assert limiter.in_flight == 1
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+async def test_cancelled_after_admission_hands_the_slot_on():
+    limiter = RateLimiter(RateLimitPolicy(max_in_flight=1))
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    # Admit the first waiter, then cancel it before it resumes.
+    limiter.release()
+    first.cancel()
+    await second
+    assert first.cancelled()
+    assert limiter.in_flight == 1
+    limiter.release()
+    assert limiter.in_flight == 0
+
+
+async def test_clients_share_the_limit_of_an_endpoint(config, mock):
+    in_flight = peak = 0
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if not request.url.path.endswith("/token"):
+            return await mock.handle(request)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return await mock.handle(request)
+
+    config = dataclasses.replace(config, rate_limits={"token": RateLimitPolicy(max_in_flight=2)})
+    provider = SessionProvider(transport=httpx.MockTransport(handle))
+    async with AsgardeoTokenClient(config, session_provider=provider) as first:
+        async with AsgardeoTokenClient(config, session_provider=provider) as second:
+            await asyncio.gather(*(
+                client.get_token("client_credentials", scope=f"scope-{i}")
+                for i in range(10)
+                for client in (first, second)
+            ))
+    assert peak == 2
+    assert mock.responses["token", 200] == 20
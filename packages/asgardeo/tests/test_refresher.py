@@ -0,0 +1,187 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the background token refresher against the mock tenant."""
+
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+
+from asgardeo import (
+    AsgardeoTokenClient,
+    Priority,
+    RetryPolicy,
+    SessionProvider,
+    TokenRefresher,
+)
+from asgardeo.auth.ratelimit import current_priority
+from asgardeo.testing import EndpointProfile, MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def mock():
+    """Mock tenant issuing tokens that live for one second."""
+    return MockAsgardeoServer(seed=1, token_lifetime=1, clients={"client-id": "client-secret"})
+
+
+@pytest.fixture
+async def client(config, session_provider):
+    """Token client of the mock tenant that does not retry."""
+    config = dataclasses.replace(config, retry_policy=RetryPolicy(max_attempts=1))
+    async with AsgardeoTokenClient(config, session_provider=session_provider) as client:
+        yield client
+
+
+async def sign_in(client, mock, subject="alice"):
+    """Get a token for a user with a refresh token."""
+    return await client.get_token("authorization_code", code=mock.issue_code(subject))
+
+
+@pytest.fixture
+def paused_refreshes(mock):
+    """Session provider holding refresh token grants until the returned event is set."""
+    sent = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if b"grant_type=refresh_token" in request.content:
+            sent.set()
+            await release.wait()
+        return await mock.handle(request)
+
+    return SessionProvider(transport=httpx.MockTransport(handle)), sent, release
+
+
+async def test_refresh_swaps_in_the_new_token(config, session_provider, mock):
+    async with AsgardeoTokenClient(config, session_provider=session_provider) as client:
+        token = await client.get_token("authorization_code", code=mock.issue_code("alice"))
+        refreshed = []
+        refresher = TokenRefresher(client, on_refresh=lambda key, new: refreshed.append((key, new)))
+        refresher.register("alice", token)
+        await refresher._refresh("alice")
+
+    [(key, new_token)] = refreshed
+    assert key == "alice"
+    assert refresher.get("alice") is new_token
+    assert new_token.access_token != token.access_token
+
+
+@pytest.mark.parametrize("change", ["register", "unregister"])
+async def test_refresh_does_not_overwrite_a_newer_registration(config, mock, paused_refreshes, change):
+    provider, sent, release = paused_refreshes
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        first = await client.get_token("authorization_code", code=mock.issue_code("alice"))
+        second = await client.get_token("authorization_code", code=mock.issue_code("alice"))
+        refresher = TokenRefresher(client)
+        refresher.register("alice", first)
+        refresh = asyncio.create_task(refresher._refresh("alice"))
+        await sent.wait()
+        if change == "register":
+            refresher.register("alice", second)
+        else:
+            refresher.unregister("alice")
+        release.set()
+        await refresh
+
+    assert refresher.get("alice") is (second if change == "register" else None)
+
+
+async def test_tokens_are_refreshed_before_they_expire(client, mock):
+    refreshed = []
+    refresher = TokenRefresher(client, refresh_ratio=0.1, jitter=0, on_refresh=lambda key, token: refreshed.append(token))
+    async with refresher:
+        token = await sign_in(client, mock)
+        refresher.register("alice", token)
+        await asyncio.sleep(0.35)
+        assert refresher.get("alice") is refreshed[-1]
+
+    # Every refreshed token is refreshed again after a tenth of its lifetime.
+    assert 2 <= len(refreshed) <= 4
+    assert len({token.access_token for token in [token, *refreshed]}) == len(refreshed) + 1
+    count = len(refreshed)
+    await asyncio.sleep(0.15)
+    assert len(refreshed) == count
+
+
+async def test_refreshes_run_with_background_priority(config, mock):
+    priorities = []
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if b"grant_type=refresh_token" in request.content:
+            priorities.append(current_priority())
+        return await mock.handle(request)
+
+    provider = SessionProvider(transport=httpx.MockTransport(handle))
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        async with TokenRefresher(client, refresh_ratio=0.05, jitter=0) as refresher:
+            refresher.register("alice", await sign_in(client, mock))
+            await asyncio.sleep(0.12)
+    assert priorities and set(priorities) == {Priority.BACKGROUND}
+
+
+async def test_registration_wakes_the_scheduler(client, mock):
+    async with TokenRefresher(client, refresh_ratio=0.05, jitter=0) as refresher:
+        # The scheduler sleeps until the refresh of this token, an hour from now.
+        refresher.register("bob", dataclasses.replace(await sign_in(client, mock, "bob"), expires_in=3600))
+        await asyncio.sleep(0.01)
+        alice = await sign_in(client, mock)
+        refresher.register("alice", alice)
+        await asyncio.sleep(0.1)
+        assert refresher.get("alice").access_token != alice.access_token
+        assert refresher.get("bob").expires_in == 3600
+
+
+@pytest.mark.parametrize("change", ["register", "unregister"])
+async def test_scheduled_refresh_is_superseded(client, mock, change):
+    async with TokenRefresher(client, refresh_ratio=0.05, jitter=0) as refresher:
+        token = await sign_in(client, mock)
+        refresher.register("alice", token)
+        if change == "register":
+            token = dataclasses.replace(token, expires_in=3600)
+            refresher.register("alice", token)
+        else:
+            refresher.unregister("alice")
+            token = None
+        await asyncio.sleep(0.1)
+        assert refresher.get("alice") is token
+    assert mock.responses["token", 200] == 1
+
+
+async def test_failed_refresh_is_retried(client, mock):
+    async with TokenRefresher(client, refresh_ratio=0.05, jitter=0, retry_interval=0.03) as refresher:
+        token = await sign_in(client, mock)
+        mock.profiles["token"] = EndpointProfile(error_rate=1.0)
+        refresher.register("alice", token)
+        await asyncio.sleep(0.15)
+        assert refresher.get("alice") is token
+        assert mock.responses["token", 503] >= 2
+
+        del mock.profiles["token"]
+        await asyncio.sleep(0.1)
+        assert refresher.get("alice").access_token != token.access_token
+
+
+async def test_stop_cancels_the_scheduler(client, mock):
+    refresher = TokenRefresher(client, refresh_ratio=0.05, jitter=0)
+    refresher.start()
+    refresher.register("alice", await sign_in(client, mock))
+    await refresher.stop()
+    await asyncio.sleep(0.08)
+    assert mock.responses["token", 200] == 1
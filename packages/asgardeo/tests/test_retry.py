@@ -0,0 +1,142 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of retries and circuit breaking against a failing mock tenant."""
+
+import dataclasses
+import time
+
+import pytest
+
+from asgardeo import (
+    AsgardeoNativeAuthClient,
+    AsgardeoTokenClient,
+    CircuitBreakerPolicy,
+    CircuitOpenError,
+    CircuitState,
+    RetryPolicy,
+    SessionProvider,
+    TokenError,
+    default_circuit_breakers,
+)
+from asgardeo.testing import EndpointProfile, MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+FAST_RETRY = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001, respect_retry_after=False)
+
+
+async def test_rate_limited_requests_are_retried(config):
+    mock = MockAsgardeoServer(profiles={"token": EndpointProfile(rate_limit_every=2)})
+    config = dataclasses.replace(config, retry_policy=FAST_RETRY)
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        await client.get_token("client_credentials")
+        await client.get_token("client_credentials")
+    assert mock.responses["token", 429] == 1
+    assert mock.responses["token", 200] == 2
+
+
+async def test_transient_errors_exhaust_attempts(config):
+    mock = MockAsgardeoServer(profiles={"token": EndpointProfile(error_rate=1.0)})
+    config = dataclasses.replace(config, retry_policy=FAST_RETRY)
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        with pytest.raises(TokenError) as error:
+            await client.get_token("client_credentials")
+    assert error.value.status_code == 503
+    assert mock.requests["token"] == 3
+
+
+async def test_authorization_code_is_not_replayed_after_server_error(config):
+    mock = MockAsgardeoServer(profiles={"token": EndpointProfile(error_rate=1.0)})
+    config = dataclasses.replace(config, retry_policy=FAST_RETRY)
+    code = mock.issue_code("alice")
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        with pytest.raises(TokenError):
+            await client.get_token("authorization_code", code=code)
+    assert mock.requests["token"] == 1
+
+
+async def test_circuit_opens_and_fails_fast(config):
+    mock = MockAsgardeoServer(profiles={"token": EndpointProfile(error_rate=1.0)})
+    config = dataclasses.replace(
+        config,
+        base_url="https://localhost/t/breaker",
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=CircuitBreakerPolicy(minimum_calls=4, window_size=4, open_duration=60),
+    )
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        for _ in range(4):
+            with pytest.raises(TokenError):
+                await client.get_token("client_credentials")
+        with pytest.raises(CircuitOpenError):
+            await client.get_token("client_credentials")
+    assert mock.requests["token"] == 4
+    assert default_circuit_breakers.states()["https://localhost/t/breaker/oauth2/token"] == CircuitState.OPEN
+
+
+async def test_circuit_half_open_probe_closes_it(config, session_provider):
+    config = dataclasses.replace(
+        config,
+        base_url="https://localhost/t/probe",
+        circuit_breaker=CircuitBreakerPolicy(minimum_calls=1, window_size=1, open_duration=0),
+    )
+    breaker = default_circuit_breakers.get("https://localhost/t/probe/oauth2/token", config.circuit_breaker)
+    breaker.record(failed=True)
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as client:
+        await client.authenticate_with_password("alice", "secret")
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def test_revocation_retries_honour_retry_after(config):
+    mock = MockAsgardeoServer(profiles={"revoke": EndpointProfile(rate_limit_every=2, retry_after=0.05)})
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.001)
+    config = dataclasses.replace(config, retry_policy=policy)
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        assert await client.revoke_token("first")
+        start = time.monotonic()
+        assert await client.revoke_token("second")
+        assert time.monotonic() - start >= 0.05
+    assert mock.responses["revoke", 429] == 1
+    assert mock.responses["revoke", 200] == 2
+
+
+async def test_revoke_many_reports_attempts_per_token(config):
+    mock = MockAsgardeoServer(profiles={"revoke": EndpointProfile(error_rate=1.0)})
+    config = dataclasses.replace(config, retry_policy=FAST_RETRY)
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        results = await client.revoke_many(["first", ("second", "refresh_token")], max_attempts=2)
+    assert [result.token for result in results] == ["first", "second"]
+    assert all(not result.revoked and result.attempts == 2 for result in results)
+    assert mock.requests["revoke"] == 4
+
+
+async def test_revocation_goes_through_the_circuit_breaker(config):
+    mock = MockAsgardeoServer(profiles={"revoke": EndpointProfile(error_rate=1.0)})
+    config = dataclasses.replace(
+        config,
+        base_url="https://localhost/t/revoke-breaker",
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=CircuitBreakerPolicy(minimum_calls=2, window_size=2, open_duration=60),
+    )
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        for token in ("first", "second"):
+            with pytest.raises(TokenError):
+                await client.revoke_token(token)
+        with pytest.raises(CircuitOpenError):
+            await client.revoke_token("third")
+        [result] = await client.revoke_many(["fourth"])
+    assert not result.revoked and result.attempts == 0
+    assert mock.requests["revoke"] == 2
@@ -0,0 +1,183 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Client authentication of the mock tenant."""
+
+import base64
+import time
+import uuid
+from urllib.parse import urlencode
+
+import httpx
+import pytest
+
+from asgardeo.auth.jwt import decode_jwt, sign_jwt
+from asgardeo.testing import MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+TOKEN_ENDPOINT = "https://localhost/t/mock/oauth2/token"
+ASSERTION_TYPE = "urn:ietf:params:oauth:client-assertion-type:jwt-bearer"
+
+
+async def post(mock, endpoint, form, headers=None):
+    """Send a form request to an endpoint of the mock tenant."""
+    request = httpx.Request(
+        "POST",
+        f"https://localhost/t/mock/oauth2/{endpoint}",
+        headers={"Content-Type": "application/x-www-form-urlencoded", **(headers or {})},
+        content=urlencode(form),
+    )
+    return await mock.handle(request)
+
+
+def basic(client_id, secret):
+    """HTTP basic authentication header."""
+    return {"Authorization": "Basic " + base64.b64encode(f"{client_id}:{secret}".encode()).decode()}
+
+
+@pytest.fixture
+def mock():
+    """Mock tenant with a confidential and a public client."""
+    return MockAsgardeoServer(seed=1, clients={"client-id": "client-secret", "spa": None})
+
+
+@pytest.mark.parametrize(
+    "form, headers, status",
+    [
+        ({"client_id": "client-id", "client_secret": "client-secret"}, None, 200),
+        ({}, basic("client-id", "client-secret"), 200),
+        ({"client_id": "client-id", "client_secret": "wrong"}, None, 401),
+        ({}, basic("client-id", "wrong"), 401),
+        ({"client_id": "other", "client_secret": "client-secret"}, None, 401),
+        ({"client_id": "other"}, basic("client-id", "client-secret"), 401),
+        ({"client_id": "client-id"}, None, 401),
+        ({"client_id": "spa"}, None, 401),
+        ({}, None, 401),
+    ],
+)
+async def test_client_secret(mock, form, headers, status):
+    response = await post(mock, "token", {"grant_type": "client_credentials", **form}, headers)
+    assert response.status_code == status
+    if status == 401:
+        assert response.json()["error"] == "invalid_client"
+
+
+@pytest.mark.parametrize("endpoint", ["revoke", "introspect"])
+async def test_revoke_and_introspect_require_client_authentication(mock, endpoint):
+    form = {"token": "token", "client_id": "client-id"}
+    assert (await post(mock, endpoint, form)).status_code == 401
+    assert (await post(mock, endpoint, {**form, "client_secret": "wrong"})).status_code == 401
+    assert (await post(mock, endpoint, {**form, "client_secret": "client-secret"})).status_code == 200
+
+
+async def test_public_client_redeems_codes_without_credentials(mock):
+    code = mock.issue_code("alice", client_id="spa")
+    form = {"grant_type": "authorization_code", "code": code, "client_id": "spa"}
+    response = await post(mock, "token", form)
+    assert response.status_code == 200
+    refresh = {"grant_type": "refresh_token", "refresh_token": response.json()["refresh_token"], "client_id": "spa"}
+    assert (await post(mock, "token", refresh)).status_code == 200
+    # A confidential client must authenticate unless the code is bound to it with PKCE.
+    code = mock.issue_code("alice")
+    form = {"grant_type": "authorization_code", "code": code, "client_id": "client-id"}
+    assert (await post(mock, "token", form)).status_code == 401
+
+
+async def test_unregistered_clients_need_a_secret():
+    mock = MockAsgardeoServer(seed=1)
+    form = {"grant_type": "client_credentials", "client_id": "any"}
+    assert (await post(mock, "token", form)).status_code == 401
+    assert (await post(mock, "token", {**form, "client_secret": ""})).status_code == 401
+    assert (await post(mock, "token", {**form, "client_secret": "any-secret"})).status_code == 200
+
+
+class TestClientAssertion:
+    """private_key_jwt client authentication."""
+
+    @pytest.fixture
+    def key(self):
+        """Private key of the client."""
+        pytest.importorskip("cryptography")
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    @pytest.fixture
+    def mock(self, key):
+        """Mock tenant knowing the public key of the client."""
+        return MockAsgardeoServer(seed=1, clients={}, client_keys={"client-id": key.public_key()})
+
+    @staticmethod
+    def assertion(key, **claims):
+        """Sign a client assertion of the client."""
+        now = int(time.time())
+        defaults = {
+            "iss": "client-id",
+            "sub": "client-id",
+            "aud": TOKEN_ENDPOINT,
+            "jti": uuid.uuid4().hex,
+            "iat": now,
+            "exp": now + 300,
+        }
+        return sign_jwt({**defaults, **claims}, key, "RS256")
+
+    @staticmethod
+    async def request(mock, assertion, **form):
+        """Request a client_credentials token with a client assertion."""
+        form = {
+            "grant_type": "client_credentials",
+            "client_assertion_type": ASSERTION_TYPE,
+            "client_assertion": assertion,
+            **form,
+        }
+        return await post(mock, "token", form)
+
+    async def test_valid_assertion(self, mock, key):
+        response = await self.request(mock, self.assertion(key), client_id="client-id")
+        assert response.status_code == 200
+        assert decode_jwt(response.json()["access_token"])[1]["sub"] == "client-id"
+        assert (await self.request(mock, self.assertion(key, aud=[TOKEN_ENDPOINT, "other"]))).status_code == 200
+
+    @pytest.mark.parametrize(
+        "claims",
+        [
+            {"iss": "other"},
+            {"sub": "other"},
+            {"aud": "https://localhost/t/other/oauth2/token"},
+            {"exp": int(time.time()) - 10},
+            {"exp": None},
+            {"jti": None},
+        ],
+    )
+    async def test_invalid_claims(self, mock, key, claims):
+        assert (await self.request(mock, self.assertion(key, **claims))).status_code == 401
+
+    async def test_wrong_key(self, mock):
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        other = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        assert (await self.request(mock, self.assertion(other))).status_code == 401
+
+    async def test_replayed_assertion(self, mock, key):
+        assertion = self.assertion(key)
+        assert (await self.request(mock, assertion)).status_code == 200
+        assert (await self.request(mock, assertion)).status_code == 401
+
+    async def test_malformed_assertion(self, mock, key):
+        assert (await self.request(mock, "not-a-jwt")).status_code == 401
+        assert (await self.request(mock, self.assertion(key), client_assertion_type="other")).status_code == 401
+        assert (await self.request(mock, self.assertion(key), client_id="other")).status_code == 401
@@ -0,0 +1,136 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the cross-process lock and the shared token cache."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from asgardeo import InterProcessLock, OAuthToken, SharedTokenCache
+
+pytestmark = pytest.mark.anyio
+
+
+def open_fds() -> int:
+    return len(os.listdir("/proc/self/fd"))
+
+
+async def test_lock_is_exclusive(tmp_path):
+    path = str(tmp_path / "key.lock")
+    holder = InterProcessLock(path)
+    assert await holder.acquire()
+    assert not await InterProcessLock(path).acquire(timeout=0.05)
+    holder.release()
+    waiter = InterProcessLock(path)
+    assert await waiter.acquire(timeout=0.05)
+    waiter.release()
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="requires /proc")
+async def test_cancelled_acquire_closes_the_lock_file(tmp_path):
+    path = str(tmp_path / "key.lock")
+    holder = InterProcessLock(path)
+    await holder.acquire()
+    before = open_fds()
+
+    waiter = asyncio.ensure_future(InterProcessLock(path).acquire())
+    await asyncio.sleep(0.05)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert open_fds() == before
+
+    assert not await InterProcessLock(path).acquire(timeout=0.01)
+    assert open_fds() == before
+    holder.release()
+
+
+@pytest.fixture
+def workers(tmp_path):
+    """Two caches on one database, standing in for two worker processes."""
+    path = str(tmp_path / "tokens.db")
+    caches = [SharedTokenCache(path), SharedTokenCache(path)]
+    yield caches
+    for cache in caches:
+        cache.close()
+
+
+async def test_fetch_is_shared_between_workers(workers):
+    first, second = workers
+    fetches = 0
+
+    async def fetch():
+        nonlocal fetches
+        fetches += 1
+        return OAuthToken(access_token=f"token-{fetches}", expires_in=3600)
+
+    token = await first.fetch("key", fetch)
+    assert (await second.fetch("key", fetch)).access_token == token.access_token
+    assert second.get("key").access_token == token.access_token
+    assert fetches == 1
+
+
+@pytest.mark.parametrize("remove", ["discard_token", "invalidate"])
+async def test_removal_applies_to_every_worker(workers, remove):
+    first, second = workers
+    first.set("key", OAuthToken(access_token="revoked", expires_in=3600))
+    first.set("other", OAuthToken(access_token="kept", expires_in=3600))
+    assert second.get("key").access_token == "revoked"
+    assert second.get("other").access_token == "kept"
+
+    if remove == "discard_token":
+        first.discard_token("revoked")
+    else:
+        first.invalidate("key")
+
+    assert second.get("key") is None
+    assert second.get("other").access_token == "kept"
+
+
+async def test_discard_token_removes_tokens_held_only_by_other_workers(workers):
+    first, second = workers
+    second.set("key", OAuthToken(access_token="revoked", expires_in=3600))
+    first.discard_token("revoked")
+    assert second.get("key") is None
+
+
+async def test_replaced_token_is_reloaded(workers):
+    first, second = workers
+    first.set("key", OAuthToken(access_token="old", expires_in=3600))
+    assert second.get("key").access_token == "old"
+    first.set("key", OAuthToken(access_token="new", expires_in=3600))
+    assert second.get("key").access_token == "new"
+
+
+async def test_discard_tokens_deletes_stored_tokens_off_the_event_loop(workers, monkeypatch):
+    first, second = workers
+    for name in ("first", "second", "third"):
+        second.set(name, OAuthToken(access_token=name, expires_in=3600))
+    threads = []
+    delete_tokens = first.store.delete_tokens
+
+    def record_thread(tokens):
+        threads.append(threading.get_ident())
+        delete_tokens(tokens)
+
+    monkeypatch.setattr(first.store, "delete_tokens", record_thread)
+    await first.discard_tokens(["first", "second"])
+    assert threads and threads[0] != threading.get_ident()
+    assert second.get("first") is None and second.get("second") is None
+    assert second.get("third").access_token == "third"
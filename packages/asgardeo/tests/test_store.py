@@ -0,0 +1,199 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the persistent token stores."""
+
+import dataclasses
+import json
+import os
+import sqlite3
+import stat
+import time
+
+import pytest
+
+from asgardeo import FileTokenStore, MemoryTokenStore, OAuthToken, SQLiteTokenStore, TokenCache, TokenStore
+
+
+@pytest.fixture(params=["memory", "sqlite", "file"])
+def make_store(request, tmp_path):
+    """Factory of stores of each kind, reopening the same location on every call."""
+
+    def make(**kwargs):
+        if request.param == "memory":
+            return MemoryTokenStore(**kwargs)
+        if request.param == "sqlite":
+            return SQLiteTokenStore(str(tmp_path / "tokens.db"), **kwargs)
+        return FileTokenStore(str(tmp_path / "tokens.json"), **kwargs)
+
+    return make
+
+
+def test_set_get_delete(make_store):
+    store = make_store()
+    token = OAuthToken(access_token="access", refresh_token="refresh", expires_in=3600)
+    store.set("key", token, time.time() + 3600)
+    assert store.get("key")[0] == token
+    store.delete("key")
+    assert store.get("key") is None
+    store.close()
+
+
+def test_expired_tokens_are_skipped(make_store):
+    store = make_store()
+    store.set("expired", OAuthToken(access_token="old"), time.time() - 1)
+    store.set("valid", OAuthToken(access_token="new"), time.time() + 60)
+    assert store.get("expired") is None
+    assert [key for key, _, _ in store.items()] == ["valid"]
+    store.close()
+
+
+def test_delete_tokens(make_store):
+    store = make_store()
+    for name in ("first", "second", "third"):
+        store.set(name, OAuthToken(access_token=name, refresh_token=f"{name}-refresh"), time.time() + 60)
+    store.delete_tokens(["first", "second-refresh", "unknown"])
+    assert [key for key, _, _ in store.items()] == ["third"]
+    store.close()
+
+
+def test_sqlite_delete_tokens_uses_the_digest_index(tmp_path, monkeypatch):
+    store = SQLiteTokenStore(str(tmp_path / "tokens.db"))
+    for i in range(100):
+        store.set(f"key-{i}", OAuthToken(access_token=f"access-{i}", refresh_token=f"refresh-{i}"), time.time() + 60)
+    monkeypatch.setattr(store, "_deserialize", lambda value: pytest.fail("delete_tokens read a stored token"))
+    store.delete_tokens(["access-1", "refresh-2"])
+    monkeypatch.undo()
+    assert store.get("key-1") is None and store.get("key-2") is None
+    assert len(list(store.items())) == 98
+    plan = store._connection.execute(
+        "EXPLAIN QUERY PLAN DELETE FROM tokens WHERE access_digest = ? OR refresh_digest = ?", ("a", "a"),
+    ).fetchall()
+    assert "tokens_access_digest" in str(plan) and "tokens_refresh_digest" in str(plan)
+    store.close()
+
+
+def test_sqlite_store_migrates_databases_without_token_digests(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE tokens (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)")
+    value = json.dumps(dataclasses.asdict(OAuthToken(access_token="access", refresh_token="refresh"))).encode()
+    connection.execute("INSERT INTO tokens VALUES (?, ?, ?)", ("key", value, time.time() + 60))
+    connection.commit()
+    connection.close()
+
+    store = SQLiteTokenStore(path)
+    assert store.get("key")[0].access_token == "access"
+    store.delete_tokens(["refresh"])
+    assert store.get("key") is None
+    store.close()
+
+
+@pytest.mark.parametrize("kind", ["sqlite", "file"])
+def test_tokens_survive_reopening(kind, tmp_path):
+    path = str(tmp_path / ("tokens.db" if kind == "sqlite" else "tokens.json"))
+    store_class = SQLiteTokenStore if kind == "sqlite" else FileTokenStore
+    store = store_class(path)
+    TokenCache(store=store).set(("agent", "a1"), OAuthToken(access_token="access", expires_in=3600))
+    store.close()
+
+    reopened = store_class(path)
+    assert TokenCache(store=reopened).get(("agent", "a1")).access_token == "access"
+    reopened.close()
+
+
+def test_encryption_at_rest(tmp_path):
+    fernet = pytest.importorskip("cryptography.fernet")
+    key = fernet.Fernet.generate_key()
+    path = str(tmp_path / "tokens.db")
+    store = SQLiteTokenStore(path, encryption_key=key)
+    store.set("key", OAuthToken(access_token="secret-access-token"), time.time() + 60)
+    store.close()
+
+    with open(path, "rb") as file:
+        assert b"secret-access-token" not in file.read()
+    assert SQLiteTokenStore(path, encryption_key=key).get("key")[0].access_token == "secret-access-token"
+    assert SQLiteTokenStore(path, encryption_key=fernet.Fernet.generate_key()).get("key") is None
+
+
+@pytest.mark.parametrize("existing", [False, True])
+def test_sqlite_files_are_private(tmp_path, existing):
+    path = str(tmp_path / "tokens.db")
+    umask = os.umask(0o022)
+    try:
+        if existing:
+            open(path, "wb").close()
+            os.chmod(path, 0o644)
+        store = SQLiteTokenStore(path, batch_size=1)
+        store.set("key", OAuthToken(access_token="access"), time.time() + 60)
+        for suffix in ("", "-wal", "-shm"):
+            assert stat.S_IMODE(os.stat(path + suffix).st_mode) == 0o600, suffix
+        store.close()
+    finally:
+        os.umask(umask)
+
+
+def test_buffered_writes_are_flushed_in_the_background(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    store = SQLiteTokenStore(path, flush_interval=0.05)
+    store.set("key", OAuthToken(access_token="first"), time.time() + 60)
+    store.set("other", OAuthToken(access_token="second"), time.time() + 60)
+    time.sleep(0.3)
+
+    reader = SQLiteTokenStore(path)
+    assert reader.get("other")[0].access_token == "second"
+    reader.close()
+    store.close()
+
+
+def test_token_cache_flush(tmp_path):
+    path = str(tmp_path / "tokens.db")
+    store = SQLiteTokenStore(path, flush_interval=60)
+    cache = TokenCache(store=store)
+    cache.set("a", OAuthToken(access_token="a", expires_in=3600))
+    cache.set("b", OAuthToken(access_token="b", expires_in=3600))
+    cache.flush()
+
+    reader = SQLiteTokenStore(path)
+    assert len(TokenCache(store=reader)) == 2
+    reader.close()
+    store.close()
+
+
+def test_incomplete_store_cannot_be_created():
+    class IncompleteStore(TokenStore):
+        def _read(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
+
+
+@pytest.mark.parametrize("kind", ["sqlite", "file"])
+def test_restarted_cache_is_warmed_from_the_store(kind, tmp_path):
+    path = str(tmp_path / ("tokens.db" if kind == "sqlite" else "tokens.json"))
+    store_class = SQLiteTokenStore if kind == "sqlite" else FileTokenStore
+    store = store_class(path)
+    cache = TokenCache(store=store)
+    for i in range(1000):
+        cache.set(("agent", f"agent-{i}"), OAuthToken(access_token=f"access-{i}", expires_in=3600))
+    store.close()
+
+    reopened = store_class(path)
+    warmed = TokenCache(store=reopened)
+    assert len(warmed) == 1000
+    assert all(warmed.get(("agent", f"agent-{i}")).access_token == f"access-{i}" for i in range(1000))
+    reopened.close()
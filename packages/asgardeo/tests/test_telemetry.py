@@ -0,0 +1,139 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the tracing and metrics hooks."""
+
+import contextlib
+import dataclasses
+
+import pytest
+
+from asgardeo import (
+    AsgardeoError,
+    AsgardeoNativeAuthClient,
+    AsgardeoTokenClient,
+    Instrumentation,
+    Metric,
+    OpenTelemetryInstrumentation,
+    RetryPolicy,
+    SessionProvider,
+    TokenError,
+)
+from asgardeo.testing import EndpointProfile, MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingInstrumentation(Instrumentation):
+    """Instrumentation keeping every span, request and counter."""
+
+    def __init__(self):
+        self.spans = []
+        self.requests = []
+        self.counts = []
+
+    @contextlib.contextmanager
+    def span(self, name, attributes=None):
+        self.spans.append(name)
+        yield
+
+    def record_request(self, endpoint, status, duration):
+        assert duration >= 0
+        self.requests.append((endpoint, status))
+
+    def count(self, name, value=1, attributes=None):
+        self.counts.append((name, value, attributes))
+
+
+@pytest.fixture
+def instrumentation():
+    """Recording instrumentation."""
+    return RecordingInstrumentation()
+
+
+@pytest.fixture
+def config(config, instrumentation):
+    """Configuration reporting to the recording instrumentation."""
+    return dataclasses.replace(config, instrumentation=instrumentation, retry_policy=RetryPolicy(base_delay=0.01))
+
+
+async def test_native_login_is_traced(config, session_provider, instrumentation):
+    config = dataclasses.replace(config, discovery=True)
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as client:
+        await client.authenticate_with_password("alice", "secret")
+
+    # Discovery runs inside the span of the first request needing the endpoint URLs.
+    assert instrumentation.spans == [
+        "asgardeo.authorize",
+        "asgardeo.discovery",
+        "asgardeo.authn",
+        "asgardeo.token",
+    ]
+    assert instrumentation.requests == [("discovery", 200), ("authorize", 200), ("authn", 200), ("token", 200)]
+    assert instrumentation.counts == []
+
+
+async def test_retries_are_counted(config):
+    mock = MockAsgardeoServer(seed=1, profiles={"token": EndpointProfile(rate_limit_every=2, retry_after=0)})
+    instrumentation = config.instrumentation
+    async with AsgardeoTokenClient(config, session_provider=SessionProvider(transport=mock.transport())) as client:
+        await client.get_token("client_credentials", scope="first")
+        await client.get_token("client_credentials", scope="second")
+
+    assert instrumentation.requests == [("token", 200), ("token", 429), ("token", 200)]
+    assert instrumentation.counts == [(Metric.RETRIES, 1, {"endpoint": "token"})]
+
+
+async def test_errors_are_counted(config, session_provider, instrumentation):
+    config = dataclasses.replace(config, client_secret="wrong")
+    async with AsgardeoTokenClient(config, session_provider=session_provider) as client:
+        with pytest.raises(TokenError):
+            await client.get_token("client_credentials")
+
+    assert instrumentation.requests == [("token", 401)]
+    assert instrumentation.counts == [(Metric.ERRORS, 1, {"endpoint": "token", "error": "TokenError"})]
+
+
+async def test_cache_hits_and_misses_are_counted(config, session_provider, instrumentation):
+    async with AsgardeoTokenClient(config, session_provider=session_provider) as client:
+        token = await client.get_token("client_credentials")
+        for _ in range(3):
+            await client.introspect_token(token.access_token)
+
+    introspection = {"cache": "introspection"}
+    assert instrumentation.counts == [
+        (Metric.CACHE_MISSES, 1, introspection),
+        (Metric.CACHE_HITS, 1, introspection),
+        (Metric.CACHE_HITS, 1, introspection),
+    ]
+    assert instrumentation.requests.count(("introspect", 200)) == 1
+
+
+def test_default_instrumentation_discards_everything():
+    instrumentation = Instrumentation()
+    with instrumentation.span("asgardeo.token"):
+        instrumentation.record_request("token", 200, 0.1)
+        instrumentation.count(Metric.RETRIES)
+
+
+def test_opentelemetry_requires_the_api_package():
+    try:
+        import opentelemetry  # noqa: F401
+    except ImportError:
+        with pytest.raises(AsgardeoError):
+            OpenTelemetryInstrumentation()
+    else:
+        pytest.skip("opentelemetry-api is installed")
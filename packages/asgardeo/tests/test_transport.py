@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Tests of the shared HTTP sessions."""
+
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+
+from asgardeo import AsgardeoNativeAuthClient, SessionProvider
+from asgardeo.testing import MockAsgardeoServer
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_clients_share_one_session(config, session_provider):
+    async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as first:
+        async with AsgardeoNativeAuthClient(config, session_provider=session_provider) as second:
+            assert first.session is second.session
+        assert not first.session.is_closed
+    assert first.session.is_closed
+
+
+async def test_clients_do_not_share_cookies(config):
+    mock = MockAsgardeoServer()
+    sent_cookies = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("Cookie"))
+        response = await mock.handle(request)
+        if request.url.path.endswith("/oauth2/authn"):
+            response.headers["Set-Cookie"] = "commonAuthId=session-of-alice; Path=/; Secure; HttpOnly"
+        return response
+
+    provider = SessionProvider(transport=httpx.MockTransport(handler))
+    async with AsgardeoNativeAuthClient(config, session_provider=provider) as alice:
+        await alice.authenticate_with_password("alice", "secret")
+        async with AsgardeoNativeAuthClient(config, session_provider=provider) as bob:
+            assert bob.session is alice.session
+            await bob.authenticate_with_password("bob", "secret")
+
+    assert len(sent_cookies) == 6
+    assert sent_cookies == [None] * 6
+
+
+@pytest.mark.parametrize(("max_connections", "expected"), [(2, 6), (None, 20)])
+async def test_http2_stream_limit(config, max_connections, expected):
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    config = dataclasses.replace(
+        config,
+        http2=True,
+        http2_max_concurrent_streams=3,
+        max_connections=max_connections,
+    )
+    provider = SessionProvider(transport=httpx.MockTransport(handler))
+    session = provider.acquire(config)
+    try:
+        await asyncio.gather(*(session.get("https://localhost/t/mock/oauth2/jwks") for _ in range(20)))
+    finally:
+        await provider.release(session)
+    assert peak == expected
@@ -0,0 +1,71 @@
+"""
+Copyright (c) 2025, WSO2 LLC. (https://www.wso2.com).
+WSO2 LLC. licenses this file to you under the Apache License,
+Version 2.0 (the "License"); you may not use this file except
+in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied. See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+
+"""Local JWT validation against the mock tenant."""
+
+import dataclasses
+
+import pytest
+
+from asgardeo import (
+    AsgardeoTokenClient,
+    ClaimsCache,
+    GrantType,
+    SessionProvider,
+    TokenValidationError,
+    TokenValidator,
+)
+from asgardeo.testing import MockAsgardeoServer
+
+pytest.importorskip("cryptography")
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def signing_provider():
+    """Session provider of a mock tenant signing its tokens with RS256."""
+    return SessionProvider(transport=MockAsgardeoServer(sign_tokens=True, seed=1).transport())
+
+
+async def issue(config, provider) -> str:
+    async with AsgardeoTokenClient(config, session_provider=provider) as client:
+        token = await client.get_token(GrantType.CLIENT_CREDENTIALS, scope="openid")
+    return token.access_token
+
+
+async def test_validate_and_cache_claims(config, signing_provider):
+    access_token = await issue(config, signing_provider)
+    async with TokenValidator(config, session_provider=signing_provider) as validator:
+        claims = await validator.validate(access_token)
+        assert claims["iss"] == "https://localhost/t/mock/oauth2/token"
+        assert await validator.validate(access_token) == claims
+        assert validator.claims_cache.stats().hits == 1
+
+
+async def test_shared_claims_cache_is_not_shared_between_tenants(config, signing_provider):
+    other_tenant = dataclasses.replace(config, base_url="https://localhost/t/other")
+    access_token = await issue(config, signing_provider)
+    claims_cache = ClaimsCache()
+    async with TokenValidator(config, session_provider=signing_provider, claims_cache=claims_cache) as validator:
+        await validator.validate(access_token)
+    async with TokenValidator(
+        other_tenant,
+        session_provider=signing_provider,
+        claims_cache=claims_cache,
+    ) as validator:
+        with pytest.raises(TokenValidationError):
+            await validator.validate(access_token)